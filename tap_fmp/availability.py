@@ -0,0 +1,152 @@
+"""Availability-driven partition pruning.
+
+`earnings_transcripts` requests every symbol × year × quarter, and most of
+those combinations have no transcript, while one
+``/stable/earning-call-transcript-dates`` request per symbol lists exactly
+the ones that exist. A stream that declares an `AvailabilityRoute` asks its
+companion stream once per symbol, keeps the answer in the `LocalStore` for
+``other_params.availability_ttl_hours`` (default 24), and skips partitions
+the answer doesn't list without requesting them.
+
+Pruning is conservative: partitions the route can't map to a key are always
+fetched, and a symbol whose companion request fails is fetched in full (and
+asked again next time). ``other_params.availability_pruning: false`` turns
+it off.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import requests
+from singer_sdk.helpers.types import Context
+
+from tap_fmp.helpers import safe_int
+from tap_fmp.local_store import LocalStore
+
+DEFAULT_TTL_HOURS = 24.0
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS partition_availability (
+    stream TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    available TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (stream, symbol)
+);
+"""
+
+
+@dataclass(frozen=True)
+class AvailabilityRoute:
+    """Which partitions of a per-symbol stream exist, per a companion stream.
+
+    Parameters
+    ----------
+    companion_stream : type
+        Per-symbol stream listing what exists for a symbol (instantiated via
+        `Tap.get_bulk_stream`, one request per symbol).
+    row_key : callable
+        ``(companion_row) -> tuple | None``: the partition key a companion
+        row vouches for.
+    context_key : callable
+        ``(context) -> tuple | None``: the key of a partition, or None when
+        the companion can't tell (always fetched).
+    """
+
+    companion_stream: type
+    row_key: t.Callable[[dict], tuple | None]
+    context_key: t.Callable[[Context], tuple | None]
+
+
+class AvailabilityIndex:
+    """Available partition keys per symbol for one stream, backed by the
+    store and refreshed after `ttl_hours`."""
+
+    def __init__(
+        self,
+        store: LocalStore,
+        stream_name: str,
+        route: AvailabilityRoute,
+        fetch: t.Callable[[str], list[dict]],
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+    ) -> None:
+        self._store = store
+        self._stream = stream_name
+        self._route = route
+        self._fetch = fetch
+        self._ttl = timedelta(hours=ttl_hours)
+        self._known: dict[str, set[tuple] | None] = {}
+        self._lock = threading.Lock()
+        store.ensure_table("partition_availability", _DDL)
+
+    def available(self, symbol: str) -> set[tuple] | None:
+        """Keys that exist for `symbol`; None when unknown."""
+        with self._lock:
+            if symbol in self._known:
+                return self._known[symbol]
+        keys = self._load(symbol)
+        if keys is None:
+            try:
+                rows = self._fetch(symbol)
+            except requests.exceptions.RequestException:
+                return None  # not cached: fetch the partitions, ask again later
+            keys = {k for k in map(self._route.row_key, rows) if k is not None}
+            self._store.execute(
+                "INSERT OR REPLACE INTO partition_availability "
+                "(stream, symbol, available, fetched_at) VALUES (?, ?, ?, ?)",
+                (
+                    self._stream,
+                    symbol,
+                    json.dumps(sorted(keys, key=str)),
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                ),
+            )
+        with self._lock:
+            self._known[symbol] = keys
+        return keys
+
+    def _load(self, symbol: str) -> set[tuple] | None:
+        rows = self._store.query(
+            "SELECT available, fetched_at FROM partition_availability "
+            "WHERE stream = ? AND symbol = ?",
+            (self._stream, symbol),
+        )
+        if not rows:
+            return None
+        available, fetched_at = rows[0]
+        if datetime.now(timezone.utc) - datetime.fromisoformat(fetched_at) > self._ttl:
+            return None
+        return {tuple(key) for key in json.loads(available)}
+
+
+def fiscal_year_quarter(row: dict) -> tuple | None:
+    """Transcript-dates row → ``(fiscal_year, quarter)``."""
+    year, quarter = safe_int(row.get("fiscal_year")), safe_int(row.get("quarter"))
+    return None if year is None or quarter is None else (year, quarter)
+
+
+def year_quarter_context(context: Context) -> tuple | None:
+    year, quarter = safe_int(context.get("year")), safe_int(context.get("quarter"))
+    return None if year is None or quarter is None else (year, quarter)
+
+
+# Periods listed by /stable/financial-reports-dates.
+REPORT_PERIODS = ("Q1", "Q2", "Q3", "Q4", "FY")
+
+
+def report_period_year(row: dict) -> tuple | None:
+    """Report-dates row → ``(period, fiscal_year)``."""
+    year = safe_int(row.get("fiscal_year"))
+    period = row.get("period")
+    return None if year is None or period not in REPORT_PERIODS else (period, year)
+
+
+def period_year_context(context: Context) -> tuple | None:
+    year = safe_int(context.get("year"))
+    period = context.get("period")
+    return None if year is None or period not in REPORT_PERIODS else (period, year)
@@ -0,0 +1,419 @@
+"""Cost-based planner that serves per-symbol streams from bulk endpoints.
+
+Streams such as `dcf_valuation` or `income_statement` make one request per
+symbol, while FMP publishes the same rows for the whole market in a single
+bulk CSV. A per-symbol stream that declares a `BulkRoute` is planned once per
+run: the planner compares the request count of the per-symbol path for the
+selected universe and date range against the (weighted) request count of the
+bulk path, and when bulk is cheaper it downloads the bulk cells once and fans
+the rows out to the per-symbol partitions.
+
+Bulk rows are coerced to the per-symbol schema's JSON types and then run
+through the per-symbol stream's own `post_process`, so schema and primary
+keys match the per-symbol path. Routes whose bulk rows can't reproduce the
+per-symbol rows exactly (missing fields, different price adjustment, or
+surrogate keys hashed over JSON fields the schema doesn't declare) are only
+used when explicitly requested with ``other_params.source: bulk``.
+
+Downloaded rows of the selected universe are spooled to a temporary sqlite
+file cell by cell and read back per partition, so memory holds the cells in
+flight rather than the whole market's history.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import tempfile
+import threading
+import typing as t
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+import requests
+from singer_sdk.exceptions import ConfigValidationError
+from singer_sdk.helpers.types import Context
+
+from tap_fmp.concurrency import ordered_map
+from tap_fmp.local_store import LocalStore
+
+SOURCE_AUTO = "auto"
+SOURCE_BULK = "bulk"
+SOURCE_PER_SYMBOL = "per_symbol"
+SOURCES = (SOURCE_AUTO, SOURCE_BULK, SOURCE_PER_SYMBOL)
+
+# One bulk request downloads the whole market (MBs of CSV), so it is worth
+# this many per-symbol requests. Overridable via `other_params.bulk_request_weight`.
+DEFAULT_BULK_REQUEST_WEIGHT = 50.0
+
+# Bulk endpoints are plan-gated; these statuses mean "not entitled", so
+# `source: auto` falls back to the per-symbol path instead of failing.
+_NOT_ENTITLED_STATUSES = frozenset({401, 402, 403})
+
+_INTEGER_RE = re.compile(r"^[+-]?\d+$")
+
+
+@dataclass(frozen=True)
+class BulkRoute:
+    """How a per-symbol stream can be served from a bulk stream.
+
+    Parameters
+    ----------
+    bulk_stream : type
+        Bulk stream class whose endpoint, CSV parsing and retry settings are
+        used for the download (instantiated via `Tap.get_bulk_stream`).
+    rename : dict[str, str]
+        Bulk field → per-symbol field.
+    exact : bool
+        True when bulk rows reproduce the per-symbol rows field for field.
+        Inexact routes are never chosen by ``source: auto``.
+    request_weight : float
+        Cost of one bulk request in per-symbol requests.
+    cells : callable, optional
+        ``(stream, partitions) -> list[dict]`` query params of each bulk
+        request. Defaults to a single request without extra params.
+    per_symbol_requests : callable, optional
+        ``(stream, partitions) -> int`` requests the per-symbol path would
+        make. Defaults to one per partition.
+    select : callable, optional
+        ``(stream, context, rows) -> list[dict]`` narrows a symbol's bulk rows
+        to what the per-symbol request for `context` returns (period, date
+        window, limit).
+    """
+
+    bulk_stream: type
+    rename: dict[str, str] = field(default_factory=dict)
+    exact: bool = True
+    request_weight: float = DEFAULT_BULK_REQUEST_WEIGHT
+    cells: t.Callable[[t.Any, list[dict]], list[dict]] | None = None
+    per_symbol_requests: t.Callable[[t.Any, list[dict]], int] | None = None
+    select: t.Callable[[t.Any, Context, list[dict]], list[dict]] | None = None
+
+
+class RowSpool:
+    """Bulk rows by symbol in a temporary sqlite file, removed by `close`
+    (or when the spool is garbage collected)."""
+
+    def __init__(self) -> None:
+        directory = tempfile.mkdtemp(prefix="tap-fmp-bulk-")
+        self._store = LocalStore(f"{directory}/rows.sqlite3")
+        self._store.ensure_table(
+            "bulk_rows",
+            """
+            CREATE TABLE IF NOT EXISTS bulk_rows (symbol TEXT NOT NULL, row TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS bulk_rows_symbol ON bulk_rows (symbol);
+            """,
+        )
+        self._cleanup = weakref.finalize(self, _remove_spool, self._store, directory)
+
+    def add(self, rows: t.Iterable[dict]) -> None:
+        self._store.executemany(
+            "INSERT INTO bulk_rows (symbol, row) VALUES (?, ?)",
+            ((row["symbol"], json.dumps(row)) for row in rows),
+        )
+
+    def get(self, symbol: str, remove: bool = False) -> list[dict]:
+        """`symbol`'s rows in download order, deleting them if `remove`."""
+        with self._store.transaction() as conn:
+            rows = conn.execute(
+                "SELECT row FROM bulk_rows WHERE symbol = ? ORDER BY rowid",
+                (symbol,),
+            ).fetchall()
+            if remove:
+                conn.execute("DELETE FROM bulk_rows WHERE symbol = ?", (symbol,))
+        return [json.loads(row) for (row,) in rows]
+
+    def __len__(self) -> int:
+        return self._store.query("SELECT COUNT(*) FROM bulk_rows")[0][0]
+
+    @property
+    def closed(self) -> bool:
+        return not self._cleanup.alive
+
+    def close(self) -> None:
+        self._cleanup()
+
+
+def _remove_spool(store: LocalStore, directory: str) -> None:
+    store.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@dataclass
+class BulkPlan:
+    source: str
+    per_symbol_cost: float = 0.0
+    bulk_cost: float = 0.0
+    rows: RowSpool | None = None
+    # Partitions per symbol not served yet: symbol × period streams read a
+    # symbol's rows once per period, so they are released after the last one.
+    pending: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def take(self, symbol: str) -> list[dict]:
+        """Bulk rows of `symbol` for one of its partitions. The spool is
+        removed once every partition has been served."""
+        with self._lock:
+            self.pending[symbol] -= 1
+            last = self.pending[symbol] <= 0
+            if last:
+                del self.pending[symbol]
+            if self.rows.closed:
+                return []
+            rows = self.rows.get(symbol, remove=last)
+            if not self.pending:
+                self.rows.close()
+            return rows
+
+
+def _schema_type(prop: dict) -> tuple[str | None, str | None]:
+    types = prop.get("type", [])
+    if isinstance(types, str):
+        types = [types]
+    non_null = [x for x in types if x != "null"]
+    return (non_null[0] if non_null else None), prop.get("format")
+
+
+def _parse_number(value: str) -> int | float:
+    """Parse a CSV number the way `json.loads` would parse the same literal,
+    so `str()` of the result (and therefore surrogate keys) matches the
+    per-symbol JSON endpoint."""
+    if _INTEGER_RE.match(value):
+        return int(value)
+    return float(value)
+
+
+def coerce_value(value: t.Any, prop: dict) -> t.Any:
+    if not isinstance(value, str):
+        return value
+    json_type, _ = _schema_type(prop)
+    if json_type == "string" or json_type is None:
+        return value
+    if value.strip() == "" or value.lower() in ("null", "none", "nan"):
+        return None
+    try:
+        if json_type == "integer":
+            number = _parse_number(value)
+            return int(number) if float(number).is_integer() else number
+        if json_type == "number":
+            return _parse_number(value)
+        if json_type == "boolean":
+            return value.strip().lower() in ("true", "1")
+    except ValueError:
+        return value
+    return value
+
+
+def coerce_to_schema(
+    row: dict, schema: dict, rename: dict[str, str] | None = None
+) -> dict:
+    """Rename bulk fields, drop fields the per-symbol schema doesn't declare
+    and convert CSV strings to the schema's JSON types."""
+    properties = schema.get("properties", {})
+    record = {}
+    for key, value in row.items():
+        key = (rename or {}).get(key, key)
+        if key in properties:
+            record[key] = coerce_value(value, properties[key])
+    return record
+
+
+def _get_source(stream) -> str:
+    source = stream.other_params.get("source", SOURCE_AUTO)
+    if source not in SOURCES:
+        raise ConfigValidationError(
+            f"Stream {stream.name}: other_params.source must be one of "
+            f"{list(SOURCES)}, got {source!r}."
+        )
+    return source
+
+
+def plan(stream) -> BulkPlan:
+    """Decide how `stream` is served this run and, for bulk, download and
+    index the rows of the selected universe by symbol."""
+    route: BulkRoute | None = stream._bulk_route
+    source = _get_source(stream)
+    if route is None or source == SOURCE_PER_SYMBOL:
+        return BulkPlan(SOURCE_PER_SYMBOL)
+
+    partitions = stream.partitions or []
+    cells = route.cells(stream, partitions) if route.cells else [{}]
+    per_symbol_cost = float(
+        route.per_symbol_requests(stream, partitions)
+        if route.per_symbol_requests
+        else len(partitions)
+    )
+    weight = float(stream.other_params.get("bulk_request_weight", route.request_weight))
+    bulk_cost = len(cells) * weight
+    result = BulkPlan(SOURCE_PER_SYMBOL, per_symbol_cost, bulk_cost)
+
+    if source == SOURCE_AUTO:
+        if not route.exact:
+            stream.logger.info(
+                f"Stream {stream.name}: bulk route is not field-for-field "
+                f"identical; set other_params.source: bulk to use it."
+            )
+            return result
+        if not cells or bulk_cost >= per_symbol_cost:
+            stream.logger.info(
+                f"Stream {stream.name}: serving per-symbol "
+                f"(per-symbol cost {per_symbol_cost:g} <= bulk cost {bulk_cost:g})."
+            )
+            return result
+
+    stream.logger.info(
+        f"Stream {stream.name}: serving from {route.bulk_stream.__name__} "
+        f"({len(cells)} bulk requests, cost {bulk_cost:g} vs per-symbol "
+        f"cost {per_symbol_cost:g}, source={source})."
+    )
+    symbols = {p["symbol"] for p in partitions if p.get("symbol")}
+    try:
+        rows = _download(stream, route, cells, symbols)
+    except requests.exceptions.HTTPError as e:
+        status = getattr(e.response, "status_code", None)
+        if source == SOURCE_AUTO and status in _NOT_ENTITLED_STATUSES:
+            stream.logger.warning(
+                f"Stream {stream.name}: bulk endpoint rejected the request "
+                f"({status}); falling back to per-symbol requests."
+            )
+            return result
+        raise
+
+    result.source = SOURCE_BULK
+    result.rows = rows
+    result.pending = Counter(p["symbol"] for p in partitions if p.get("symbol"))
+    return result
+
+
+def _download(
+    stream, route: BulkRoute, cells: list[dict], symbols: set[str]
+) -> RowSpool:
+    """Download `cells` and spool the rows of `symbols`, one cell at a time."""
+    bulk_stream = stream._tap.get_bulk_stream(route.bulk_stream)
+    url = bulk_stream.get_url(None)
+    apikey = bulk_stream.query_params.get("apikey")
+    max_workers = int(stream.other_params.get("max_workers", 3))
+
+    spool = RowSpool()
+    try:
+        for result in ordered_map(
+            lambda cell: bulk_stream._fetch_with_retry(url, {"apikey": apikey, **cell}),
+            cells,
+            max_workers=max_workers,
+            max_in_flight=max_workers,
+            thread_name_prefix=f"{stream.name}-bulk",
+        ):
+            if result.error is not None:
+                raise result.error
+            spool.add(
+                row for row in result.result or [] if row.get("symbol") in symbols
+            )
+    except BaseException:
+        spool.close()
+        raise
+    return spool
+
+
+def rows_for_partition(
+    stream, route: BulkRoute, context: Context, rows: list[dict]
+) -> list[dict]:
+    """Schema-coerced bulk rows for one per-symbol partition, ready for the
+    stream's `post_process`."""
+    records = [coerce_to_schema(row, stream.schema, route.rename) for row in rows]
+    if route.select:
+        records = route.select(stream, context, records)
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Route helpers: financial statements (income-statement-bulk, year × period)
+# ---------------------------------------------------------------------------
+
+_STATEMENT_PERIODS = {
+    "annual": ("FY",),
+    "fy": ("FY",),
+    "quarter": ("Q1", "Q2", "Q3", "Q4"),
+    "q1": ("Q1",),
+    "q2": ("Q2",),
+    "q3": ("Q3",),
+    "q4": ("Q4",),
+}
+
+
+def _statement_periods(stream, context: Context | None) -> tuple[str, ...]:
+    """Bulk periods matching the per-symbol request of `context`: the
+    partition's `period` wins over the stream's `period` query param."""
+    period = (
+        (context or {}).get("period") or stream.query_params.get("period") or "annual"
+    )
+    periods = _STATEMENT_PERIODS.get(str(period).lower())
+    if periods is None:
+        raise ConfigValidationError(
+            f"Stream {stream.name}: period {period!r} has no bulk equivalent."
+        )
+    return periods
+
+
+def statement_cells(stream, partitions: list[dict]) -> list[dict]:
+    """One bulk request per (year, period) over the periods of all
+    partitions. Years span `other_params.bulk_start_year` (default 1990, the
+    bulk statements' earliest year) through the current year."""
+    start_year = int(stream.other_params.get("bulk_start_year", 1990))
+    periods = sorted({p for c in partitions for p in _statement_periods(stream, c)})
+    return [
+        {"year": year, "period": period}
+        for year in range(start_year, datetime.today().year + 1)
+        for period in periods
+    ]
+
+
+def select_statement_rows(stream, context: Context, records: list[dict]) -> list[dict]:
+    """Per-symbol statements come back newest first and capped by `limit`."""
+    periods = set(_statement_periods(stream, context))
+    records = [r for r in records if r.get("period") in periods]
+    records.sort(key=lambda r: str(r.get("date") or ""), reverse=True)
+    limit = stream.query_params.get("limit")
+    return records[: int(limit)] if limit else records
+
+
+# ---------------------------------------------------------------------------
+# Route helpers: daily charts (eod-bulk, one request per date)
+# ---------------------------------------------------------------------------
+
+
+def _partition_window(stream, context: Context) -> tuple[str, str] | None:
+    slices = stream.create_time_slice_chunks(context)
+    return (slices[0][0], slices[-1][1]) if slices else None
+
+
+def eod_date_cells(stream, partitions: list[dict]) -> list[dict]:
+    """One eod-bulk request per (trading) day between the earliest partition
+    start and the latest partition end."""
+    windows = [w for p in partitions if (w := _partition_window(stream, p))]
+    if not windows:
+        return []
+    start = date.fromisoformat(min(w[0] for w in windows))
+    end = date.fromisoformat(max(w[1] for w in windows))
+    calendar = stream._get_trading_calendar()
+    if calendar is not None:
+        days = calendar.trading_days(start, end)
+    else:
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    return [{"date": d.isoformat()} for d in days]
+
+
+def time_slice_requests(stream, partitions: list[dict]) -> int:
+    return sum(len(stream.create_time_slice_chunks(p)) for p in partitions)
+
+
+def select_window_rows(stream, context: Context, records: list[dict]) -> list[dict]:
+    """Keep the rows inside the partition's (inclusive) time-slice window."""
+    window = _partition_window(stream, context)
+    if window is None:
+        return []
+    records = [r for r in records if window[0] <= str(r.get("date")) <= window[1]]
+    records.sort(key=lambda r: str(r.get("date")))
+    return records
@@ -0,0 +1,149 @@
+"""Change-data-capture for full-refresh snapshot streams.
+
+Snapshot streams (company profiles, TTM bulk metrics, executives, ETF
+holdings, ...) re-emit the whole universe on every run although most rows
+are unchanged. With ``other_params.change_data_capture: true`` each record's
+content hash is kept in the `LocalStore`, keyed by stream and primary key,
+and only new or changed records are emitted. With ``cdc_tombstones: true``
+(FULL_TABLE streams only) a partition that completes also emits a tombstone —
+the key fields plus ``_sdc_deleted_at`` — for every previously seen key it no
+longer returned.
+
+Hashes are committed only after a partition has been fully emitted, so a
+failed run re-emits (never skips) the rows it didn't finish. Deleting the
+store re-emits everything on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import typing as t
+from datetime import datetime, timezone
+
+from tap_fmp.local_store import LocalStore
+
+DELETED_AT_FIELD = "_sdc_deleted_at"
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS cdc_rows (
+    stream TEXT NOT NULL,
+    partition_key TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    tombstone TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (stream, partition_key, row_key)
+);
+"""
+
+
+def content_hash(record: dict, ignore_fields: t.Collection[str] = ()) -> str:
+    payload = {k: v for k, v in record.items() if k not in ignore_fields}
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+def partition_key(context: dict | None) -> str:
+    return json.dumps(context or {}, sort_keys=True, default=str)
+
+
+class ChangeCapture:
+    """Change detection for one partition of one stream.
+
+    Parameters
+    ----------
+    store : LocalStore
+    stream_name : str
+    context : dict | None
+        Partition context; tombstones are scoped to it, so a symbol dropped
+        from the universe is left alone rather than deleted.
+    key_fields : Sequence[str]
+        Fields identifying a row (stream primary keys by default).
+    tombstone_fields : Sequence[str]
+        Fields copied into tombstones (key fields + required fields).
+    ignore_fields : Collection[str]
+        Fields excluded from the content hash (e.g. a live `price`).
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        stream_name: str,
+        context: dict | None,
+        key_fields: t.Sequence[str],
+        tombstone_fields: t.Sequence[str] = (),
+        ignore_fields: t.Collection[str] = (),
+    ) -> None:
+        self._store = store
+        self._stream = stream_name
+        self._partition = partition_key(context)
+        self._key_fields = list(key_fields)
+        self._tombstone_fields = list(dict.fromkeys([*key_fields, *tombstone_fields]))
+        self._ignore_fields = frozenset(ignore_fields)
+        self._seen: set[str] = set()
+        self._changed: dict[str, tuple[str, str]] = {}
+        store.ensure_table("cdc_rows", _DDL)
+        self._known: dict[str, str] = dict(
+            store.query(
+                "SELECT row_key, content_hash FROM cdc_rows "
+                "WHERE stream = ? AND partition_key = ?",
+                (self._stream, self._partition),
+            )
+        )
+        self.unchanged = 0
+
+    def _row_key(self, record: dict) -> str:
+        return json.dumps([record.get(f) for f in self._key_fields], default=str)
+
+    def is_changed(self, record: dict) -> bool:
+        """Register `record` as seen this run; True when it must be emitted."""
+        row_key = self._row_key(record)
+        digest = content_hash(record, self._ignore_fields)
+        self._seen.add(row_key)
+        if self._known.get(row_key) == digest:
+            self.unchanged += 1
+            return False
+        tombstone = {f: record.get(f) for f in self._tombstone_fields}
+        self._changed[row_key] = (json.dumps(tombstone, default=str), digest)
+        return True
+
+    def tombstones(self) -> list[dict]:
+        """Tombstones for keys known from earlier runs but absent this run."""
+        vanished = [k for k in self._known if k not in self._seen]
+        if not vanished:
+            return []
+        deleted_at = datetime.now(timezone.utc).isoformat()
+        rows = dict(
+            self._store.query(
+                "SELECT row_key, tombstone FROM cdc_rows "
+                "WHERE stream = ? AND partition_key = ?",
+                (self._stream, self._partition),
+            )
+        )
+        return [
+            {**json.loads(rows[k]), DELETED_AT_FIELD: deleted_at}
+            for k in vanished
+            if k in rows
+        ]
+
+    def commit(self, forget_vanished: bool) -> None:
+        """Persist hashes of emitted rows; drop vanished keys when their
+        tombstones were emitted."""
+        vanished = (
+            [k for k in self._known if k not in self._seen] if forget_vanished else []
+        )
+        with self._store.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cdc_rows "
+                "(stream, partition_key, row_key, tombstone, content_hash) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self._stream, self._partition, k, tombstone, digest)
+                    for k, (tombstone, digest) in self._changed.items()
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM cdc_rows "
+                "WHERE stream = ? AND partition_key = ? AND row_key = ?",
+                [(self._stream, self._partition, k) for k in vanished],
+            )
@@ -2,12 +2,45 @@
 
 from abc import ABC
 import backoff
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import re
 from singer_sdk.helpers.types import Context
 from singer_sdk.streams import RESTStream
 from singer_sdk import Tap
+from tap_fmp.availability import (
+    DEFAULT_TTL_HOURS,
+    AvailabilityIndex,
+    AvailabilityRoute,
+)
+from tap_fmp.bulk_planner import (
+    SOURCE_BULK,
+    BulkRoute,
+    plan as plan_bulk_source,
+    rows_for_partition,
+)
+from tap_fmp.change_capture import DELETED_AT_FIELD, ChangeCapture, partition_key
+from tap_fmp.concurrency import ordered_map, prefetch_iterables
+from tap_fmp.feed_routing import FeedRoute, FeedSnapshot, read_feed
 from tap_fmp.helpers import clean_json_keys, generate_surrogate_key
+from tap_fmp.invalidation import DEFAULT_LOOKBACK_DAYS, EventIndex, InvalidationFeed
+from tap_fmp.listing_dates import get_first_data_year, set_first_data_year
+from tap_fmp.negative_cache import (
+    DEFAULT_RECHECK_RATE,
+    DEFAULT_TTL_DAYS,
+    NegativeCache,
+)
+from tap_fmp.partition_costs import CostMeter, PartitionCosts
+from tap_fmp.partition_grid import PartitionGrid
+from tap_fmp.refresh_cadence import (
+    PARTITION_REFRESHED_AT_KEY,
+    REFRESHED_AT_KEY,
+    is_fresh,
+    parse_interval,
+)
+from tap_fmp.sharding import resolve_shard, shard_partitions
+from tap_fmp.shutdown import ShutdownRequested
+from tap_fmp.trading_calendar import TradingCalendar
+from tap_fmp.window_ledger import WindowLedger
 from tap_fmp.mixins import (
     BaseSymbolPartitionMixin,
     CompanySymbolPartitionMixin,
@@ -20,7 +53,9 @@ import threading
 import time
 import random
 import csv
+import hashlib
 import io
+import json
 from functools import cached_property
 
 # Tokens matched by the Dagster sensor wired to ERROR-level log lines.
@@ -28,6 +63,40 @@ from functools import cached_property
 SCHEMA_DRIFT_TOKEN = "*** SCHEMA_DRIFT ***"
 DATA_TRUNCATED_TOKEN = "*** DATA_TRUNCATED ***"
 
+
+def _record_day(record: dict, field: str) -> str:
+    """`YYYY-MM-DD` prefix of a record's date/datetime field ("" if absent)."""
+    value = record.get(field) if isinstance(record, dict) else None
+    return str(value)[:10] if value else ""
+
+
+def _record_identity(record: dict) -> str:
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def _timestamp_key(value: t.Any) -> str:
+    """Comparable `YYYY-MM-DD HH:MM:SS` prefix of a date/datetime value."""
+    return str(value or "")[:19].replace("T", " ")
+
+
+class _PageScan:
+    """Running summary of a paginated window: enough for the truncation
+    checks without keeping its records."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.first: dict | None = None
+        self.last: dict | None = None
+        self.hit_page_ceiling = False
+        self.stopped_at_bookmark = False
+
+    def add(self, page_records: list[dict]) -> None:
+        if self.first is None:
+            self.first = page_records[0]
+        self.last = page_records[-1]
+        self.count += len(page_records)
+
+
 # Process-global dedup for schema-drift alerts. Keyed by (stream_name,
 # frozenset(missing_fields)) so each unique drift fires exactly one ERROR log
 # per process. Without this, a drifted field would log millions of duplicate
@@ -51,6 +120,52 @@ class FmpRestStream(RESTStream, ABC):
     _replication_key_starting_name = "from"
     _replication_key_ending_name = "to"
     _expect_csv = False
+    # Exchanges whose union trading calendar gates date fan-out and sizes
+    # time-slice windows in sessions. Empty = plain calendar days.
+    # Overridable via `other_params.trading_calendar_exchanges` (`[]` disables).
+    _trading_calendar_exchanges: tuple[str, ...] = ()
+    # Bulk endpoint that can serve this per-symbol stream (see `bulk_planner`).
+    # `other_params.source`: auto (default) | bulk | per_symbol.
+    _bulk_route: BulkRoute | None = None
+    _bulk_plan_lock = threading.Lock()
+    # Clamp cold per-symbol backfills to the symbol's listing date (see
+    # `listing_dates`). Only equity price and fundamentals streams opt in: COT
+    # codes and forex/crypto/index symbols have no equity listing, and SEC
+    # filings predate the IPO. `other_params.listing_date_bounds` overrides.
+    _listing_date_bounded = False
+    # Companion stream listing which partitions exist (see `availability`).
+    _availability_route: AvailabilityRoute | None = None
+    _availability_lock = threading.Lock()
+    # Skip partitions that recently came back empty (`other_params.negative_cache`,
+    # see `negative_cache`). On for endpoints that are `[]` for most symbols.
+    _default_negative_cache: bool = False
+    _negative_cache_lock = threading.Lock()
+    # Refresh cadence (`other_params.refresh_every`, e.g. "30d"): skip
+    # partitions fetched within the interval (see `refresh_cadence`).
+    _refresh_lock = threading.Lock()
+    # Global feeds whose events mark a symbol's partitions stale
+    # (`other_params.event_invalidation`, see `invalidation`).
+    _invalidation_feeds: tuple[InvalidationFeed, ...] = ()
+    _invalidation_lock = threading.Lock()
+    # Global newest-first feed serving new rows of this per-symbol stream
+    # (`other_params.feed_incremental`, see `feed_routing`).
+    _feed_route: FeedRoute | None = None
+    _feed_lock = threading.Lock()
+    # Bookmark cut-off (`other_params.bookmark_cutoff`) for newest-first
+    # paginated feeds: drop records older than the bookmark and stop paging
+    # once a page reaches it, plus `other_params.bookmark_overlap_pages`
+    # (default 1) extra pages, as feeds are not always strictly ordered.
+    # `_bookmark_cutoff_field` names the raw field compared while paging
+    # (default: the replication key).
+    _default_bookmark_cutoff: bool = False
+    _bookmark_cutoff_field: str | None = None
+    # Partition look-ahead (`other_params.partition_workers`): request the
+    # next partitions while the current one is emitted. Off for streams whose
+    # `_fetch_records` writes state mid-partition, which must happen in order.
+    _partition_workers_safe = True
+    _default_partition_workers: int = 1
+    # Cost-aware partition order (`cost_scheduling`, see `partition_costs`).
+    _partition_costs_lock = threading.Lock()
 
     def __init__(self, tap: Tap) -> None:
         super().__init__(tap)
@@ -60,6 +175,35 @@ class FmpRestStream(RESTStream, ABC):
         self._throttle_lock = threading.Lock()
         self._last_call_ts = 0.0
 
+        if self.other_params.get("cdc_tombstones"):
+            self.schema = {
+                **self.schema,
+                "properties": {
+                    **self.schema["properties"],
+                    DELETED_AT_FIELD: {
+                        "type": ["string", "null"],
+                        "format": "date-time",
+                    },
+                },
+            }
+
+    @property
+    def query_params(self) -> dict:
+        """Request params. Inside a partition look-ahead worker each
+        partition gets its own copy, so `_fetch_records` variants that update
+        them in place don't leak into partitions running alongside."""
+        scoped = self.__dict__.get("_partition_scope")
+        params = getattr(scoped, "query_params", None)
+        return self.__dict__["_query_params"] if params is None else params
+
+    @query_params.setter
+    def query_params(self, value: dict) -> None:
+        scoped = self.__dict__.get("_partition_scope")
+        if getattr(scoped, "query_params", None) is not None:
+            scoped.query_params = value
+        else:
+            self.__dict__["_query_params"] = value
+
     @property
     def stream_config(self) -> dict:
         """Get configuration for this specific stream."""
@@ -197,6 +341,645 @@ class FmpRestStream(RESTStream, ABC):
         # Use stream config first, then global fallback
         return stream_start or global_start
 
+    def _get_trading_calendar(self) -> TradingCalendar | None:
+        exchanges = self.other_params.get(
+            "trading_calendar_exchanges", self._trading_calendar_exchanges
+        )
+        tap = getattr(self, "_tap", None)
+        if not exchanges or tap is None:
+            return None
+        if isinstance(exchanges, str):
+            exchanges = [exchanges]
+        return tap.get_trading_calendar(exchanges)
+
+    def _listing_lower_bound(
+        self, context: Context | None, probe: bool = False
+    ) -> date | None:
+        """Earliest date worth requesting for a per-symbol partition: the
+        symbol's listing date minus `other_params.listing_date_margin_days`
+        (default 30, for when-issued trading and vendor backfills). None when
+        the partition has no symbol, the date is unknown, or the stream is not
+        bounded (`_listing_date_bounded`, `other_params.listing_date_bounds`)."""
+        tap = getattr(self, "_tap", None)
+        if (
+            tap is None
+            or not context
+            or not context.get("symbol")
+            or not self.other_params.get(
+                "listing_date_bounds", self._listing_date_bounded
+            )
+        ):
+            return None
+        listing = tap.get_listing_date(context["symbol"], probe=probe)
+        if listing is None:
+            return None
+        margin = int(self.other_params.get("listing_date_margin_days", 30))
+        return listing - timedelta(days=margin)
+
+    def _shard_partitions(self, partitions: t.Sequence[dict]) -> t.Sequence[dict]:
+        """This node's share of symbol/CIK partitions when `shard_index` /
+        `shard_count` are set (tap config, or per stream in `other_params`).
+        See `tap_fmp.sharding`."""
+        shard = resolve_shard(
+            self.other_params.get("shard_index", self.config.get("shard_index")),
+            self.other_params.get("shard_count", self.config.get("shard_count")),
+            self.name,
+        )
+        if shard is None:
+            return partitions
+        return shard_partitions(partitions, *shard)
+
+    def _plan_partitions(self, partitions: t.Sequence[dict]) -> t.Sequence[dict]:
+        """The partitions this node runs, in the order to run them: this
+        node's shard (`tap_fmp.sharding`), longest first when
+        `cost_scheduling` is on (`tap_fmp.partition_costs`)."""
+        partitions = self._shard_partitions(partitions)
+        costs = self._partition_costs()
+        if costs is None:
+            return partitions
+        return costs.schedule(partitions, self._priority_symbols())
+
+    def _partition_costs(self) -> PartitionCosts | None:
+        """Cost history for `cost_scheduling`, loaded once per run."""
+        tap = getattr(self, "_tap", None)
+        if tap is None or not self.other_params.get(
+            "cost_scheduling", self.config.get("cost_scheduling", False)
+        ):
+            return None
+        if "_partition_cost_history" not in self.__dict__:
+            with self._partition_costs_lock:
+                if "_partition_cost_history" not in self.__dict__:
+                    self._partition_cost_history = PartitionCosts(
+                        tap.get_local_store(), self.name
+                    )
+        return self._partition_cost_history
+
+    def _priority_symbols(self) -> set[str]:
+        """`priority_symbols` plus the `priority_top_market_cap` largest
+        companies (tap config, or per stream in `other_params`)."""
+        if "_priority_symbol_set" in self.__dict__:
+            return self._priority_symbol_set
+        symbols = self.other_params.get(
+            "priority_symbols", self.config.get("priority_symbols")
+        )
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        priority = set(symbols or [])
+        top = self.other_params.get(
+            "priority_top_market_cap", self.config.get("priority_top_market_cap")
+        )
+        if top:
+            priority |= self._tap.get_top_market_cap_symbols(int(top))
+        self._priority_symbol_set = priority
+        return priority
+
+    def _cost_meter(self) -> CostMeter | None:
+        """Meter of the partition whose requests run on this thread."""
+        scoped = self.__dict__.get("_partition_scope")
+        meter = getattr(scoped, "cost_meter", None)
+        return self.__dict__.get("_stream_cost_meter") if meter is None else meter
+
+    def _metered_records(self, context: Context | None) -> t.Iterable[dict]:
+        """The stream's own `_fetch_records`, recording the partition's cost
+        when it completes. Look-ahead workers meter on their own thread;
+        otherwise the meter is stream-wide, so requests made on window
+        pool threads are counted too."""
+        costs = self._partition_costs()
+        if costs is None:
+            yield from self._fetch_records(context)
+            return
+        meter = CostMeter()
+        scoped = self.__dict__.get("_partition_scope")
+        in_worker = getattr(scoped, "query_params", None) is not None
+        if in_worker:
+            scoped.cost_meter = meter
+        else:
+            self.__dict__["_stream_cost_meter"] = meter
+        try:
+            yield from self._fetch_records(context)
+        finally:
+            if in_worker:
+                scoped.cost_meter = None
+            else:
+                self.__dict__.pop("_stream_cost_meter", None)
+        costs.record(context, meter)
+
+    def _checkpoint_state(self) -> None:
+        """Flush a STATE message mid-partition so custom progress keys
+        (completed cells, quarantines, ...) survive a crash. The SDK drops
+        in-flight progress markers on resume, so only keys this tap reads
+        back itself carry over; the committed bookmark is unaffected."""
+        if getattr(self, "_tap", None) is None:
+            return
+        self._is_state_flushed = False
+        self._write_state_message()
+
+    def _stop_if_shutdown_requested(self) -> None:
+        """Safe point for a graceful SIGTERM (see `tap_fmp.shutdown`): flush
+        state and stop the sync. Called between units of work only."""
+        tap = getattr(self, "_tap", None)
+        shutdown = getattr(tap, "shutdown_requested", None)
+        if shutdown is None or not shutdown.is_set():
+            return
+        self._checkpoint_state()
+        self.logger.warning(f"Stream {self.name}: state flushed, stopping sync.")
+        raise ShutdownRequested()
+
+    def _partition_workers(self) -> int:
+        if not self._partition_workers_safe:
+            return 1
+        return int(
+            self.other_params.get("partition_workers", self._default_partition_workers)
+        )
+
+    def _partition_records(self, context: Context | None) -> t.Iterable[dict]:
+        """This partition's records. With `partition_workers` > 1, up to that
+        many partitions (this one and the next ones in `self.partitions`
+        order) run on worker threads, each buffering at most
+        `other_params.partition_buffer_records` (default 1000) records. The
+        SDK still consumes partitions in order on this thread, so bookmarks,
+        change capture and per-partition state finalisation are unchanged."""
+        workers = self._partition_workers()
+        if context is None or workers <= 1:
+            return self._claimed_records(context)
+
+        lookahead = self.__dict__.get("_partition_lookahead")
+        if lookahead is not None:
+            item, records = next(lookahead, (None, None))
+            if item == context:
+                return records
+            self._close_partition_lookahead()
+
+        partitions = self.partitions or []
+        if context not in partitions:
+            return self._claimed_records(context)
+        lookahead = prefetch_iterables(
+            self._scoped_partition_records,
+            self._with_partition_state(partitions[partitions.index(context) :]),
+            max_workers=workers,
+            max_buffered=int(self.other_params.get("partition_buffer_records", 1000)),
+            thread_name_prefix=f"{self.name}-partitions",
+        )
+        self._partition_lookahead = lookahead
+        _, records = next(lookahead)
+        return records
+
+    def _with_partition_state(self, partitions: t.Sequence[dict]) -> t.Iterator[dict]:
+        """Yield `partitions`, creating each one's state entry first. The
+        look-ahead pulls partitions on this (the SDK's) thread, so workers
+        reading state (`_partition_fresh`, bookmarks) only ever find existing
+        entries: the SDK creates them lazily and without a lock."""
+        for context in partitions:
+            self.get_context_state(context)
+            yield context
+
+    def _scoped_partition_records(self, context: Context) -> t.Iterable[dict]:
+        """Worker-thread body: the partition's `_fetch_records` with its own
+        copy of `query_params` (see the `query_params` property)."""
+        scoped = self.__dict__.setdefault("_partition_scope", threading.local())
+        scoped.query_params = dict(self.__dict__["_query_params"])
+        try:
+            yield from self._claimed_records(context)
+        finally:
+            scoped.query_params = None
+
+    def _claim_partition(self, context: Context | None) -> bool:
+        """Under `--workers N`, whether this worker owns the partition
+        (claiming it if it is still free). See `tap_fmp.workers`."""
+        tap = getattr(self, "_tap", None)
+        work_queue = getattr(tap, "work_queue", None)
+        if work_queue is None:
+            return True
+        # Lookup instances (symbol caches, bulk routes) read data for this
+        # worker only; just the instances being synced share the queue.
+        if tap.streams.get(self.name) is not self:
+            return True
+        return work_queue.claim(self.name, context)
+
+    def _claimed_records(self, context: Context | None) -> t.Iterable[dict]:
+        """The stream's own `_fetch_records`, or nothing when another worker
+        claimed the partition. Claims are taken when the partition starts
+        running, not when it is queued for look-ahead."""
+        if self._partition_fresh(context):
+            self.logger.debug(
+                f"Stream {self.name}: skipping {context}, refreshed within "
+                f"refresh_every."
+            )
+            return
+        if not self._claim_partition(context):
+            return
+        if not self._partition_available(context):
+            self.logger.debug(
+                f"Stream {self.name}: skipping {context}, not listed by "
+                f"{self._availability_route.companion_stream.__name__}."
+            )
+            return
+        started_at = datetime.now(timezone.utc)
+        cache = self._negative_cache() if context else None
+        if cache is None:
+            yield from self._metered_records(context)
+        elif cache.should_skip(context):
+            self.logger.debug(
+                f"Stream {self.name}: skipping {context}, empty when last checked."
+            )
+            return
+        else:
+            emitted = 0
+            for record in self._metered_records(context):
+                emitted += 1
+                yield record
+            empty = not emitted and not self._has_bookmark(context)
+            cache.record(context, empty=empty)
+        self._note_refresh(context, started_at)
+
+    def _refresh_interval(self) -> timedelta | None:
+        return parse_interval(self.other_params.get("refresh_every"))
+
+    def _invalidation_enabled(self) -> bool:
+        return bool(self._invalidation_feeds) and self.other_params.get(
+            "event_invalidation", False
+        )
+
+    def _partition_fresh(self, context: Context | None) -> bool:
+        """Whether `context` was refreshed within `refresh_every` and, under
+        `event_invalidation`, after its symbol's latest event."""
+        if not context:
+            return False
+        every = self._refresh_interval()
+        invalidation = self._invalidation_enabled()
+        if every is None and not invalidation:
+            return False
+        refreshed_at = self._refreshed_at(context)
+        if not refreshed_at:
+            return False
+        if every is not None and not is_fresh(
+            refreshed_at, every, datetime.now(timezone.utc)
+        ):
+            return False
+        if not invalidation:
+            return True
+        events = self._event_index()
+        return events is not None and events.is_current(
+            context.get("symbol"), refreshed_at
+        )
+
+    def _event_index(self) -> EventIndex | None:
+        if "_events" not in self.__dict__:
+            with self._invalidation_lock:
+                if "_events" not in self.__dict__:
+                    self._events = self._read_invalidation_feeds()
+        return self._events
+
+    def _read_invalidation_feeds(self) -> EventIndex | None:
+        """Events over the lookback window; None (refetch everything) when
+        a feed can't be read."""
+        today = datetime.now(timezone.utc).date()
+        since = today - timedelta(
+            days=int(
+                self.other_params.get(
+                    "invalidation_lookback_days", DEFAULT_LOOKBACK_DAYS
+                )
+            )
+        )
+        feed_rows = []
+        for feed in self._invalidation_feeds:
+            stream = self._tap.get_bulk_stream(feed.stream)
+            start = since - timedelta(days=feed.settle_days)
+            step = timedelta(days=stream._default_time_slice_days)
+            rows = []
+            try:
+                while start <= today:
+                    end = min(start + step - timedelta(days=1), today)
+                    rows.extend(
+                        stream._fetch_window_records(
+                            stream.get_url(None),
+                            {"apikey": self.config.get("api_key")},
+                            start.isoformat(),
+                            end.isoformat(),
+                            int(
+                                stream.other_params.get("max_records_per_request", 4000)
+                            ),
+                        )
+                    )
+                    start = end + timedelta(days=1)
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(
+                    f"Stream {self.name}: could not read {stream.name} ({e}); "
+                    f"refetching every partition."
+                )
+                return None
+            feed_rows.append((feed, rows))
+        events = EventIndex.from_rows(since, today, feed_rows)
+        self.logger.info(
+            f"Stream {self.name}: {len(events.stale_until)} symbols with events "
+            f"since {since}."
+        )
+        return events
+
+    def _note_refresh(self, context: Context | None, started_at: datetime) -> None:
+        """Remember that `context` was fetched. Partitions may run on
+        look-ahead threads; `_commit_refresh` moves this into state on the
+        SDK's thread once the partition has been emitted."""
+        if not context or (
+            self._refresh_interval() is None
+            and not self._invalidation_enabled()
+            and not self._feed_incremental_enabled()
+        ):
+            return
+        with self._refresh_lock:
+            refreshes = self.__dict__.setdefault("_partition_refreshes", {})
+            # Earliest wins: a partition served from a feed read is only
+            # current as of that read.
+            key = partition_key(context)
+            refreshed_at = started_at.isoformat()
+            refreshes[key] = min(refreshes.get(key, refreshed_at), refreshed_at)
+
+    def _commit_refresh(self, context: Context | None) -> None:
+        if not context:
+            return
+        with self._refresh_lock:
+            refreshed_at = self.__dict__.get("_partition_refreshes", {}).pop(
+                partition_key(context), None
+            )
+        if refreshed_at is None:
+            return
+        state = self.get_context_state(context)
+        if self._state_is_per_partition(context):
+            state[REFRESHED_AT_KEY] = refreshed_at
+        else:
+            refreshes = state.setdefault(PARTITION_REFRESHED_AT_KEY, {})
+            refreshes[partition_key(context)] = refreshed_at
+
+    def _state_is_per_partition(self, context: Context) -> bool:
+        """Whether `context` has a state partition of its own, rather than
+        sharing one through coarser `state_partitioning_keys`."""
+        keys = self.state_partitioning_keys
+        return keys is None or set(context) <= set(keys)
+
+    def _refreshed_at(self, context: Context) -> str | None:
+        """When `context` was last fetched (see `_commit_refresh`)."""
+        state = self.get_context_state(context)
+        if self._state_is_per_partition(context):
+            return state.get(REFRESHED_AT_KEY)
+        return state.get(PARTITION_REFRESHED_AT_KEY, {}).get(partition_key(context))
+
+    def _has_bookmark(self, context: Context | None) -> bool:
+        """Whether an incremental partition already has state: no new rows
+        there is not the same as no rows at all."""
+        if not self.replication_key:
+            return False
+        return self.get_starting_replication_key_value(context) is not None
+
+    def _negative_cache(self) -> NegativeCache | None:
+        """The stream's known-empty partitions, or None when the cache is off
+        (see `tap_fmp.negative_cache`)."""
+        if (
+            getattr(self, "_tap", None) is None
+            or not self.other_params.get("negative_cache", self._default_negative_cache)
+            # The feed serves known-empty symbols their new rows for free.
+            or self._feed_incremental_enabled()
+        ):
+            return None
+        if "_negative" not in self.__dict__:
+            with self._negative_cache_lock:
+                if "_negative" not in self.__dict__:
+                    self._negative = NegativeCache(
+                        self._tap.get_local_store(),
+                        self.name,
+                        ttl=timedelta(
+                            days=float(
+                                self.other_params.get(
+                                    "negative_cache_ttl_days", DEFAULT_TTL_DAYS
+                                )
+                            )
+                        ),
+                        recheck_rate=float(
+                            self.other_params.get(
+                                "negative_cache_recheck_rate", DEFAULT_RECHECK_RATE
+                            )
+                        ),
+                    )
+        return self._negative
+
+    def _partition_available(self, context: Context | None) -> bool:
+        """False when the stream's availability companion says `context` has
+        no data (see `tap_fmp.availability`)."""
+        route = self._availability_route
+        if (
+            route is None
+            or getattr(self, "_tap", None) is None
+            or not context
+            or not context.get("symbol")
+            or not self.other_params.get("availability_pruning", True)
+        ):
+            return True
+        key = route.context_key(context)
+        if key is None:
+            return True
+        available = self._availability_index().available(context["symbol"])
+        return available is None or key in available
+
+    def _availability_index(self) -> AvailabilityIndex:
+        if "_availability" not in self.__dict__:
+            with self._availability_lock:
+                if "_availability" not in self.__dict__:
+                    route = self._availability_route
+
+                    def fetch(symbol: str) -> list[dict]:
+                        companion = self._tap.get_bulk_stream(route.companion_stream)
+                        return companion._fetch_with_retry(
+                            companion.get_url({"symbol": symbol}),
+                            {"apikey": self.config.get("api_key"), "symbol": symbol},
+                        )
+
+                    self._availability = AvailabilityIndex(
+                        self._tap.get_local_store(),
+                        self.name,
+                        route,
+                        fetch,
+                        ttl_hours=float(
+                            self.other_params.get(
+                                "availability_ttl_hours", DEFAULT_TTL_HOURS
+                            )
+                        ),
+                    )
+        return self._availability
+
+    def _close_partition_lookahead(self) -> None:
+        lookahead = self.__dict__.pop("_partition_lookahead", None)
+        if lookahead is not None:
+            lookahead.close()
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Per-partition entry point called by the SDK. Wraps the stream's
+        own `_fetch_records` with partition-level features (look-ahead,
+        change-data-capture, ...) so they apply to every stream type without
+        each one opting in. Streams override `_fetch_records`, not this."""
+        try:
+            self._stop_if_shutdown_requested()
+            records = self._partition_records(context)
+            capture = self._get_change_capture(context)
+            if capture is None:
+                yield from records
+                self._commit_refresh(context)
+                return
+
+            emitted = 0
+            for record in records:
+                if capture.is_changed(record):
+                    emitted += 1
+                    yield record
+            # Fresh partitions were not fetched, so nothing in them vanished.
+            if not self._claim_partition(context) or self._partition_fresh(context):
+                return
+            emit_tombstones = self._cdc_tombstones_enabled()
+            tombstones = capture.tombstones() if emit_tombstones else []
+            yield from tombstones
+            capture.commit(forget_vanished=emit_tombstones)
+            self.logger.debug(
+                f"Stream {self.name}: change capture for {context or 'stream'}: "
+                f"{emitted} new/changed, {capture.unchanged} unchanged, "
+                f"{len(tombstones)} tombstones"
+            )
+            self._commit_refresh(context)
+        except BaseException:
+            # Failed or abandoned mid-partition: stop the partitions running
+            # ahead instead of leaving their workers blocked on full buffers.
+            self._close_partition_lookahead()
+            raise
+
+    def _get_change_capture(self, context: Context | None) -> ChangeCapture | None:
+        if not self.other_params.get("change_data_capture"):
+            return None
+        key_fields = self.other_params.get("cdc_key_fields") or self.primary_keys
+        if not key_fields:
+            raise ConfigValidationError(
+                f"Stream {self.name}: change_data_capture needs primary keys "
+                f"or other_params.cdc_key_fields."
+            )
+        return ChangeCapture(
+            self._tap.get_local_store(),
+            self.name,
+            context,
+            key_fields=key_fields,
+            tombstone_fields=self.schema.get("required", []),
+            ignore_fields=self.other_params.get("cdc_ignore_fields", []),
+        )
+
+    def _cdc_tombstones_enabled(self) -> bool:
+        """Tombstones need a complete snapshot per partition, which only
+        FULL_TABLE syncs guarantee (incremental runs see a bookmark slice)."""
+        if not self.other_params.get("cdc_tombstones"):
+            return False
+        if self.replication_method != "FULL_TABLE":
+            self.logger.warning(
+                f"Stream {self.name}: cdc_tombstones ignored for "
+                f"{self.replication_method} replication."
+            )
+            return False
+        if self._feed_incremental_enabled():
+            self.logger.warning(
+                f"Stream {self.name}: cdc_tombstones ignored with feed_incremental."
+            )
+            return False
+        return True
+
+    def _yield_processed(
+        self, records: list[dict], context: Context | None
+    ) -> t.Iterable[dict]:
+        for record in records:
+            record = self.post_process(record, context)
+            self._check_missing_fields(record)
+            yield record
+
+    def _get_bulk_records(self, context: Context | None) -> t.Iterable[dict] | None:
+        """Records for partition `context` from this run's bulk download, or
+        None when the planner decided to serve the stream per symbol. The
+        plan (and download) happens once, on the first partition."""
+        if self._bulk_route is None or not context:
+            return None
+        bulk_plan = getattr(self, "_bulk_plan", None)
+        if bulk_plan is None:
+            with self._bulk_plan_lock:
+                bulk_plan = getattr(self, "_bulk_plan", None)
+                if bulk_plan is None:
+                    bulk_plan = self._bulk_plan = plan_bulk_source(self)
+        if bulk_plan.source != SOURCE_BULK:
+            return None
+        rows = bulk_plan.take(context["symbol"])
+        records = rows_for_partition(self, self._bulk_route, context, rows)
+        return self._yield_processed(records, context)
+
+    def _feed_incremental_enabled(self) -> bool:
+        return self._feed_route is not None and self.other_params.get(
+            "feed_incremental", False
+        )
+
+    def _get_feed_records(self, context: Context | None) -> t.Iterable[dict] | None:
+        """New records for partition `context` from this run's read of the
+        stream's feed, or None when the partition must be fetched per symbol
+        (see `tap_fmp.feed_routing`)."""
+        if not context or not self._feed_incremental_enabled():
+            return None
+        refreshed_at = self._refreshed_at(context)
+        if not refreshed_at:
+            return None
+        snapshot = self._feed_snapshot()
+        if snapshot is None or not snapshot.covers(refreshed_at):
+            return None
+        rows = snapshot.take(context["symbol"], refreshed_at)
+        self._note_refresh(context, snapshot.read_at)
+        return self._yield_processed(rows, context)
+
+    def _feed_snapshot(self) -> FeedSnapshot | None:
+        if "_feed" not in self.__dict__:
+            with self._feed_lock:
+                if "_feed" not in self.__dict__:
+                    self._feed = self._read_feed()
+        return self._feed
+
+    def _read_feed(self) -> FeedSnapshot | None:
+        """Page the feed back to the oldest partition refresh, bounded by
+        `feed_lookback_days`. None (fetch per symbol) when nothing has been
+        refreshed yet or the feed can't be read."""
+        refreshed = []
+        for p in self.stream_state.get("partitions", []):
+            if p.get(REFRESHED_AT_KEY):
+                refreshed.append(p[REFRESHED_AT_KEY])
+            refreshed.extend(p.get(PARTITION_REFRESHED_AT_KEY, {}).values())
+        if not refreshed:
+            return None
+        read_at = datetime.now(timezone.utc)
+        lookback = float(self.other_params.get("feed_lookback_days", 7))
+        cutoff = max(
+            min(refreshed)[:10],
+            (read_at - timedelta(days=lookback)).date().isoformat(),
+        )
+        route = self._feed_route
+        feed = self._tap.get_bulk_stream(route.feed_stream)
+        url = feed.get_url(None)
+        query_params = {"apikey": self.config.get("api_key")}
+        try:
+            snapshot = read_feed(
+                lambda page: feed._fetch_with_retry(url, query_params, page),
+                route.timestamp_field,
+                cutoff,
+                feed._max_pages,
+                feed._max_consecutive_empty_pages,
+                read_at,
+            )
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(
+                f"Stream {self.name}: could not read {feed.name} ({e}); "
+                f"fetching per symbol."
+            )
+            return None
+        self.logger.info(
+            f"Stream {self.name}: read {feed.name} back to "
+            f"{snapshot.covers_from} ({len(snapshot.rows_by_symbol)} symbols)."
+        )
+        return snapshot
+
     @staticmethod
     def redact_api_key(msg):
         msg_str = str(msg)
@@ -208,7 +991,9 @@ class FmpRestStream(RESTStream, ABC):
             wait = self._last_call_ts + self._min_interval - now
             if wait > 0:
                 time.sleep(wait + random.uniform(0, 0.1))
-            self._last_call_ts = now
+            # Stamp after sleeping: with concurrent callers, stamping the
+            # pre-sleep time lets the next waiter fire immediately.
+            self._last_call_ts = time.time()
 
     def _fetch_with_retry(
         self, url: str, query_params: dict, page: int | None = None
@@ -238,7 +1023,14 @@ class FmpRestStream(RESTStream, ABC):
         def fetch_with_backoff():
             return self._make_http_request(url, query_params, page)
 
-        return fetch_with_backoff()
+        meter = self._cost_meter()
+        if meter is None:
+            return fetch_with_backoff()
+        started = time.monotonic()
+        try:
+            return fetch_with_backoff()
+        finally:
+            meter.add(seconds=time.monotonic() - started)
 
     def _make_http_request(
         self, url: str, query_params: dict, page: int | None = None
@@ -269,6 +1061,9 @@ class FmpRestStream(RESTStream, ABC):
             response = self.requests_session.get(
                 url, params=query_params, timeout=timeout
             )
+            meter = self._cost_meter()
+            if meter is not None:
+                meter.add(nbytes=len(response.content), requests=1)
 
             if (
                 response.status_code == 400 and response.text == "[]"
@@ -328,6 +1123,8 @@ class FmpRestStream(RESTStream, ABC):
         self._set_configured_page()
         page = self.configured_page if self.configured_page is not None else 0
         consecutive_empty_pages = 0
+        floor = self._bookmark_floor(context)
+        pages_after_floor: int | None = None
 
         max_page = (
             self.configured_page
@@ -354,23 +1151,71 @@ class FmpRestStream(RESTStream, ABC):
             else:
                 consecutive_empty_pages = 0
 
+            if floor is not None and pages_after_floor is None:
+                if self._page_reaches(records, floor):
+                    pages_after_floor = 0
+            elif pages_after_floor is not None:
+                pages_after_floor += 1
+
             for record in records:
                 record = self.post_process(record, context)
+                if (
+                    floor is not None
+                    and _timestamp_key(record.get(self.replication_key)) < floor
+                ):
+                    continue
                 self._check_missing_fields(record)
                 yield record
 
             page += 1
+            if (
+                pages_after_floor is not None
+                and pages_after_floor >= self._bookmark_overlap_pages()
+            ):
+                self.logger.info(
+                    f"Stream {self.name}: stopping pagination at page "
+                    f"{page - 1}, past bookmark {floor}."
+                )
+                return
 
         if self.configured_page is None and page > self._max_pages:
             self.logger.warning(
                 f"Reached maximum page index ({self._max_pages}, inclusive). Some data may be missing."
             )
 
+    def _bookmark_floor_enabled(self) -> bool:
+        return self.other_params.get("bookmark_cutoff", self._default_bookmark_cutoff)
+
+    def _bookmark_floor(self, context: Context | None) -> str | None:
+        """The bookmark at full timestamp precision when the cut-off applies
+        to an INCREMENTAL partition that has one. Records before it are
+        dropped client-side; records *at* it are kept, since several items
+        can share a timestamp (and an intraday bar may have been in progress)."""
+        if self.replication_method != "INCREMENTAL" or not (
+            self._bookmark_floor_enabled()
+        ):
+            return None
+        bookmark = self.get_context_state(context).get("replication_key_value")
+        return _timestamp_key(bookmark) if bookmark else None
+
+    def _page_reaches(self, records: list, floor: str) -> bool:
+        """True when a raw page holds a record older than `floor`. On a
+        newest-first feed, every later page is older still."""
+        field = self._bookmark_cutoff_field or self.replication_key
+        return any(
+            _timestamp_key(r.get(field)) < floor
+            for r in records
+            if isinstance(r, dict) and r.get(field)
+        )
+
+    def _bookmark_overlap_pages(self) -> int:
+        return int(self.other_params.get("bookmark_overlap_pages", 1))
+
     @staticmethod
     def _format_replication_key(replication_key_value):
         return replication_key_value
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         url = self.get_url(context)
 
         if self._paginate:
@@ -403,9 +1248,18 @@ class BaseSymbolPartitionStream(BaseSymbolPartitionMixin, FmpRestStream):
     _symbol_in_path_params = False
     _symbol_in_query_params = True
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         assert self._symbol_in_path_params or self._symbol_in_query_params
 
+        bulk_records = self._get_bulk_records(context)
+        if bulk_records is not None:
+            yield from bulk_records
+            return
+        feed_records = self._get_feed_records(context)
+        if feed_records is not None:
+            yield from feed_records
+            return
+
         query_params = self.query_params.copy()
         path_params = self.path_params.copy()
 
@@ -455,17 +1309,22 @@ class SymbolPeriodPartitionStream(FmpSurrogateKeyStream):
         symbols = self._tap.get_cached_company_symbols()
 
         if not periods:
-            return [{"symbol": s["symbol"]} for s in symbols]
+            return self._plan_partitions([{"symbol": s["symbol"]} for s in symbols])
 
-        return [
-            {"symbol": s["symbol"], "period": period}
-            for s in symbols
-            for period in periods
-        ]
+        return self._plan_partitions(
+            [
+                {"symbol": s["symbol"], "period": period}
+                for s in symbols
+                for period in periods
+            ]
+        )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
+        bulk_records = self._get_bulk_records(context)
+        if bulk_records is not None:
+            return bulk_records
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class TruncationReason:
@@ -480,10 +1339,23 @@ class TruncationReason:
 class TimeSliceStream(FmpRestStream):
     replication_key = "date"
     replication_method = "INCREMENTAL"
+    # Windows checkpoint state mid-partition; concurrency is per window.
+    _partition_workers_safe = False
 
     # Last-line defense against silent truncation: `fetch_window`'s halving
     # only fires on `max_records_per_request` hits, not on silent caps or page ceilings.
     _default_time_slice_days: int = 90
+    # Windows fetched ahead of emission (`other_params.max_workers`). Serial
+    # by default: look-ahead spends requests on windows that are discarded
+    # when an earlier one fails.
+    _default_max_workers: int = 1
+    # Tail-follow (`other_params.tail_follow`): resume from the last emitted
+    # bar instead of re-emitting the bookmark day.
+    _default_tail_follow: bool = False
+    # Adaptive sizing aims windows at this fraction of the per-request cap,
+    # leaving headroom for day-to-day density swings.
+    _adaptive_fill_ratio = 0.8
+    _window_observation_lock = threading.Lock()
 
     _LOG_FIXED_KEYS = frozenset(
         {
@@ -510,8 +1382,25 @@ class TimeSliceStream(FmpRestStream):
         else:
             start_dt = datetime(1970, 1, 1).date()
 
-        window_days = int(
-            self.other_params.get("time_slice_days", self._default_time_slice_days)
+        # Resume an interrupted partition after its last completed window.
+        checkpoint = self._window_checkpoint(context)
+        if checkpoint is not None:
+            start_dt = max(start_dt, checkpoint)
+
+        # Cold partitions (no bookmark) probe for a listing date once;
+        # resumed ones only use dates already known.
+        listing_bound = self._listing_lower_bound(
+            context,
+            probe=not self.get_context_state(context).get("replication_key_value"),
+        )
+        if listing_bound is not None:
+            start_dt = max(start_dt, listing_bound)
+
+        window_days = self._adaptive_window_days(
+            context,
+            int(
+                self.other_params.get("time_slice_days", self._default_time_slice_days)
+            ),
         )
 
         query_params = self.stream_config.get("query_params", {})
@@ -539,16 +1428,111 @@ class TimeSliceStream(FmpRestStream):
             end_dt = start_dt
             end_date = start_date
 
+        # With a trading calendar, `window_days` counts sessions: windows stay
+        # contiguous but stretch over weekends/holidays, and windows holding
+        # no session at all are dropped instead of costing a request.
+        calendar = self._get_trading_calendar()
+
         slices = []
         current = start_dt
         while current < end_dt:
-            slice_end = min(current + timedelta(days=window_days), end_dt)
-            slices.append(
-                (current.strftime("%Y-%m-%d"), slice_end.strftime("%Y-%m-%d"))
-            )
+            if calendar is None:
+                slice_end = min(current + timedelta(days=window_days), end_dt)
+            else:
+                slice_end = min(
+                    datetime.combine(
+                        calendar.add_trading_days(current.date(), window_days),
+                        datetime.min.time(),
+                    ),
+                    end_dt,
+                )
+            if calendar is None or calendar.trading_days(
+                current.date(), slice_end.date()
+            ):
+                slices.append(
+                    (current.strftime("%Y-%m-%d"), slice_end.strftime("%Y-%m-%d"))
+                )
             current = slice_end
         return slices
 
+    def _adaptive_window_days(self, context: Context | None, window_days: int) -> int:
+        """Size windows from the partition's observed `records_per_day` so
+        they land just under `max_records_per_request` (or the hidden cap
+        learned from a silent truncation) instead of being halved after a
+        full response.
+
+        Windows shrink freely, but only grow up to
+        `other_params.max_time_slice_days` (default: the configured window):
+        some FMP intraday caps are per window rather than per record, and a
+        window truncated by fewer than 7 days can't be detected.
+        Paginated streams aren't record-capped and keep the fixed size."""
+        if self._paginate or not self.other_params.get("adaptive_time_slices", True):
+            return window_days
+        state = self.get_context_state(context)
+        density = state.get("records_per_day")
+        if not density:
+            return window_days
+        cap = int(self.other_params.get("max_records_per_request", 4000))
+        if state.get("hidden_record_cap"):
+            cap = min(cap, int(state["hidden_record_cap"]))
+        max_days = int(self.other_params.get("max_time_slice_days", window_days))
+        # (from, to) are both inclusive: an N-day window holds N + 1 days.
+        fitted = int(cap * self._adaptive_fill_ratio / float(density)) - 1
+        return max(1, min(fitted, max_days))
+
+    def _observe_window(
+        self,
+        context: Context | None,
+        from_date: str,
+        to_date: str,
+        records: int,
+        hidden_cap: int | None = None,
+    ) -> None:
+        """Accumulate a completed window's record count for density learning.
+        A silently truncated window only tells us the hidden cap."""
+        if hidden_cap is None:
+            start = date.fromisoformat(from_date[:10])
+            end = date.fromisoformat(to_date[:10])
+            calendar = self._get_trading_calendar()
+            units = (
+                len(calendar.trading_days(start, end))
+                if calendar is not None
+                else (end - start).days + 1
+            )
+        else:
+            records = units = 0
+        key = tuple(sorted((context or {}).items()))
+        with self._window_observation_lock:
+            if "_window_observations" not in self.__dict__:
+                self._window_observations = {}
+            observed = self._window_observations.setdefault(key, [0, 0, None])
+            observed[0] += records
+            observed[1] += units
+            if hidden_cap is not None:
+                observed[2] = min(observed[2] or hidden_cap, hidden_cap)
+
+    def _store_window_density(self, context: Context | None) -> None:
+        """Fold this run's observations into the partition state: an even
+        blend with the previous `records_per_day`, and the smallest hidden
+        cap seen so far."""
+        key = tuple(sorted((context or {}).items()))
+        with self._window_observation_lock:
+            observed = self.__dict__.get("_window_observations", {}).pop(key, None)
+        if observed is None:
+            return
+        records, units, hidden_cap = observed
+        state = self.get_context_state(context)
+        if units:
+            density = records / units
+            previous = state.get("records_per_day")
+            if previous:
+                density = (float(previous) + density) / 2
+            state["records_per_day"] = round(density, 3)
+        if hidden_cap is not None:
+            state["hidden_record_cap"] = min(
+                int(state.get("hidden_record_cap") or hidden_cap), hidden_cap
+            )
+
     def _log_data_truncated(
         self,
         *,
@@ -576,15 +1560,28 @@ class TimeSliceStream(FmpRestStream):
         for k, v in extra.items():
             parts.append(f"{k}={v}")
         self.logger.error(" ".join(parts))
+        with self._window_observation_lock:
+            self.__dict__.setdefault("_truncated_windows", []).append(
+                (symbol, from_date, to_date)
+            )
 
-    def _fetch_paginated_window(
-        self, url: str, query_params: dict
-    ) -> tuple[list[dict], bool]:
-        """Aggregate raw records across all pages within a (from, to) window.
-        Returns `(records, hit_page_ceiling)`. The ceiling flag is True only
-        when the loop exited because we exhausted `_max_pages` with data
-        still flowing — caller treats that as truncation. A configured
-        single-page fetch never reports ceiling-hit."""
+    def _iter_window_pages(
+        self,
+        url: str,
+        query_params: dict,
+        scan: _PageScan,
+        stop_before: str | None = None,
+    ) -> t.Iterator[list[dict]]:
+        """Yield a window's non-empty raw pages as they arrive, tracking what
+        the truncation checks need (count, first/last record, ceiling) in
+        `scan` so the window is never held in memory. `scan.hit_page_ceiling`
+        is True only when `_max_pages` was exhausted with data still flowing
+        — truncation. A configured single-page fetch never reports it.
+
+        With `stop_before` (a bookmark timestamp), paging stops after the
+        first page holding a record older than it: the feed is newest-first,
+        so later pages hold nothing new (beyond `bookmark_overlap_pages`)."""
+        pages_after_floor: int | None = None
         self._set_configured_page()
         page = self.configured_page if self.configured_page is not None else 0
         max_page = (
@@ -593,7 +1590,6 @@ class TimeSliceStream(FmpRestStream):
             else self._max_pages
         )
         consecutive_empty = 0
-        records: list[dict] = []
 
         while page <= max_page:
             page_records = self._fetch_with_retry(url, query_params, page)
@@ -602,17 +1598,30 @@ class TimeSliceStream(FmpRestStream):
                     f"Expected list response on page {page}, got "
                     f"{type(page_records).__name__}; stopping pagination."
                 )
-                return records, False
+                return
             if not page_records:
                 consecutive_empty += 1
                 if consecutive_empty >= self._max_consecutive_empty_pages:
-                    return records, False
+                    return
             else:
                 consecutive_empty = 0
-                records.extend(page_records)
+                scan.add(page_records)
+                yield page_records
+                if pages_after_floor is not None:
+                    pages_after_floor += 1
+                elif stop_before is not None and self._page_reaches(
+                    page_records, stop_before
+                ):
+                    pages_after_floor = 0
+                if (
+                    pages_after_floor is not None
+                    and pages_after_floor >= self._bookmark_overlap_pages()
+                ):
+                    scan.stopped_at_bookmark = True
+                    return
             page += 1
 
-        return records, self.configured_page is None
+        scan.hit_page_ceiling = self.configured_page is None
 
     def _check_silent_truncation(
         self,
@@ -621,18 +1630,42 @@ class TimeSliceStream(FmpRestStream):
         to_date: str,
         max_records: int,
         symbol: str | None,
-    ) -> None:
-        if not records or not isinstance(records[0], dict):
-            return
+    ) -> bool:
+        """Log (and return True) when FMP returned only the tail of the window."""
+        if not records:
+            return False
+        return self._check_silent_truncation_bounds(
+            records[0],
+            records[-1],
+            len(records),
+            from_date,
+            to_date,
+            max_records,
+            symbol,
+        )
+
+    def _check_silent_truncation_bounds(
+        self,
+        first: dict | None,
+        last: dict | None,
+        count: int,
+        from_date: str,
+        to_date: str,
+        max_records: int,
+        symbol: str | None,
+    ) -> bool:
+        """`_check_silent_truncation` from a window's first and last record."""
+        if not isinstance(first, dict) or not isinstance(last, dict):
+            return False
         try:
             # FMP returns chart records DESC, but be order-agnostic.
             candidates = [
                 datetime.fromisoformat(d).date()
-                for d in (records[0].get("date"), records[-1].get("date"))
+                for d in (first.get("date"), last.get("date"))
                 if d
             ]
             if not candidates:
-                return
+                return False
             earliest = min(candidates)
             from_dt = datetime.fromisoformat(from_date).date()
             # 7-day tolerance covers 9/11-class closures, Christmas–NY
@@ -642,25 +1675,19 @@ class TimeSliceStream(FmpRestStream):
                     from_date=from_date,
                     to_date=to_date,
                     symbol=symbol,
-                    records_returned=len(records),
+                    records_returned=count,
                     max_records=max_records,
                     reason=TruncationReason.SILENT_CAP,
                     action="set_smaller_time_slice_days_for_this_stream",
                     earliest_returned=earliest.isoformat(),
                 )
+                return True
         except (ValueError, TypeError) as e:
             self.logger.debug(
                 f"silent-truncation check skipped for stream={self.name} "
                 f"window={from_date}..{to_date}: {type(e).__name__}: {e}"
             )
-
-    def _yield_processed(
-        self, records: list[dict], context: Context | None
-    ) -> t.Iterable[dict]:
-        for record in records:
-            record = self.post_process(record, context)
-            self._check_missing_fields(record)
-            yield record
+        return False
 
     def fetch_window(
         self,
@@ -671,51 +1698,129 @@ class TimeSliceStream(FmpRestStream):
         max_records,
         context: Context | None = None,
     ):
-        """Fetch all records for a window. Three modes:
+        """Fetch all records for a window and yield them post-processed.
+        Paginated windows are streamed page by page."""
+        if self._paginate:
+            yield from self._stream_paginated_window(
+                url, query_params, from_date, to_date, max_records, context
+            )
+            return
+        yield from self._yield_processed(
+            self._fetch_window_records(
+                url, query_params, from_date, to_date, max_records, context
+            ),
+            context,
+        )
+
+    def _window_params(self, query_params: dict, from_date: str, to_date: str) -> dict:
+        query_params = query_params.copy()
+        query_params[self._replication_key_starting_name] = from_date
+        query_params[self._replication_key_ending_name] = to_date
+        return query_params
+
+    def _stream_paginated_window(
+        self,
+        url,
+        query_params,
+        from_date,
+        to_date,
+        max_records,
+        context: Context | None,
+    ) -> t.Iterable[dict]:
+        scan = _PageScan()
+        window_params = self._window_params(query_params, from_date, to_date)
+        for page_records in self._iter_window_pages(
+            url, window_params, scan, self._bookmark_floor(context)
+        ):
+            yield from self._yield_processed(page_records, context)
+        self._check_paginated_window(
+            scan, from_date, to_date, max_records, query_params.get("symbol")
+        )
+
+    def _check_paginated_window(
+        self,
+        scan: _PageScan,
+        from_date: str,
+        to_date: str,
+        max_records: int,
+        symbol: str | None,
+    ) -> None:
+        """Page-ceiling / silent-truncation checks once a window's pages are
+        exhausted."""
+        if scan.hit_page_ceiling:
+            self._log_data_truncated(
+                from_date=from_date,
+                to_date=to_date,
+                symbol=symbol,
+                records_returned=scan.count,
+                max_records=max_records,
+                reason=TruncationReason.PAGE_CEILING,
+                action="set_smaller_time_slice_days_for_this_stream",
+                max_pages=self._max_pages,
+            )
+        elif not scan.stopped_at_bookmark:
+            self._check_silent_truncation_bounds(
+                scan.first,
+                scan.last,
+                scan.count,
+                from_date,
+                to_date,
+                max_records,
+                symbol,
+            )
+
+    def _fetch_window_records(
+        self,
+        url,
+        query_params,
+        from_date,
+        to_date,
+        max_records,
+        context: Context | None = None,
+    ) -> list[dict]:
+        """Raw records for a window (safe to run on a worker thread). Three modes:
 
         1. `_paginate=True`: iterate all pages within the window. If the
            page ceiling is hit, log DATA_TRUNCATED (splitting wouldn't
-           help — each half would also hit the ceiling).
-        2. Non-paginated, `len(records) >= max_records`: split window in
-           half and recurse. If already at 1-day granularity, log
-           DATA_TRUNCATED.
-        3. Non-paginated, `len(records) < max_records`: yield. Also runs
+           help — each half would also hit the ceiling). The serial path
+           streams these pages instead (`_stream_paginated_window`).
+        2. Non-paginated, `len(records) >= max_records`: keep the days the
+           (DESC) response fully covers and refetch only the remainder;
+           halve the window when coverage can't be told. If already at
+           1-day granularity, log DATA_TRUNCATED.
+        3. Non-paginated, `len(records) < max_records`: return. Also runs
            the silent-truncation safety net for FMP's hidden per-request
            caps that sit below max_records.
         """
-        query_params = query_params.copy()
-        query_params[self._replication_key_starting_name] = from_date
-        query_params[self._replication_key_ending_name] = to_date
+        query_params = self._window_params(query_params, from_date, to_date)
         symbol = query_params.get("symbol")
 
         if self._paginate:
-            records, hit_page_ceiling = self._fetch_paginated_window(url, query_params)
-            if hit_page_ceiling:
-                self._log_data_truncated(
-                    from_date=from_date,
-                    to_date=to_date,
-                    symbol=symbol,
-                    records_returned=len(records),
-                    max_records=max_records,
-                    reason=TruncationReason.PAGE_CEILING,
-                    action="set_smaller_time_slice_days_for_this_stream",
-                    max_pages=self._max_pages,
+            scan = _PageScan()
+            records = [
+                record
+                for page_records in self._iter_window_pages(
+                    url, query_params, scan, self._bookmark_floor(context)
                 )
-            else:
-                self._check_silent_truncation(
-                    records, from_date, to_date, max_records, symbol
-                )
-            yield from self._yield_processed(records, context)
-            return
+                for record in page_records
+            ]
+            self._check_paginated_window(scan, from_date, to_date, max_records, symbol)
+            return records
 
         records = self._fetch_with_retry(url, query_params)
 
         if len(records) < max_records:
-            self._check_silent_truncation(
+            truncated = self._check_silent_truncation(
                 records, from_date, to_date, max_records, symbol
             )
-            yield from self._yield_processed(records, context)
-            return
+            self._observe_window(
+                context,
+                from_date,
+                to_date,
+                len(records),
+                hidden_cap=len(records) if truncated else None,
+            )
+            return records
 
         from_dt = datetime.fromisoformat(from_date)
         to_dt = datetime.fromisoformat(to_date)
@@ -729,19 +1834,238 @@ class TimeSliceStream(FmpRestStream):
                 reason=TruncationReason.SPLIT_FLOOR,
                 action="refetch_with_smaller_window_or_higher_limit",
             )
-            yield from self._yield_processed(records, context)
-            return
+            self._observe_window(context, from_date, to_date, len(records))
+            return records
+
+        covered_after = self._covered_after(records, from_date, to_date)
+        if covered_after is not None:
+            # Days after the earliest returned one are complete; that day
+            # itself may be cut mid-way, so it is refetched with the rest.
+            kept = [r for r in records if _record_day(r, "date") > covered_after]
+            return (
+                self._fetch_window_records(
+                    url, query_params, from_date, covered_after, max_records, context
+                )
+                + kept
+            )
 
         mid_dt = from_dt + (to_dt - from_dt) // 2
         mid_date = mid_dt.strftime("%Y-%m-%d")
-        yield from self.fetch_window(
+        earlier = self._fetch_window_records(
             url, query_params, from_date, mid_date, max_records, context
         )
-        yield from self.fetch_window(
+        later = self._fetch_window_records(
             url, query_params, mid_date, to_date, max_records, context
         )
+        seen = {
+            _record_identity(r) for r in earlier if _record_day(r, "date") == mid_date
+        }
+        return earlier + [
+            r
+            for r in later
+            if _record_day(r, "date") != mid_date or _record_identity(r) not in seen
+        ]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    @staticmethod
+    def _covered_after(records: list[dict], from_date: str, to_date: str) -> str | None:
+        """Earliest day of a full DESC response when it lies strictly inside
+        the window, i.e. FMP returned the complete (day, to_date] tail. None
+        when the order is unknown or the response makes no progress."""
+        first = _record_day(records[0], "date")
+        last = _record_day(records[-1], "date")
+        if not first or not last or first < last:
+            return None
+        if from_date[:10] < last < to_date[:10]:
+            return last
+        return None
+
+    def _iter_windows(
+        self,
+        url: str,
+        query_params: dict,
+        time_slices: list[tuple[str, str]],
+        max_records: int,
+        context: Context | None,
+    ) -> t.Iterable[dict]:
+        """Emit windows in chronological order, fetching up to
+        `other_params.max_workers` of them ahead.
+
+        No try/except around the fetch: a transient API failure must
+        propagate so Singer leaves state at the last fully-completed window.
+        Catching it would silently skip the failed window and advance the
+        bookmark on later windows' records, leaving a permanent gap. With
+        look-ahead, windows after a failed one may already be downloaded;
+        they are discarded unread."""
+        floor = self._bookmark_floor(context)
+        tail_follow = floor is not None and self.other_params.get(
+            "tail_follow", self._default_tail_follow
+        )
+        fetch_started_at = datetime.now(timezone.utc)
+        if tail_follow and not self._tail_had_session(context, fetch_started_at):
+            self.logger.debug(
+                f"Stream {self.name}: market closed since last fetch, "
+                f"skipping partition {context}"
+            )
+            return
+
+        ledger = self._get_window_ledger(context)
+        if ledger is not None:
+            pending = ledger.pending(time_slices)
+            if len(pending) < len(time_slices):
+                self.logger.info(
+                    f"Stream {self.name}: skipping {len(time_slices) - len(pending)} "
+                    f"completed windows before {ledger.immutable_before} "
+                    f"(partition {context})"
+                )
+            time_slices = pending
+
+        max_workers = int(
+            self.other_params.get("max_workers", self._default_max_workers)
+        )
+        if max_workers <= 1:
+            windows = (
+                (
+                    window,
+                    self.fetch_window(url, query_params, *window, max_records, context),
+                )
+                for window in time_slices
+            )
+        else:
+            windows = self._fetch_windows_ahead(
+                url, query_params, time_slices, max_records, context, max_workers
+            )
+
+        # After each window but the last, record its end in state
+        # (`other_params.window_checkpoints`, default on). Each flush
+        # serializes the whole tap state, so a STATE message goes out at
+        # most every `other_params.window_checkpoint_seconds` (default 60);
+        # SIGTERM flushes the latest checkpoint regardless.
+        checkpoints = self._window_checkpoints_enabled()
+        flush_every = float(self.other_params.get("window_checkpoint_seconds", 60))
+        last_flush = time.monotonic()
+        last_window = len(time_slices) - 1
+
+        # Adjacent windows share their boundary day ((from, to) are both
+        # inclusive): drop the records the previous window already emitted.
+        previous_boundary: set[str] = set()
+        for i, ((from_date, to_date), records) in enumerate(windows):
+            boundary: set[str] = set()
+            row_count = 0
+            digest = hashlib.sha1()
+            for record in records:
+                day = _record_day(record, self.replication_key)
+                if day == from_date[:10] or day == to_date[:10]:
+                    identity = _record_identity(record)
+                    if day == from_date[:10] and identity in previous_boundary:
+                        continue
+                    if day == to_date[:10]:
+                        boundary.add(identity)
+                if (
+                    floor is not None
+                    and _timestamp_key(record.get(self.replication_key)) < floor
+                ):
+                    continue
+                if ledger is not None:
+                    row_count += 1
+                    digest.update(_record_identity(record).encode())
+                yield record
+            previous_boundary = boundary
+            # Recorded only once every record of the window was consumed.
+            if ledger is not None and not self._window_truncated(
+                query_params.get("symbol"), from_date, to_date
+            ):
+                ledger.record(from_date, to_date, row_count, digest.hexdigest())
+            if checkpoints and i < last_window:
+                self.get_context_state(context)["window_checkpoint"] = to_date
+                if time.monotonic() - last_flush >= flush_every:
+                    self._checkpoint_state()
+                    last_flush = time.monotonic()
+            self._stop_if_shutdown_requested()
+        self.get_context_state(context).pop("window_checkpoint", None)
+        if tail_follow:
+            self.get_context_state(context)[
+                "tail_checked_at"
+            ] = fetch_started_at.isoformat()
+
+    def _window_checkpoints_enabled(self) -> bool:
+        return self.replication_method == "INCREMENTAL" and self.other_params.get(
+            "window_checkpoints", True
+        )
+
+    def _window_checkpoint(self, context: Context | None) -> date | None:
+        """End of the last window an interrupted run completed. The SDK only
+        commits the bookmark when a partition finishes, so without this a
+        killed multi-year backfill restarts the partition from scratch."""
+        if not self._window_checkpoints_enabled():
+            return None
+        checkpoint = self.get_context_state(context).get("window_checkpoint")
+        return date.fromisoformat(checkpoint[:10]) if checkpoint else None
+
+    def _bookmark_floor_enabled(self) -> bool:
+        return super()._bookmark_floor_enabled() or self.other_params.get(
+            "tail_follow", self._default_tail_follow
+        )
+
+    def _tail_had_session(self, context: Context | None, now: datetime) -> bool:
+        """Whether any session overlapped the time since the last tail fetch
+        (less `tail_follow_grace_minutes`, default 15, for bars FMP publishes
+        after the close). Without a calendar or a previous fetch: True."""
+        calendar = self._get_trading_calendar()
+        checked_at = self.get_context_state(context).get("tail_checked_at")
+        if calendar is None or not checked_at:
+            return True
+        grace = timedelta(
+            minutes=int(self.other_params.get("tail_follow_grace_minutes", 15))
+        )
+        since = datetime.fromisoformat(checked_at) - grace
+        return calendar.had_session(since, now)
+
+    def _get_window_ledger(self, context: Context | None) -> WindowLedger | None:
+        """Ledger for `context` when `other_params.window_ledger` is on.
+        `immutable_after_days` (default 30) sets the horizon: windows ending
+        within it are always refetched. `force_refetch` disables skipping."""
+        tap = getattr(self, "_tap", None)
+        if tap is None or not self.other_params.get("window_ledger", False):
+            return None
+        horizon = int(self.other_params.get("immutable_after_days", 30))
+        immutable_before = date.today() - timedelta(days=horizon)
+        if self.other_params.get("force_refetch", False):
+            immutable_before = date.min
+        return WindowLedger(tap.get_local_store(), self.name, context, immutable_before)
+
+    def _window_truncated(
+        self, symbol: str | None, from_date: str, to_date: str
+    ) -> bool:
+        """Whether DATA_TRUNCATED was logged for any part of the window."""
+        with self._window_observation_lock:
+            truncated = self.__dict__.get("_truncated_windows", [])
+            return any(
+                s == symbol and f[:10] <= to_date[:10] and from_date[:10] <= to[:10]
+                for s, f, to in truncated
+            )
+
+    def _fetch_windows_ahead(
+        self,
+        url: str,
+        query_params: dict,
+        time_slices: list[tuple[str, str]],
+        max_records: int,
+        context: Context | None,
+        max_workers: int,
+    ) -> t.Iterator[tuple[tuple[str, str], t.Iterable[dict]]]:
+        for result in ordered_map(
+            lambda window: self._fetch_window_records(
+                url, query_params, *window, max_records, context
+            ),
+            time_slices,
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.name}-windows",
+        ):
+            if result.error is not None:
+                raise result.error
+            yield result.item, self._yield_processed(result.result, context)
+
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         query_params = self.query_params.copy()
 
         url = self.get_url(context)
@@ -749,14 +2073,10 @@ class TimeSliceStream(FmpRestStream):
         time_slices = self.create_time_slice_chunks(context)
         max_records = self.other_params.get("max_records_per_request", 4000)
 
-        # No try/except around fetch_window: a transient API failure must
-        # propagate so Singer leaves state at the last fully-completed window.
-        # Catching here would silently skip the failed window and advance the
-        # bookmark on subsequent windows' records, leaving a permanent gap.
-        for from_date, to_date in time_slices:
-            yield from self.fetch_window(
-                url, query_params, from_date, to_date, max_records, context
-            )
+        yield from self._iter_windows(
+            url, query_params, time_slices, max_records, context
+        )
+        self._store_window_density(context)
 
 
 class BaseSymbolPartitionTimeSliceStream(BaseSymbolPartitionMixin, TimeSliceStream):
@@ -766,9 +2086,14 @@ class BaseSymbolPartitionTimeSliceStream(BaseSymbolPartitionMixin, TimeSliceStre
     _symbol_in_path_params = False
     _symbol_in_query_params = True
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         assert self._symbol_in_path_params or self._symbol_in_query_params
 
+        bulk_records = self._get_bulk_records(context)
+        if bulk_records is not None:
+            yield from bulk_records
+            return
+
         query_params = self.query_params.copy()
         path_params = self.path_params.copy()
 
@@ -781,12 +2106,10 @@ class BaseSymbolPartitionTimeSliceStream(BaseSymbolPartitionMixin, TimeSliceStre
         time_slices = self.create_time_slice_chunks(context)
         max_records = self.other_params.get("max_records_per_request", 4000)
 
-        # See note above: no try/except here. Failures must propagate so Singer
-        # bookmark stays at last fully-completed window.
-        for from_date, to_date in time_slices:
-            yield from self.fetch_window(
-                url, query_params, from_date, to_date, max_records, context
-            )
+        yield from self._iter_windows(
+            url, query_params, time_slices, max_records, context
+        )
+        self._store_window_density(context)
 
 
 class CompanySymbolPartitionTimeSliceStream(
@@ -798,6 +2121,9 @@ class CompanySymbolPartitionTimeSliceStream(
 class IncrementalDateStream(FmpSurrogateKeyStream):
     replication_key = "date"
     replication_method = "INCREMENTAL"
+    _default_max_workers: int = 4
+    # Quarantined dates are written to state at the end of the partition.
+    _partition_workers_safe = False
 
     def _format_replication_key(self, replication_key_value):
         if isinstance(replication_key_value, str):
@@ -845,9 +2171,26 @@ class IncrementalDateStream(FmpSurrogateKeyStream):
             all_dates.append({"date": current_date.strftime("%Y-%m-%d")})
             current_date += timedelta(days=1)
 
+        calendar = self._get_trading_calendar()
+        if calendar is not None:
+            trading_dates = [
+                d
+                for d in all_dates
+                if calendar.is_trading_day(date.fromisoformat(d["date"]))
+            ]
+            self.logger.info(
+                f"Stream {self.name}: trading calendar {calendar.exchanges} "
+                f"skips {len(all_dates) - len(trading_dates)} of "
+                f"{len(all_dates)} dates."
+            )
+            all_dates = trading_dates
+
         return all_dates
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _get_pending_dates(self, context: Context | None) -> list[dict]:
+        """Dates to fetch this run: everything from the bookmark onward, plus
+        any dates quarantined by a previous run (which sit behind the
+        bookmark and would otherwise never be retried)."""
         dates_dict = self._get_dates_dict()
         starting_date = self.get_starting_timestamp(context)
         # `get_starting_timestamp` returns None on cold start (no bookmark and
@@ -858,9 +2201,78 @@ class IncrementalDateStream(FmpSurrogateKeyStream):
         else:
             filtered_dates = [d for d in dates_dict if d["date"] >= starting_date]
 
-        for date_dict in filtered_dates:
-            self.query_params.update(date_dict)
-            yield from super().get_records(context)
+        if self.replication_method == "INCREMENTAL":
+            quarantined = self.get_context_state(context).get("quarantined_dates", [])
+            pending = {d["date"] for d in filtered_dates}
+            filtered_dates = sorted(
+                filtered_dates + [{"date": d} for d in quarantined if d not in pending],
+                key=lambda d: d["date"],
+            )
+        return filtered_dates
+
+    def _fetch_date(self, url: str, date_dict: dict) -> list[dict]:
+        """Worker-thread fetch for one date. Builds its own params dict —
+        `self.query_params` is shared by every in-flight date."""
+        return self._fetch_with_retry(url, {**self.query_params, **date_dict})
+
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Fetch dates concurrently (`other_params.max_workers`, default
+        `_default_max_workers`) and emit them in ascending date order.
+
+        A date that still fails after `_fetch_with_retry`'s backoff is retried
+        once more after the rest of the run, then quarantined in state
+        (`quarantined_dates`) and retried first on the next run. Later dates
+        are not held back by it: the bookmark may move past a quarantined
+        date because the quarantine list, not the bookmark, tracks it."""
+        url = self.get_url(context)
+        max_workers = int(
+            self.other_params.get("max_workers", self._default_max_workers)
+        )
+        failed: list[dict] = []
+
+        for result in ordered_map(
+            lambda d: self._fetch_date(url, d),
+            self._get_pending_dates(context),
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.name}-dates",
+        ):
+            if result.error is not None:
+                self.logger.warning(
+                    f"Stream {self.name}: date {result.item['date']} failed, "
+                    f"will retry after remaining dates. "
+                    f"Error: {self.redact_api_key(result.error)}"
+                )
+                failed.append(result.item)
+                continue
+            yield from self._yield_date_records(result.result, context)
+
+        still_failed = []
+        for date_dict in failed:
+            try:
+                records = self._fetch_date(url, date_dict)
+            except Exception as e:
+                self.logger.error(
+                    f"Stream {self.name}: date {date_dict['date']} failed again, "
+                    f"quarantining for the next run. Error: {self.redact_api_key(e)}"
+                )
+                still_failed.append(date_dict["date"])
+                continue
+            yield from self._yield_date_records(records, context)
+
+        if self.replication_method == "INCREMENTAL":
+            state = self.get_context_state(context)
+            if still_failed:
+                state["quarantined_dates"] = sorted(still_failed)
+            else:
+                state.pop("quarantined_dates", None)
+
+    def _yield_date_records(
+        self, records: list[dict], context: Context | None
+    ) -> t.Iterable[dict]:
+        for record in records:
+            record = self.post_process(record, context)
+            self._check_missing_fields(record)
+            yield record
 
 
 class IncrementalYearStream(FmpSurrogateKeyStream):
@@ -868,6 +2280,8 @@ class IncrementalYearStream(FmpSurrogateKeyStream):
 
     replication_key = "year"
     replication_method = "INCREMENTAL"
+    # First-data-year learning needs the year partitions in order.
+    _partition_workers_safe = False
 
     def _format_replication_key(self, replication_key_value):
         """Convert various year formats to integer year."""
@@ -918,6 +2332,18 @@ class IncrementalYearStream(FmpSurrogateKeyStream):
                 )
 
         all_years = [{"year": y} for y in range(default_start_year, current_year + 1)]
+        # `years: "*"` requests every year (and so re-learns the first year
+        # with data); the default starts at the year learned earlier.
+        default_years = all_years
+        first_data_year = self._get_first_data_year()
+        if first_data_year is not None and first_data_year > default_start_year:
+            default_years = [
+                {"year": y} for y in range(first_data_year, current_year + 1)
+            ]
+        self._empty_year_scan = {
+            "start": default_start_year,
+            "next": default_start_year,
+        }
 
         if other_params:
             years_config = other_params.get("years")
@@ -935,19 +2361,45 @@ class IncrementalYearStream(FmpSurrogateKeyStream):
                 else:
                     raise ValueError(f"Empty years list for stream {self.name}")
             elif years_config is None:
-                return all_years
+                return default_years
             else:
                 raise ValueError(
                     f"Years must be '*', a list, or None, got {type(years_config)} for stream {self.name}"
                 )
         else:
-            return all_years
+            return default_years
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _get_first_data_year(self) -> int | None:
+        tap = getattr(self, "_tap", None)
+        if tap is None or not self.other_params.get("listing_date_bounds", True):
+            return None
+        return get_first_data_year(tap.get_local_store(), self.name)
+
+    def _observe_year(self, year: int, has_data: bool) -> None:
+        """Learn the first year with data from a run that requested every
+        year before it in order and found them empty."""
+        scan = getattr(self, "_empty_year_scan", None)
+        if scan is None or int(year) != scan["next"]:
+            self._empty_year_scan = None
+            return
+        if not has_data:
+            scan["next"] += 1
+            return
+        self._empty_year_scan = None
+        tap = getattr(self, "_tap", None)
+        if int(year) > scan["start"] and tap is not None:
+            set_first_data_year(tap.get_local_store(), self.name, int(year))
+
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         """Update query params with year from context and delegate to parent."""
         if context and "year" in context:
             self.query_params["year"] = context["year"]
-        yield from super().get_records(context)
+        has_data = False
+        for record in super()._fetch_records(context):
+            has_data = True
+            yield record
+        if context and "year" in context:
+            self._observe_year(context["year"], has_data)
 
     def post_process(self, record: dict, context: Context | None = None) -> dict:
         """Inject year into record if not present."""
@@ -963,6 +2415,7 @@ class BaseSymbolYearPartitionStream(CompanySymbolPartitionStream):
 
     replication_method = "INCREMENTAL"
     replication_key = "date"
+    _listing_date_bounded = True
 
     # Configurable class attributes - override in subclasses
     _partition_field_name: str = None  # "quarter" or "period"
@@ -970,7 +2423,8 @@ class BaseSymbolYearPartitionStream(CompanySymbolPartitionStream):
 
     @property
     def partitions(self):
-        """Get symbol + year + quarter/period partition combinations."""
+        """Symbol × year × quarter/period partitions, enumerated lazily (see
+        `tap_fmp.partition_grid`)."""
         query_params = self.query_params
         other_params = self.other_params
 
@@ -997,20 +2451,24 @@ class BaseSymbolYearPartitionStream(CompanySymbolPartitionStream):
             partition_values is not None
         ), f"Must set partition values in meltano.yml or as a stream class attribute for stream {self.name}."
 
-        partitions = []
-        for symbol in symbols:
-            for year in years:
-                for partition_value in partition_values:
-                    partitions.append(
-                        {
-                            "symbol": symbol["symbol"],
-                            "year": year,
-                            self._partition_field_name: partition_value,
-                        }
-                    )
-        return partitions
+        leads = [symbol["symbol"] for symbol in symbols]
+        first_years = {}
+        for symbol in leads:
+            # Exchange variants only: probing the whole universe up front
+            # would cost a request per symbol before the sync starts.
+            listing_bound = self._listing_lower_bound({"symbol": symbol})
+            if listing_bound is not None:
+                first_years[symbol] = listing_bound.year
+        return self._plan_partitions(
+            PartitionGrid(
+                ("symbol", "year", self._partition_field_name),
+                leads,
+                (sorted(set(years)), list(partition_values)),
+                floors=first_years,
+            )
+        )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         """Update query params with year and partition value from context."""
         if context:
             if "year" in context:
@@ -1019,7 +2477,7 @@ class BaseSymbolYearPartitionStream(CompanySymbolPartitionStream):
                 self.query_params[self._partition_field_name] = context[
                     self._partition_field_name
                 ]
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
     def post_process(self, record: dict, context: Context | None = None) -> dict:
         """Inject year and partition field into record if not present."""
@@ -0,0 +1,164 @@
+"""Bounded, order-preserving concurrent fetch helpers.
+
+Singer bookmarks assume records arrive in a meaningful order, so concurrency
+in this tap is always "fetch ahead, emit in order": work items are submitted
+to a thread pool a bounded window ahead of the consumer, and results are
+handed back strictly in input order. Worker threads only do I/O and return
+raw payloads; post-processing and record emission stay on the caller's
+thread. The exception is `prefetch_iterables`, which runs whole partitions
+(`_fetch_records` included) ahead; emission and state still stay on the
+caller's thread.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+
+
+class OrderedResult(t.NamedTuple, t.Generic[T, R]):
+    item: T
+    result: R | None
+    error: BaseException | None
+
+
+def ordered_map(
+    fn: t.Callable[[T], R],
+    items: t.Iterable[T],
+    max_workers: int,
+    max_in_flight: int | None = None,
+    thread_name_prefix: str = "tap-fmp",
+) -> t.Iterator[OrderedResult[T, R]]:
+    """Apply `fn` to `items` concurrently, yielding results in input order.
+
+    At most `max_in_flight` (default ``2 * max_workers``) items are submitted
+    ahead of the consumer, which bounds memory to that many buffered results.
+    Exceptions are captured per item rather than raised, so one failed item
+    never discards results already downloaded for its neighbours — the caller
+    decides whether to retry, quarantine or re-raise.
+
+    With ``max_workers <= 1`` items run inline on the calling thread (same
+    ordering and error semantics, no pool).
+    """
+    if max_workers <= 1:
+        for item in items:
+            try:
+                yield OrderedResult(item, fn(item), None)
+            except Exception as e:  # noqa: BLE001 - surfaced to the caller
+                yield OrderedResult(item, None, e)
+        return
+
+    window = max(max_in_flight or 2 * max_workers, max_workers)
+    iterator = iter(items)
+    pending: deque[tuple[T, Future]] = deque()
+    pool = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=thread_name_prefix
+    )
+
+    def _submit_next() -> None:
+        for item in iterator:
+            pending.append((item, pool.submit(fn, item)))
+            return
+
+    try:
+        for _ in range(window):
+            _submit_next()
+        while pending:
+            item, future = pending.popleft()
+            try:
+                result, error = future.result(), None
+            except Exception as e:  # noqa: BLE001 - surfaced to the caller
+                result, error = None, e
+            # Refill before handing control back so the pool keeps working
+            # while the consumer processes this result.
+            _submit_next()
+            yield OrderedResult(item, result, error)
+    finally:
+        # Consumer stopped early (exception / generator closed): don't block
+        # on queued work whose results nobody will read.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_END = object()
+
+
+def prefetch_iterables(
+    fn: t.Callable[[T], t.Iterable[R]],
+    items: t.Iterable[T],
+    max_workers: int,
+    max_buffered: int = 1000,
+    thread_name_prefix: str = "tap-fmp",
+) -> t.Iterator[tuple[T, t.Iterator[R]]]:
+    """Run the iterables `fn(item)` concurrently, yielding `(item, values)`
+    pairs in input order.
+
+    Up to `max_workers` items run at once: the one being consumed and the
+    next ones. Each item's values pass through a queue holding at most
+    `max_buffered` of them, so a worker that gets ahead blocks instead of
+    buffering a whole partition. An exception raised by `fn` is re-raised
+    from `values` at the point the consumer reaches it. When the consumer
+    moves to the next pair, the previous item's unread values are discarded
+    and its worker is stopped.
+    """
+    cancelled = threading.Event()
+    iterator = iter(items)
+    pending: deque[tuple[T, queue.Queue, threading.Event]] = deque()
+    pool = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=thread_name_prefix
+    )
+
+    def _put(out: queue.Queue, entry: tuple, stop: threading.Event) -> bool:
+        while not (cancelled.is_set() or stop.is_set()):
+            try:
+                out.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(item: T, out: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for value in fn(item):
+                if not _put(out, (value, None), stop):
+                    return
+        except BaseException as e:  # noqa: BLE001 - surfaced to the consumer
+            _put(out, (_END, e), stop)
+            return
+        _put(out, (_END, None), stop)
+
+    def _values(out: queue.Queue) -> t.Iterator[R]:
+        while True:
+            value, error = out.get()
+            if value is _END:
+                if error is not None:
+                    raise error
+                return
+            yield value
+
+    def _submit_next() -> None:
+        for item in iterator:
+            out: queue.Queue = queue.Queue(maxsize=max(max_buffered, 1))
+            stop = threading.Event()
+            pool.submit(_produce, item, out, stop)
+            pending.append((item, out, stop))
+            return
+
+    try:
+        for _ in range(max(max_workers, 1)):
+            _submit_next()
+        while pending:
+            item, out, stop = pending.popleft()
+            try:
+                yield item, _values(out)
+            finally:
+                stop.set()
+            _submit_next()
+    finally:
+        cancelled.set()
+        pool.shutdown(wait=False, cancel_futures=True)
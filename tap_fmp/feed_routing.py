@@ -0,0 +1,122 @@
+"""Serve per-symbol event streams from their global newest-first feed.
+
+After the initial backfill, insider trades, congressional trades, grade news
+and price-target news still cost one request per symbol per run, while the
+matching ``latest`` feed lists every new event across the universe. A stream
+that declares a `FeedRoute` and runs with
+``other_params.feed_incremental: true`` pages the feed once per run, back to
+the oldest ``refreshed_at`` among its partitions (at most
+``other_params.feed_lookback_days``, default 7, ago), and serves each
+partition the feed rows for its symbol on or after the partition's last
+refresh. Feed rows go through the per-symbol stream's own `post_process`, so
+schema and surrogate keys are identical to a per-symbol fetch; rows seen in
+both are deduplicated downstream by key.
+
+A partition is still fetched per symbol when it has never been refreshed, or
+was refreshed before the oldest feed row read (the feed hit its page cap or
+the lookback). Feed mode only emits new rows, so CDC tombstones and the
+negative-result cache are off for the stream while it is on.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+
+@dataclass(frozen=True)
+class FeedRoute:
+    """Global feed carrying new rows of a per-symbol stream.
+
+    Parameters
+    ----------
+    feed_stream : type
+        Paginated newest-first feed stream (instantiated via
+        `Tap.get_bulk_stream`) returning the same rows as the per-symbol
+        endpoint.
+    timestamp_field : str
+        Field the feed is sorted on, newest first.
+    """
+
+    feed_stream: type
+    timestamp_field: str
+
+
+def _day(value: t.Any) -> str:
+    return str(value or "")[:10]
+
+
+class FeedSnapshot:
+    """One read of a feed, grouped by symbol.
+
+    `covers_from` is the first day the read is complete for: every feed row
+    on or after it was seen.
+    """
+
+    def __init__(
+        self,
+        read_at: datetime,
+        covers_from: str,
+        rows_by_symbol: dict[str, list[dict]],
+        field: str,
+    ) -> None:
+        self.read_at = read_at
+        self.covers_from = covers_from
+        self.rows_by_symbol = rows_by_symbol
+        self._field = field
+
+    def covers(self, refreshed_at: str) -> bool:
+        return _day(refreshed_at) >= self.covers_from
+
+    def take(self, symbol: str, refreshed_at: str) -> list[dict]:
+        """Rows for `symbol` from the day of its last refresh on (that day is
+        read again: day-granular feeds can't tell earlier rows apart). Each
+        symbol is served once per run."""
+        since = _day(refreshed_at)
+        rows = self.rows_by_symbol.pop(symbol, [])
+        return [r for r in rows if _day(r.get(self._field)) >= since]
+
+
+def read_feed(
+    fetch_page: t.Callable[[int], list[dict]],
+    field: str,
+    cutoff: str,
+    max_page: int,
+    max_consecutive_empty: int,
+    read_at: datetime,
+) -> FeedSnapshot:
+    """Page a newest-first feed until a page reaches `cutoff` (a day), the
+    feed runs out, or `max_page` (inclusive) is read."""
+    rows_by_symbol: dict[str, list[dict]] = {}
+    oldest = None
+    complete = False
+    empty = 0
+    for page in range(max_page + 1):
+        records = fetch_page(page)
+        if not isinstance(records, list):
+            break
+        if not records:
+            empty += 1
+            if empty >= max_consecutive_empty:
+                complete = True
+                break
+            continue
+        empty = 0
+        for record in records:
+            day = _day(record.get(field))
+            if day and (oldest is None or day < oldest):
+                oldest = day
+            if record.get("symbol"):
+                rows_by_symbol.setdefault(record["symbol"], []).append(record)
+        if oldest is not None and oldest < cutoff:
+            complete = True
+            break
+    if complete:
+        covers_from = cutoff
+    elif oldest is None:
+        covers_from = "9999-12-31"  # nothing usable was read
+    else:
+        # Cut short: the oldest day read may be partial.
+        covers_from = (date.fromisoformat(oldest) + timedelta(days=1)).isoformat()
+    return FeedSnapshot(read_at, covers_from, rows_by_symbol, field)
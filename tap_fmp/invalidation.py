@@ -0,0 +1,94 @@
+"""Event-driven invalidation of per-symbol partitions.
+
+Refreshing income statements, balance sheets, dividends or splits for the
+whole universe every day is wasteful: only companies that reported, filed or
+had a corporate action changed. A stream that declares `InvalidationFeed`s
+and runs with ``other_params.event_invalidation: true`` reads those global
+feeds (earnings calendar, 8-K filings, dividends and splits calendars) over
+the last ``other_params.invalidation_lookback_days`` (default 35) once per
+run, and refetches a partition only when
+
+* it has no ``refreshed_at`` in state yet (see `refresh_cadence`),
+* it was last refreshed before the lookback window, or
+* its symbol had an event on or after the day of its last refresh, up to
+  the feed's ``settle_days`` (FMP fills in the data a few days after the
+  event, so partitions keep refreshing for that long).
+
+If a feed can't be read, every partition is refetched for that run.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+DEFAULT_LOOKBACK_DAYS = 35
+
+
+@dataclass(frozen=True)
+class InvalidationFeed:
+    """A global feed whose rows mark a symbol's partitions as stale.
+
+    Parameters
+    ----------
+    stream : type
+        Date-windowed feed stream (instantiated via `Tap.get_bulk_stream`).
+    date_fields : tuple of str
+        Record fields (snake_case) holding event dates; any of them counts.
+    settle_days : int
+        Days after an event during which the symbol keeps being refreshed.
+    """
+
+    stream: type
+    date_fields: tuple[str, ...] = ("date",)
+    settle_days: int = 0
+
+
+def _day(value: t.Any) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+class EventIndex:
+    """Per symbol, the last day its partitions must be refreshed on."""
+
+    def __init__(self, since: date, stale_until: dict[str, date]) -> None:
+        self.since = since
+        self.stale_until = stale_until
+
+    @classmethod
+    def from_rows(
+        cls,
+        since: date,
+        today: date,
+        feed_rows: t.Iterable[tuple[InvalidationFeed, t.Iterable[dict]]],
+    ) -> EventIndex:
+        """Index `(feed, rows)` pairs. Events after `today` (scheduled
+        earnings, future ex-dates) have not happened yet and are ignored."""
+        stale_until: dict[str, date] = {}
+        for feed, rows in feed_rows:
+            settle = timedelta(days=feed.settle_days)
+            for row in rows:
+                symbol = row.get("symbol")
+                if not symbol:
+                    continue
+                for field in feed.date_fields:
+                    day = _day(row.get(field))
+                    if day is None or day > today:
+                        continue
+                    until = day + settle
+                    if until > stale_until.get(symbol, date.min):
+                        stale_until[symbol] = until
+        return cls(since, stale_until)
+
+    def is_current(self, symbol: str | None, refreshed_at: str) -> bool:
+        """Whether a partition of `symbol` refreshed at `refreshed_at` has
+        seen every event since."""
+        refreshed = datetime.fromisoformat(refreshed_at).date()
+        if symbol is None or refreshed < self.since:
+            return False
+        until = self.stale_until.get(symbol)
+        return until is None or refreshed > until
@@ -0,0 +1,136 @@
+"""Lower bounds for history backfills.
+
+With no bookmark, time-slice streams start at 1970 and year-partitioned
+streams enumerate every year since 1970, so a cold sync of a 2021 IPO spends
+decades of requests on empty windows. `ListingDates` resolves a symbol's
+listing date from, in order:
+
+1. ``ipo_date`` in exchange variants (already loaded for universe filtering);
+2. dates cached in the `LocalStore` by earlier probes;
+3. optionally, a one-request probe of ``/stable/profile``. Its answer,
+   including "unknown", is cached in the store so each symbol is probed once.
+
+Streams that aren't per symbol learn the first year that returned data
+instead (`first_data_year`).
+
+A wrong bound silently drops history, so only equity price and fundamentals
+streams apply listing dates (``_listing_date_bounded``), and every bound is a
+hint that a stream can switch off (``other_params.listing_date_bounds:
+false``). Symbols without a known date are not bounded.
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from datetime import date
+
+import requests
+
+from tap_fmp.local_store import LocalStore
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS listing_dates (
+    symbol TEXT PRIMARY KEY,
+    listing_date TEXT,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS first_data_years (
+    stream TEXT PRIMARY KEY,
+    first_year INTEGER NOT NULL
+);
+"""
+
+
+def parse_listing_date(value: t.Any) -> date | None:
+    """`YYYY-MM-DD[...]` to a date; None for empty or malformed values."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class ListingDates:
+    """Thread-safe symbol → listing date resolver for one tap run.
+
+    Parameters
+    ----------
+    variants_by_symbol : Callable[[], Mapping[str, dict]]
+        Exchange variants keyed by symbol. Called once; may raise
+        RuntimeError when no variants source is configured.
+    store : LocalStore
+    probe : Callable[[str], date | None]
+        Fetches one symbol's listing date from the API. Request errors are
+        not cached.
+    """
+
+    def __init__(
+        self,
+        variants_by_symbol: t.Callable[[], t.Mapping[str, dict]],
+        store: LocalStore,
+        probe: t.Callable[[str], date | None],
+    ) -> None:
+        self._load_variants = variants_by_symbol
+        self._variants: t.Mapping[str, dict] | None = None
+        self._store = store
+        self._probe = probe
+        self._resolved: dict[str, date | None] = {}
+        self._lock = threading.Lock()
+        store.ensure_table("listing_dates", _DDL)
+
+    def _variant_date(self, symbol: str) -> date | None:
+        if self._variants is None:
+            try:
+                self._variants = self._load_variants()
+            except RuntimeError:
+                self._variants = {}
+        return parse_listing_date((self._variants.get(symbol) or {}).get("ipo_date"))
+
+    def get(self, symbol: str, probe: bool = False) -> date | None:
+        """Listing date of `symbol`, or None when unknown. With `probe`, a
+        symbol known nowhere else costs one profile request (once ever)."""
+        with self._lock:
+            if symbol in self._resolved:
+                return self._resolved[symbol]
+            listing = self._variant_date(symbol)
+            if listing is not None:
+                self._resolved[symbol] = listing
+                return listing
+        rows = self._store.query(
+            "SELECT listing_date FROM listing_dates WHERE symbol = ?", (symbol,)
+        )
+        if rows:
+            listing = parse_listing_date(rows[0][0])
+        elif probe:
+            try:
+                listing = self._probe(symbol)
+            except requests.exceptions.RequestException:
+                return None  # not cached: probe again next time
+            self._store.execute(
+                "INSERT OR REPLACE INTO listing_dates "
+                "(symbol, listing_date, source) VALUES (?, ?, ?)",
+                (symbol, listing.isoformat() if listing else None, "profile"),
+            )
+        else:
+            return None
+        with self._lock:
+            self._resolved[symbol] = listing
+        return listing
+
+
+def get_first_data_year(store: LocalStore, stream_name: str) -> int | None:
+    store.ensure_table("listing_dates", _DDL)
+    rows = store.query(
+        "SELECT first_year FROM first_data_years WHERE stream = ?", (stream_name,)
+    )
+    return int(rows[0][0]) if rows else None
+
+
+def set_first_data_year(store: LocalStore, stream_name: str, year: int) -> None:
+    store.ensure_table("listing_dates", _DDL)
+    store.execute(
+        "INSERT OR REPLACE INTO first_data_years (stream, first_year) VALUES (?, ?)",
+        (stream_name, int(year)),
+    )
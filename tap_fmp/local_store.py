@@ -0,0 +1,88 @@
+"""Local sqlite store for tap-side bookkeeping that outlives a run.
+
+Singer state is the wrong home for data that is large (one row per record or
+per window across the whole universe) or that should survive a state reset.
+`LocalStore` is a single sqlite file shared by every stream of a run, and by
+concurrent tap processes pointing at the same path (WAL mode + busy
+timeout). Features own their tables and create them lazily via
+`ensure_table`.
+
+Deleting the file is always safe: every feature built on it degrades to
+"nothing known yet" and refetches/re-emits.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import threading
+import typing as t
+from pathlib import Path
+
+DEFAULT_STORE_DIR = ".tap_fmp"
+DEFAULT_STORE_FILENAME = "local_store.sqlite3"
+
+
+def resolve_store_path(config: t.Mapping[str, t.Any]) -> Path:
+    """`local_store_path` from tap config, else ``.tap_fmp/local_store.sqlite3``
+    under the working directory (the Meltano project root when run by Meltano)."""
+    configured = config.get("local_store_path")
+    if configured:
+        return Path(os.path.expanduser(str(configured)))
+    return Path(DEFAULT_STORE_DIR) / DEFAULT_STORE_FILENAME
+
+
+class LocalStore:
+    """Thread-safe wrapper around one sqlite connection."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._tables: set[str] = set()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=60,
+            isolation_level=None,  # explicit transactions only
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    def ensure_table(self, name: str, ddl: str) -> None:
+        """Run `ddl` (CREATE TABLE/INDEX IF NOT EXISTS ...) once per process."""
+        if name in self._tables:
+            return
+        with self._lock:
+            if name not in self._tables:
+                self._conn.executescript(ddl)
+                self._tables.add(name)
+
+    def query(self, sql: str, params: t.Sequence[t.Any] = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def execute(self, sql: str, params: t.Sequence[t.Any] = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def executemany(self, sql: str, rows: t.Iterable[t.Sequence[t.Any]]) -> None:
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    @contextlib.contextmanager
+    def transaction(self) -> t.Iterator[sqlite3.Connection]:
+        """Hold the store lock for a single write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -69,7 +69,7 @@ class SelectableStreamMixin(ABC):
             "create_record_from_item must be implemented by subclass"
         )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         """Get records with selection logic applied."""
         selected_items = self.get_selected_items_list()
 
@@ -78,7 +78,7 @@ class SelectableStreamMixin(ABC):
                 f"No specific {self.item_name_plural} selected, fetching all {self.item_name_plural} from API..."
             )
             # Fetch directly from API to avoid circular reference
-            yield from super().get_records(context)
+            yield from super()._fetch_records(context)
         else:
             self.logger.info(
                 f"Processing selected {self.item_name_plural}: {selected_items}"
@@ -97,6 +97,7 @@ class BaseSymbolPartitionMixin(ABC):
     config: dict
     _tap: object
     name: str
+    _plan_partitions: t.Callable[[list[dict]], list[dict]]
 
     @abstractmethod
     def _partition_symbols(self) -> list[dict]:
@@ -117,6 +118,11 @@ class BaseSymbolPartitionMixin(ABC):
 
     @property
     def partitions(self):
+        """Symbol partitions for this node, in run order (see
+        `_plan_partitions`)."""
+        return self._plan_partitions(self._symbol_partitions())
+
+    def _symbol_partitions(self) -> list[dict]:
         """Get symbol partitions with validation and fallbacks."""
         if self.selection_config_section and self.selection_field_name:
             selected_symbols = self.config.get(self.selection_config_section, {}).get(
@@ -363,6 +369,12 @@ class BasePriceSchemaMixin:
 class BaseIntervalPriceSchemaMixin(BasePriceSchemaMixin):
     """Base schema for interval price data (OHLC + datetime)."""
 
+    # Multi-year intraday backfills are thousands of few-day windows per
+    # symbol: fetch some ahead (emission stays chronological).
+    _default_max_workers: int = 4
+    # Frequent intraday refreshes only need the bars after the bookmark.
+    _default_tail_follow: bool = True
+
     schema = th.PropertiesList(
         th.Property("symbol", th.StringType, required=True),
         th.Property("date", th.DateTimeType),
@@ -461,6 +473,14 @@ class Prices4HrMixin(BaseIntervalPriceSchemaMixin):
         return f"{self.url_base}/stable/historical-chart/4hour"
 
 
+class UsEquityCalendarMixin:
+    """Gate dates / size windows by the NYSE+NASDAQ trading calendar. Only for
+    session-bound data — crypto, forex and commodities trade through US
+    holidays and weekends."""
+
+    _trading_calendar_exchanges: tuple[str, ...] = ("NYSE", "NASDAQ")
+
+
 class BatchSymbolPartitionMixin(ABC):
     """Mixin for streams that need to partition symbols into chunks for API limits."""
 
@@ -494,11 +514,11 @@ class BatchSymbolPartitionMixin(ABC):
 
         return partitions
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         """Handle batch symbol context and delegate to parent."""
         if context and "symbols" in context:
             self.query_params["symbols"] = context["symbols"]
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class CikConfigMixin(BaseConfigMixin):
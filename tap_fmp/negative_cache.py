@@ -0,0 +1,119 @@
+"""Negative-result cache for sparse per-symbol endpoints.
+
+ESG ratings, executive compensation, congressional trades and analyst grades
+return ``[]`` for most of the universe on every run. Streams with the
+negative cache on record each partition that came back empty in the
+`LocalStore` and skip it on later runs until
+``other_params.negative_cache_ttl_days`` (default 14) have passed since it
+was last checked. Before that, each run still re-probes a random
+``other_params.negative_cache_recheck_rate`` share (default 0.02) of the
+skipped partitions, so new coverage shows up within a few runs and the
+expiries spread out instead of landing on the same day.
+
+A partition that returns data is dropped from the cache. An incremental
+partition that already has a bookmark is never recorded as empty: no new
+rows is not the same as no data. Deleting the store, or
+``other_params.negative_cache: false``, requests everything again.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import typing as t
+from datetime import datetime, timedelta, timezone
+
+from tap_fmp.change_capture import partition_key
+from tap_fmp.local_store import LocalStore
+
+DEFAULT_TTL_DAYS = 14.0
+DEFAULT_RECHECK_RATE = 0.02
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS empty_partitions (
+    stream TEXT NOT NULL,
+    partition_key TEXT NOT NULL,
+    empty_since TEXT NOT NULL,
+    checked_at TEXT NOT NULL,
+    PRIMARY KEY (stream, partition_key)
+);
+"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class NegativeCache:
+    """Known-empty partitions of one stream, loaded once per run.
+
+    Parameters
+    ----------
+    store : LocalStore
+    stream_name : str
+    ttl : timedelta
+        How long an empty result is trusted.
+    recheck_rate : float
+        Probability of re-probing a known-empty partition anyway.
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        stream_name: str,
+        ttl: timedelta,
+        recheck_rate: float,
+        rng: t.Callable[[], float] = random.random,
+    ) -> None:
+        self._store = store
+        self._stream = stream_name
+        self._ttl = ttl
+        self._recheck_rate = recheck_rate
+        self._rng = rng
+        self._lock = threading.Lock()
+        store.ensure_table("empty_partitions", _DDL)
+        self._checked = {
+            key: datetime.fromisoformat(checked_at)
+            for key, checked_at in store.query(
+                "SELECT partition_key, checked_at FROM empty_partitions "
+                "WHERE stream = ?",
+                (stream_name,),
+            )
+        }
+        self.skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._checked)
+
+    def should_skip(self, context: dict | None) -> bool:
+        checked = self._checked.get(partition_key(context))
+        if checked is None or _now() - checked > self._ttl:
+            return False
+        if self._rng() < self._recheck_rate:
+            return False
+        with self._lock:
+            self.skipped += 1
+        return True
+
+    def record(self, context: dict | None, empty: bool) -> None:
+        key = partition_key(context)
+        if not empty:
+            if key in self._checked:
+                self._store.execute(
+                    "DELETE FROM empty_partitions "
+                    "WHERE stream = ? AND partition_key = ?",
+                    (self._stream, key),
+                )
+                with self._lock:
+                    self._checked.pop(key, None)
+            return
+        now = _now()
+        self._store.execute(
+            "INSERT INTO empty_partitions "
+            "(stream, partition_key, empty_since, checked_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (stream, partition_key) "
+            "DO UPDATE SET checked_at = excluded.checked_at",
+            (self._stream, key, now.isoformat(), now.isoformat()),
+        )
+        with self._lock:
+            self._checked[key] = now
@@ -0,0 +1,163 @@
+"""Per-partition cost history and longest-first scheduling.
+
+Partitions otherwise run in symbol order, so one heavy symbol late in the
+list stretches the end of the run while look-ahead threads (and
+``--workers`` processes) sit idle. With ``cost_scheduling: true`` (tap
+config, or per stream under ``other_params``) every completed partition's
+requests, response bytes and request seconds are recorded in the
+`LocalStore`, smoothed across runs, and the next run orders partitions
+longest-processing-time first. Partitions without history count as the
+heaviest: they are usually first backfills.
+
+A priority class runs before everything else, in cost order among itself:
+``priority_symbols`` (a list) and/or the ``priority_top_market_cap``
+largest companies by market cap from the company screener.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+from datetime import datetime, timezone
+
+from tap_fmp.change_capture import partition_key
+from tap_fmp.local_store import LocalStore
+from tap_fmp.partition_grid import PartitionGrid
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS partition_costs (
+    stream TEXT NOT NULL,
+    partition_key TEXT NOT NULL,
+    requests REAL NOT NULL,
+    bytes REAL NOT NULL,
+    seconds REAL NOT NULL,
+    runs INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (stream, partition_key)
+);
+"""
+
+# Weight of the latest run in the smoothed cost.
+SMOOTHING = 0.5
+
+
+class CostMeter:
+    """Requests, bytes and seconds spent on one partition. Updated by the
+    thread that runs the partition's requests."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, nbytes: int = 0, seconds: float = 0.0, requests: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.bytes += nbytes
+            self.seconds += seconds
+
+
+class PartitionCosts:
+    """Cost history of one stream's partitions.
+
+    Costs are loaded once, so the partition order stays fixed for the run
+    while new measurements are written back for the next one.
+    """
+
+    def __init__(self, store: LocalStore, stream_name: str) -> None:
+        self._store = store
+        self._stream = stream_name
+        store.ensure_table("partition_costs", _DDL)
+        self._costs: dict[str, tuple[float, float, float, int]] = {
+            key: (requests, nbytes, seconds, runs)
+            for key, requests, nbytes, seconds, runs in store.query(
+                "SELECT partition_key, requests, bytes, seconds, runs "
+                "FROM partition_costs WHERE stream = ?",
+                (stream_name,),
+            )
+        }
+
+    def seconds(self, context: dict | None) -> float | None:
+        cost = self._costs.get(partition_key(context))
+        return None if cost is None else cost[2]
+
+    def record(self, context: dict | None, meter: CostMeter) -> None:
+        key = partition_key(context)
+        observed = (float(meter.requests), float(meter.bytes), meter.seconds)
+        previous = self._costs.get(key)
+        if previous is None:
+            smoothed, runs = observed, 1
+        else:
+            smoothed = tuple(
+                SMOOTHING * new + (1 - SMOOTHING) * old
+                for new, old in zip(observed, previous[:3])
+            )
+            runs = previous[3] + 1
+        self._store.execute(
+            "INSERT OR REPLACE INTO partition_costs "
+            "(stream, partition_key, requests, bytes, seconds, runs, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self._stream,
+                key,
+                *smoothed,
+                runs,
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ),
+        )
+
+    def schedule(
+        self, partitions: t.Iterable[dict], priority: t.Container[str] = ()
+    ) -> t.Sequence[dict]:
+        """Priority symbols first, then longest-processing-time first within
+        each class. Ties (and unknown costs) keep their original order.
+
+        A `PartitionGrid` is ordered by its leading axis instead (each
+        symbol's partitions stay together, ranked by their total cost), so
+        it stays lazy."""
+        if isinstance(partitions, PartitionGrid):
+            return self._schedule_grid(partitions, priority)
+
+        def rank(item: tuple[int, dict]) -> tuple[int, float, int]:
+            index, partition = item
+            seconds = self.seconds(partition)
+            return (
+                0 if partition.get("symbol") in priority else 1,
+                -(float("inf") if seconds is None else seconds),
+                index,
+            )
+
+        return [p for _, p in sorted(enumerate(partitions), key=rank)]
+
+    def _schedule_grid(
+        self, grid: PartitionGrid, priority: t.Container[str]
+    ) -> PartitionGrid:
+        lead_key = grid.keys[0]
+        totals: dict[t.Any, float] = {}
+        for key, cost in self._costs.items():
+            lead = json.loads(key).get(lead_key)
+            totals[lead] = totals.get(lead, 0.0) + cost[2]
+
+        def rank(item: tuple[int, t.Any]) -> tuple[int, float, int]:
+            index, lead = item
+            return (
+                0 if lead_key == "symbol" and lead in priority else 1,
+                -totals.get(lead, float("inf")),
+                index,
+            )
+
+        return grid.with_leads(
+            lead for _, lead in sorted(enumerate(grid.leads), key=rank)
+        )
+
+
+def top_market_cap_symbols(companies: t.Iterable[dict], count: int) -> set[str]:
+    """The `count` largest companies by ``market_cap`` (screener records)."""
+    ranked = sorted(
+        (c for c in companies if c.get("symbol") and c.get("market_cap")),
+        key=lambda c: float(c["market_cap"]),
+        reverse=True,
+    )
+    return {c["symbol"] for c in ranked[:count]}
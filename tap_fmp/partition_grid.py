@@ -0,0 +1,133 @@
+"""Lazily enumerated cross-product partitions.
+
+Symbol × year × quarter (and CIK × year × quarter, symbol × period × year)
+partition lists run to millions of dicts for the full universe, costing
+seconds and hundreds of MB every time the SDK reads `stream.partitions`
+(state reset, sync, state finalisation). `PartitionGrid` keeps only the axes:
+the symbols (or CIKs), the small grid of inner values shared by all of them,
+and an optional per-symbol lower bound on the first inner axis (listing
+year) in an `array`. Partitions are built as dicts one at a time on
+iteration or indexing.
+
+The grid is an ordinary read-only sequence, so the SDK and state handling
+(`state_partitioning_keys` included) see the same contexts as with a list.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import typing as t
+from array import array
+from collections.abc import Sequence
+
+
+class PartitionGrid(Sequence):
+    """Partitions ``{keys[0]: lead, keys[1]: a, keys[2]: b, ...}`` for every
+    lead value and every combination of the inner axes, in that order.
+
+    Parameters
+    ----------
+    keys : Sequence[str]
+        Context field names: the leading key (``symbol``/``cik``), then one
+        per inner axis.
+    leads : Iterable
+        Leading values (symbols or CIKs).
+    inner_axes : Sequence[Sequence]
+        Values of each inner axis.
+    floors : Mapping[lead, value] | None
+        Per-lead minimum of the first inner axis (e.g. listing year); that
+        axis must then be sorted ascending. Leads without a floor are
+        unbounded.
+    """
+
+    def __init__(
+        self,
+        keys: t.Sequence[str],
+        leads: t.Iterable,
+        inner_axes: t.Sequence[t.Sequence],
+        floors: t.Mapping[t.Any, t.Any] | None = None,
+    ) -> None:
+        self.keys = tuple(keys)
+        self._inner = list(itertools.product(*inner_axes))
+        self._inner_index = {combo: j for j, combo in enumerate(self._inner)}
+        first_axis = [combo[0] for combo in self._inner]
+        if floors and first_axis != sorted(first_axis):
+            raise ValueError("floors need the first inner axis sorted ascending")
+        self._floors = dict(floors or {})
+        self._first_axis = first_axis
+        self._set_leads(list(leads))
+
+    def _set_leads(self, leads: list) -> None:
+        self.leads = leads
+        self._starts = array("i")
+        self._offsets = array("q", [0])
+        for lead in leads:
+            floor = self._floors.get(lead)
+            start = 0 if floor is None else bisect.bisect_left(self._first_axis, floor)
+            self._starts.append(start)
+            self._offsets.append(self._offsets[-1] + len(self._inner) - start)
+        self._positions: dict | None = None
+
+    def with_leads(self, leads: t.Iterable) -> PartitionGrid:
+        """The same grid over `leads` (a subset or reordering)."""
+        grid = PartitionGrid.__new__(PartitionGrid)
+        grid.keys = self.keys
+        grid._inner = self._inner
+        grid._inner_index = self._inner_index
+        grid._floors = self._floors
+        grid._first_axis = self._first_axis
+        grid._set_leads(list(leads))
+        return grid
+
+    def _partition(self, lead_index: int, inner_index: int) -> dict:
+        return dict(zip(self.keys, (self.leads[lead_index], *self._inner[inner_index])))
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("partition index out of range")
+        lead_index = bisect.bisect_right(self._offsets, index) - 1
+        inner_index = self._starts[lead_index] + index - self._offsets[lead_index]
+        return self._partition(lead_index, inner_index)
+
+    def __iter__(self) -> t.Iterator[dict]:
+        for lead_index in range(len(self.leads)):
+            for inner_index in range(self._starts[lead_index], len(self._inner)):
+                yield self._partition(lead_index, inner_index)
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        position = self._locate(value)
+        if (
+            position is None
+            or position < start
+            or (stop is not None and position >= stop)
+        ):
+            raise ValueError(f"{value!r} is not a partition of this grid")
+        return position
+
+    def __contains__(self, value) -> bool:
+        return self._locate(value) is not None
+
+    def _locate(self, value) -> int | None:
+        if not isinstance(value, dict) or set(value) != set(self.keys):
+            return None
+        if self._positions is None:
+            self._positions = {}
+            for i, lead in enumerate(self.leads):
+                self._positions.setdefault(lead, i)
+        lead_index = self._positions.get(value[self.keys[0]])
+        inner_index = self._inner_index.get(tuple(value[k] for k in self.keys[1:]))
+        if (
+            lead_index is None
+            or inner_index is None
+            or inner_index < self._starts[lead_index]
+        ):
+            return None
+        return self._offsets[lead_index] + inner_index - self._starts[lead_index]
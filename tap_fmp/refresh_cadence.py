@@ -0,0 +1,65 @@
+"""Per-stream refresh cadence for slow-changing per-symbol data.
+
+Executives, employee counts, notes, peers and ESG ratings change monthly or
+yearly, yet every run that selects them refetches the whole universe. A
+stream with a refresh interval (``other_params.refresh_every``, e.g.
+``"30d"``; off by default) records when each
+partition was last fetched in its partition state (``refreshed_at``) and
+skips partitions refreshed within the interval, so one daily schedule can
+select everything and each partition is requested about once per interval.
+
+When a state partition covers several sync partitions
+(``state_partitioning_keys``), it keeps one refresh time per sync partition
+instead, keyed by `partition_key` under ``partition_refreshed_at``.
+
+Without ``refresh_every`` (or with ``null`` or ``0``) every partition is
+refetched on every run.
+"""
+
+from __future__ import annotations
+
+import re
+import typing as t
+from datetime import datetime, timedelta
+
+from singer_sdk.exceptions import ConfigValidationError
+
+REFRESHED_AT_KEY = "refreshed_at"
+PARTITION_REFRESHED_AT_KEY = "partition_refreshed_at"
+
+_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+_INTERVAL = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([mhdw])\s*$")
+
+
+def parse_interval(value: t.Any) -> timedelta | None:
+    """``"30d"``/``"12h"``/``"2w"``/``"90m"`` or a number of days → timedelta;
+    None when refreshing is unconditional."""
+    if value is None or value == 0 or value == "0":
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(days=value) if value > 0 else None
+    match = _INTERVAL.match(str(value))
+    if not match:
+        raise ConfigValidationError(
+            f"Invalid refresh_every {value!r}: expected e.g. '30d', '12h', '2w'."
+        )
+    amount = float(match.group(1))
+    return timedelta(**{_UNITS[match.group(2)]: amount}) if amount else None
+
+
+def merge_refreshes(a: dict, b: dict) -> dict:
+    """Per-partition refresh times of two copies of one state partition,
+    keeping the later time of each."""
+    merged = dict(a)
+    for key, refreshed_at in b.items():
+        if refreshed_at > merged.get(key, ""):
+            merged[key] = refreshed_at
+    return merged
+
+
+def is_fresh(refreshed_at: str | None, every: timedelta, now: datetime) -> bool:
+    """Whether a partition last refreshed at `refreshed_at` is still within
+    its interval."""
+    if not refreshed_at:
+        return False
+    return now - datetime.fromisoformat(refreshed_at) < every
@@ -0,0 +1,190 @@
+"""Deterministic universe sharding across nodes.
+
+With ``shard_count: N`` and ``shard_index: i`` (tap config, or per stream
+under ``other_params``), a symbol- or CIK-partitioned stream keeps only the
+partitions whose symbol (or CIK) hashes to shard ``i``. The hash is SHA-1 of
+the key, so every node computes the same split without a coordination
+service, and a symbol stays on its shard as the universe grows or shrinks.
+Partitions of one symbol (years, quarters, periods, timeframes) always land
+on the same shard.
+
+Each shard emits its own Singer state. `merge_states` (also
+``python -m tap_fmp.sharding merge STATE...``) combines them into one state
+for a later unsharded run, or a run with a different shard count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import typing as t
+from datetime import datetime, timezone
+
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_fmp.partition_grid import PartitionGrid
+from tap_fmp.refresh_cadence import PARTITION_REFRESHED_AT_KEY, merge_refreshes
+
+SHARD_KEYS = ("symbol", "cik")
+
+
+def shard_of(key: t.Any, shard_count: int) -> int:
+    digest = hashlib.sha1(str(key).strip().upper().encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def resolve_shard(
+    shard_index: t.Any, shard_count: t.Any, stream_name: str
+) -> tuple[int, int] | None:
+    """Validated ``(index, count)``, or None when sharding is off."""
+    if shard_index is None and shard_count is None:
+        return None
+    try:
+        index, count = int(shard_index), int(shard_count)
+    except (TypeError, ValueError):
+        raise ConfigValidationError(
+            f"Stream {stream_name}: shard_index and shard_count must both be "
+            f"integers (got {shard_index!r}, {shard_count!r})."
+        )
+    if count < 1 or not 0 <= index < count:
+        raise ConfigValidationError(
+            f"Stream {stream_name}: shard_index must be in [0, shard_count) "
+            f"(got {index}, {count})."
+        )
+    return None if count == 1 else (index, count)
+
+
+def shard_partitions(
+    partitions: t.Iterable[dict], shard_index: int, shard_count: int
+) -> t.Sequence[dict]:
+    """Partitions whose symbol/CIK hashes to `shard_index`. Partitions
+    without either key are kept on shard 0 only. A `PartitionGrid` is
+    sharded on its leading axis and stays lazy."""
+    if isinstance(partitions, PartitionGrid) and partitions.keys[0] in SHARD_KEYS:
+        return partitions.with_leads(
+            lead
+            for lead in partitions.leads
+            if (shard_of(lead, shard_count) if lead else 0) == shard_index
+        )
+    kept = []
+    for partition in partitions:
+        key = next((partition[k] for k in SHARD_KEYS if partition.get(k)), None)
+        shard = 0 if key is None else shard_of(key, shard_count)
+        if shard == shard_index:
+            kept.append(partition)
+    return kept
+
+
+def _context_key(entry: dict) -> str:
+    return json.dumps(entry.get("context") or {}, sort_keys=True, default=str)
+
+
+def _bookmark_order(value: t.Any) -> tuple[int, t.Any]:
+    """Sort key for a replication key value: numbers numerically, ISO dates
+    and datetimes chronologically (naive ones as UTC), anything else as text.
+    The leading rank keeps values of different kinds comparable."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    text = str(value)
+    try:
+        return (0, float(text))
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return (2, text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (1, parsed)
+
+
+def _newer(a: dict, b: dict) -> dict:
+    """The partition state with the later bookmark (falling back to the one
+    that has a bookmark at all, then to the later `refreshed_at`)."""
+    va, vb = a.get("replication_key_value"), b.get("replication_key_value")
+    if va is None and vb is None:
+        ra, rb = a.get("refreshed_at") or "", b.get("refreshed_at") or ""
+        return a if ra > rb else b
+    if va is None:
+        return b
+    if vb is None:
+        return a
+    return b if _bookmark_order(vb) > _bookmark_order(va) else a
+
+
+def _merge_entries(a: dict, b: dict) -> dict:
+    """`_newer` of two copies of one state entry, keeping every partition's
+    latest refresh time from both (see `refresh_cadence`)."""
+    newer = _newer(a, b)
+    refreshes = merge_refreshes(
+        a.get(PARTITION_REFRESHED_AT_KEY, {}), b.get(PARTITION_REFRESHED_AT_KEY, {})
+    )
+    return {**newer, PARTITION_REFRESHED_AT_KEY: refreshes} if refreshes else newer
+
+
+def merge_states(states: t.Iterable[dict]) -> dict:
+    """Merge Singer states from shards of the same tap.
+
+    Partition bookmarks are unioned by context. When two states hold the same
+    partition (e.g. after a shard count change), or the same unpartitioned
+    stream, the later bookmark wins; per-partition refresh times are
+    unioned. Meltano's ``{"singer_state": ...}``
+    envelope is accepted and preserved.
+    """
+    states = list(states)
+    streams: dict[str, tuple[dict, dict[str, dict]]] = {}
+    for state in states:
+        bookmarks = state.get("singer_state", state).get("bookmarks", {})
+        for stream, stream_state in bookmarks.items():
+            top = {k: v for k, v in stream_state.items() if k != "partitions"}
+            if stream in streams:
+                merged_top, partitions = streams[stream]
+                top = _merge_entries(merged_top, top)
+            else:
+                partitions = {}
+            streams[stream] = (top, partitions)
+            for entry in stream_state.get("partitions", []):
+                ctx = _context_key(entry)
+                partitions[ctx] = (
+                    _merge_entries(partitions[ctx], entry)
+                    if ctx in partitions
+                    else entry
+                )
+
+    bookmarks = {}
+    for stream, (top, partitions) in streams.items():
+        bookmarks[stream] = dict(top)
+        if partitions:
+            bookmarks[stream]["partitions"] = [
+                partitions[k] for k in sorted(partitions)
+            ]
+    merged = {"bookmarks": bookmarks}
+    if any("singer_state" in s for s in states):
+        return {"singer_state": merged}
+    return merged
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tap_fmp.sharding",
+        description="Merge per-shard Singer state files into one state.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    merge = sub.add_parser("merge", help="merge state files, write to stdout")
+    merge.add_argument("states", nargs="+", help="state JSON files, one per shard")
+    args = parser.parse_args(argv)
+
+    states = []
+    for path in args.states:
+        with open(path) as f:
+            states.append(json.load(f))
+    json.dump(merge_states(states), sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Graceful SIGTERM handling.
+
+Preemptible workers get a SIGTERM and a short grace period before they are
+killed. Dying mid-window loses everything since the last STATE message, so
+the tap instead records the request, lets the in-flight unit of work (a
+time-slice window, a bulk cell, a partition) finish, flushes state and
+stops with `ShutdownRequested`. A second SIGTERM kills the process
+immediately.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import signal
+import threading
+import typing as t
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownRequested(SystemExit):
+    """Raised at a safe point after SIGTERM, once state has been flushed.
+
+    A `SystemExit` so it passes through the SDK's per-stream `except
+    Exception` handlers (which would log it as a stream failure); `TapFMP`
+    catches it and exits cleanly."""
+
+    def __init__(self) -> None:
+        super().__init__(0)
+
+
+@contextlib.contextmanager
+def sigterm_requests(event: threading.Event) -> t.Iterator[threading.Event]:
+    """Set `event` on the first SIGTERM while the block runs; restore the
+    previous handler on exit. A no-op off the main thread, where Python
+    doesn't allow installing signal handlers."""
+    if threading.current_thread() is not threading.main_thread():
+        yield event
+        return
+
+    def _handle(signum, frame):
+        if event.is_set():
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+        logger.warning(
+            "SIGTERM received: finishing the in-flight window, then flushing "
+            "state and exiting. Send SIGTERM again to exit immediately."
+        )
+        event.set()
+
+    previous = signal.signal(signal.SIGTERM, _handle)
+    try:
+        yield event
+    finally:
+        signal.signal(signal.SIGTERM, previous)
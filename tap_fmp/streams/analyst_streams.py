@@ -8,6 +8,12 @@ from tap_fmp.client import (
     FmpSurrogateKeyStream,
     CompanySymbolPartitionStream,
 )
+from tap_fmp.bulk_planner import BulkRoute
+from tap_fmp.feed_routing import FeedRoute
+from tap_fmp.streams.bulk_streams import (
+    PriceTargetSummaryBulkStream,
+    StockRatingBulkStream,
+)
 
 from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
@@ -82,6 +88,8 @@ class AnalystEstimatesStream(SymbolPeriodPartitionStream):
 
 class RatingSnapshotStream(CompanySymbolPartitionStream):
     name = "rating_snapshot"
+    # rating-bulk has no `overall_score`: opt-in only (`source: bulk`).
+    _bulk_route = BulkRoute(StockRatingBulkStream, exact=False)
     schema = th.PropertiesList(
         th.Property("symbol", th.StringType, required=True),
         th.Property("rating", th.StringType),
@@ -125,6 +133,9 @@ class PriceTargetSummaryStream(CompanySymbolPartitionStream):
     name = "price_target_summary"
     primary_keys = ["surrogate_key"]
     _add_surrogate_key = True
+    # The bulk CSV flattens `publishers` differently from the JSON list, which
+    # changes surrogate keys: opt-in only (`source: bulk`).
+    _bulk_route = BulkRoute(PriceTargetSummaryBulkStream, exact=False)
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -171,11 +182,17 @@ class PriceTargetConsensusStream(CompanySymbolPartitionStream):
         return f"{self.url_base}/stable/price-target-consensus"
 
 
-class PriceTargetNewsStream(CompanySymbolPartitionStream):
-    name = "price_target_news"
-    primary_keys = ["surrogate_key"]
+class PriceTargetLatestNewsStream(FmpSurrogateKeyStream):
+    """Stream for price target latest news."""
+
+    name = "price_target_latest_news"
+    replication_key = "published_date"
+    replication_method = "INCREMENTAL"
+    is_timestamp_replication_key = True
     _paginate = True
-    _add_surrogate_key = True
+    _max_pages = 100
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -193,18 +210,16 @@ class PriceTargetNewsStream(CompanySymbolPartitionStream):
     ).to_dict()
 
     def get_url(self, context: Context) -> str:
-        return f"{self.url_base}/stable/price-target-news"
+        return f"{self.url_base}/stable/price-target-latest-news"
 
 
-class PriceTargetLatestNewsStream(FmpSurrogateKeyStream):
-    """Stream for price target latest news."""
-
-    name = "price_target_latest_news"
-    replication_key = "published_date"
-    replication_method = "INCREMENTAL"
-    is_timestamp_replication_key = True
+class PriceTargetNewsStream(CompanySymbolPartitionStream):
+    name = "price_target_news"
+    primary_keys = ["surrogate_key"]
     _paginate = True
-    _max_pages = 100
+    _add_surrogate_key = True
+    # `feed_incremental`: new rows come from the latest-news feed.
+    _feed_route = FeedRoute(PriceTargetLatestNewsStream, "published_date")
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -222,7 +237,7 @@ class PriceTargetLatestNewsStream(FmpSurrogateKeyStream):
     ).to_dict()
 
     def get_url(self, context: Context) -> str:
-        return f"{self.url_base}/stable/price-target-latest-news"
+        return f"{self.url_base}/stable/price-target-news"
 
 
 class StockGradesStream(CompanySymbolPartitionStream):
@@ -230,6 +245,7 @@ class StockGradesStream(CompanySymbolPartitionStream):
 
     name = "stock_grades"
     primary_keys = ["surrogate_key"]
+    _default_negative_cache = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -252,6 +268,7 @@ class HistoricalStockGradesStream(CompanySymbolPartitionStream):
 
     name = "historical_stock_grades"
     primary_keys = ["surrogate_key"]
+    _default_negative_cache = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -275,6 +292,7 @@ class StockGradesConsensusStream(CompanySymbolPartitionStream):
 
     name = "stock_grades_consensus"
     primary_keys = ["surrogate_key"]
+    _default_negative_cache = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -293,12 +311,18 @@ class StockGradesConsensusStream(CompanySymbolPartitionStream):
         return f"{self.url_base}/stable/grades-consensus"
 
 
-class StockGradeNewsStream(CompanySymbolPartitionStream):
-    """Stream for stock grade news."""
+class StockGradeLatestNewsStream(FmpRestStream):
+    """Stream for stock grade latest news."""
 
-    name = "stock_grades_news"
-    primary_keys = ["surrogate_key"]
+    name = "stock_grades_latest_news"
+    replication_key = "published_date"
+    replication_method = "INCREMENTAL"
+    is_timestamp_replication_key = True
+    _add_surrogate_key = True
     _paginate = True
+    _max_pages = 100
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -315,22 +339,19 @@ class StockGradeNewsStream(CompanySymbolPartitionStream):
         th.Property("price_when_posted", th.NumberType),
     ).to_dict()
 
-    _add_surrogate_key = True
-
     def get_url(self, context: Context) -> str:
-        return f"{self.url_base}/stable/grades-news"
+        return f"{self.url_base}/stable/grades-latest-news"
 
 
-class StockGradeLatestNewsStream(FmpRestStream):
-    """Stream for stock grade latest news."""
+class StockGradeNewsStream(CompanySymbolPartitionStream):
+    """Stream for stock grade news."""
 
-    name = "stock_grades_latest_news"
-    replication_key = "published_date"
-    replication_method = "INCREMENTAL"
-    is_timestamp_replication_key = True
-    _add_surrogate_key = True
+    name = "stock_grades_news"
+    primary_keys = ["surrogate_key"]
+    _default_negative_cache = True
     _paginate = True
-    _max_pages = 100
+    # `feed_incremental`: new rows come from the latest-news feed.
+    _feed_route = FeedRoute(StockGradeLatestNewsStream, "published_date")
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -347,5 +368,7 @@ class StockGradeLatestNewsStream(FmpRestStream):
         th.Property("price_when_posted", th.NumberType),
     ).to_dict()
 
+    _add_surrogate_key = True
+
     def get_url(self, context: Context) -> str:
-        return f"{self.url_base}/stable/grades-latest-news"
+        return f"{self.url_base}/stable/grades-news"
@@ -6,6 +6,7 @@ import typing as t
 from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
 from tap_fmp.client import FmpSurrogateKeyStream, IncrementalDateStream
+from tap_fmp.concurrency import ordered_map
 from datetime import datetime
 from singer_sdk.exceptions import ConfigValidationError
 from decimal import Decimal
@@ -13,6 +14,8 @@ from decimal import Decimal
 
 class BaseBulkStream(FmpSurrogateKeyStream):
     _expect_csv = True
+    # Parts and cells checkpoint state as they complete.
+    _partition_workers_safe = False
 
     _decimal_fields = None
     _float_fields = None
@@ -77,19 +80,19 @@ class PaginatedBulkStream(BaseBulkStream):
 
         return parts
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         parts = self._get_parts()
         if parts:
             for part in parts:
                 self.query_params.update({"part": part})
-                yield from super().get_records(context)
+                yield from super()._fetch_records(context)
         else:
             if self.replication_method == "INCREMENTAL":
                 state = self.get_context_state(context)
                 if state.get("replication_key_value"):
                     starting_part = int(state["replication_key_value"])
                     self.query_params["part"] = starting_part
-            yield from super().get_records(context)
+            yield from super()._fetch_records(context)
 
     def post_process(self, row: dict, context: Context | None = None) -> dict:
         row["_part"] = self.query_params["part"]
@@ -141,25 +144,121 @@ class IncrementalYearPeriodStream(BaseBulkStream):
 
         return periods
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
-        year_range = self._get_year_range()
+    @staticmethod
+    def _cell_key(cell: dict) -> str:
+        return f"{cell['year']}-{cell['period']}"
+
+    def _get_pending_cells(self, context: Context | None) -> list[dict]:
+        """(year, period) cells to download this run, in ascending order.
+
+        - Years before the bookmark year are skipped (incremental runs).
+        - Historical cells already in `completed_cells` are skipped, so FULL_TABLE
+          reruns and crashed backfills don't re-download them. Cells within
+          `other_params.refetch_recent_years` (default 2: current + previous
+          year) are always refetched because filings keep landing there.
+          `other_params.force_refetch: true` ignores `completed_cells`.
+        - `quarantined_cells` from a previous run are always retried.
+        """
+        other_params = self.stream_config.get("other_params", {})
         starting_date = self.get_starting_timestamp(context)
-
-        filtered_years = [
-            y
-            for y in year_range
-            if y >= max(datetime.fromisoformat(starting_date).year, 1990)
-        ]
+        min_year = 1990
+        if starting_date:
+            min_year = max(datetime.fromisoformat(starting_date).year, min_year)
 
         periods = self._get_periods()
+        cells = [
+            {"year": int(y), "period": p}
+            for y in self._get_year_range()
+            if int(y) >= min_year
+            for p in periods
+        ]
 
-        updated_query_params = [
-            {"year": y, "period": p} for y in filtered_years for p in periods
+        state = self.get_context_state(context)
+        recent_years = int(other_params.get("refetch_recent_years", 2))
+        first_recent_year = datetime.today().year - recent_years + 1
+        completed = (
+            set()
+            if other_params.get("force_refetch")
+            else set(state.get("completed_cells", []))
+        )
+        cells = [
+            c
+            for c in cells
+            if c["year"] >= first_recent_year or self._cell_key(c) not in completed
         ]
 
-        for query_dict in updated_query_params:
-            self.query_params.update(query_dict)
-            yield from super().get_records(context)
+        pending = {self._cell_key(c) for c in cells}
+        for key in state.get("quarantined_cells", []):
+            if key not in pending:
+                year, period = key.split("-", 1)
+                cells.append({"year": int(year), "period": period})
+        return sorted(cells, key=lambda c: (c["year"], c["period"]))
+
+    def _fetch_cell(self, url: str, cell: dict) -> list[dict]:
+        return self._fetch_with_retry(url, {**self.query_params, **cell})
+
+    def _emit_cell(
+        self, records: list[dict], cell: dict, context: Context | None
+    ) -> t.Iterable[dict]:
+        for record in records:
+            record = self.post_process(record, context)
+            self._check_missing_fields(record)
+            yield record
+        state = self.get_context_state(context)
+        completed = set(state.get("completed_cells", []))
+        completed.add(self._cell_key(cell))
+        state["completed_cells"] = sorted(completed)
+        self._checkpoint_state()
+        self._stop_if_shutdown_requested()
+
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Download cells concurrently (`other_params.max_workers`, default 3)
+        and emit them in (year, period) order. Only `max_workers` CSVs are
+        buffered at once — each cell can be hundreds of MB. Each cell is
+        marked complete in state (and a STATE message flushed) as soon as its
+        records are emitted. Failed cells are retried once at the end of the
+        run, then quarantined for the next one."""
+        url = self.get_url(context)
+        max_workers = int(
+            self.stream_config.get("other_params", {}).get("max_workers", 3)
+        )
+        failed: list[dict] = []
+
+        for result in ordered_map(
+            lambda cell: self._fetch_cell(url, cell),
+            self._get_pending_cells(context),
+            max_workers=max_workers,
+            max_in_flight=max_workers,
+            thread_name_prefix=f"{self.name}-cells",
+        ):
+            if result.error is not None:
+                self.logger.warning(
+                    f"Stream {self.name}: cell {self._cell_key(result.item)} failed, "
+                    f"will retry after remaining cells. "
+                    f"Error: {self.redact_api_key(result.error)}"
+                )
+                failed.append(result.item)
+                continue
+            yield from self._emit_cell(result.result, result.item, context)
+
+        quarantined = []
+        for cell in failed:
+            try:
+                records = self._fetch_cell(url, cell)
+            except Exception as e:
+                self.logger.error(
+                    f"Stream {self.name}: cell {self._cell_key(cell)} failed again, "
+                    f"quarantining for the next run. Error: {self.redact_api_key(e)}"
+                )
+                quarantined.append(self._cell_key(cell))
+                continue
+            yield from self._emit_cell(records, cell, context)
+
+        state = self.get_context_state(context)
+        if quarantined:
+            state["quarantined_cells"] = sorted(quarantined)
+        else:
+            state.pop("quarantined_cells", None)
 
 
 class TtmBulkStream(BaseBulkStream):
@@ -702,11 +801,11 @@ class EarningsSurprisesBulkStream(BaseBulkStream):
 
         return [{"year": str(year)} for year in years]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         years_dict = self._get_years_dict()
         for year_dict in years_dict:
             self.query_params.update(year_dict)
-            yield from super().get_records(context)
+            yield from super()._fetch_records(context)
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/earnings-surprises-bulk"
@@ -1371,44 +1470,15 @@ class EodBulkStream(IncrementalDateStream):
 
         return start_date
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
-        """Override to add date_lte filtering and skip dates that fail after 3 retries."""
-        dates_dict = self._get_dates_dict()
-        starting_date = self.get_starting_timestamp(context)
-        other_params = self.stream_config.get("other_params", {})
-        date_lte = other_params.get("date_lte")
-
-        # Apply both date_gte (via starting_date) and date_lte filtering
-        filtered_dates = [d for d in dates_dict if d["date"] >= starting_date]
+    def _get_pending_dates(self, context: Context | None) -> list[dict]:
+        """Apply `date_lte` on top of the bookmark/`date_gte` lower bound.
+        Failed dates are quarantined in state by the parent rather than
+        papered over with placeholder records."""
+        dates = super()._get_pending_dates(context)
+        date_lte = self.stream_config.get("other_params", {}).get("date_lte")
         if date_lte:
-            filtered_dates = [d for d in filtered_dates if d["date"] <= date_lte]
-
-        for date_dict in filtered_dates:
-            current_date = date_dict.get("date", "unknown")
-
-            try:
-                self.query_params.update(date_dict)
-                yield from super(IncrementalDateStream, self).get_records(context)
-
-            except Exception as e:
-                # Catch all exceptions that come from the 3-retry failure
-                self.logger.warning(
-                    f"EOD Bulk: Failed for date {current_date} after 3 retries, skipping to next date. "
-                    f"Error: {self.redact_api_key(e)}"
-                )
-                # Yield minimal record to advance bookmark past failed date
-                yield {
-                    "surrogate_key": f"eod_bulk_skip_{current_date}",
-                    "symbol": "__TIMEOUT_FAILURE__",
-                    "date": current_date,
-                    "open": None,
-                    "low": None,
-                    "high": None,
-                    "close": None,
-                    "adj_close": None,
-                    "volume": None,
-                }
-                continue
+            dates = [d for d in dates if d["date"] <= date_lte]
+        return dates
 
     def post_process(self, record: dict, context: Context | None = None) -> dict:
         for col in ["open", "high", "low", "close", "adj_close", "volume"]:
@@ -1,5 +1,6 @@
 from tap_fmp.client import CompanySymbolPartitionStream, TimeSliceStream
 from tap_fmp.helpers import blank_strings_to_none
+from tap_fmp.invalidation import InvalidationFeed
 from singer_sdk.helpers.types import Context
 from singer_sdk import typing as th
 
@@ -19,30 +20,6 @@ class TimeSliceCalendarStream(TimeSliceStream):
     _add_surrogate_key = True
 
 
-class DividendsCompanyStream(CalendarStream):
-    name = "dividends_company"
-
-    schema = th.PropertiesList(
-        th.Property("surrogate_key", th.StringType, required=True),
-        th.Property("symbol", th.StringType, required=True),
-        th.Property("date", th.DateType),
-        th.Property("record_date", th.DateType),
-        th.Property("payment_date", th.DateType),
-        th.Property("declaration_date", th.DateType),
-        th.Property("adj_dividend", th.NumberType),
-        th.Property("dividend", th.NumberType),
-        th.Property("yield", th.NumberType),
-        th.Property("frequency", th.StringType),
-    ).to_dict()
-
-    def get_url(self, context: Context):
-        return f"{self.url_base}/stable/dividends"
-
-    def post_process(self, row: dict, context: Context | None = None) -> dict:
-        blank_strings_to_none(row, _DIVIDEND_DATE_FIELDS)
-        return super().post_process(row, context)
-
-
 class DividendsCalendarStream(TimeSliceCalendarStream):
     name = "dividends_calendar"
 
@@ -184,8 +161,8 @@ class IPOsProspectusStream(TimeSliceCalendarStream):
         return super().post_process(record, context)
 
 
-class StockSplitDetailsStream(CalendarStream):
-    name = "stock_split_details"
+class StockSplitsCalendarStream(TimeSliceCalendarStream):
+    name = "stock_splits_calendar"
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -197,11 +174,47 @@ class StockSplitDetailsStream(CalendarStream):
     ).to_dict()
 
     def get_url(self, context: Context):
-        return f"{self.url_base}/stable/splits"
+        return f"{self.url_base}/stable/splits-calendar"
 
 
-class StockSplitsCalendarStream(TimeSliceCalendarStream):
-    name = "stock_splits_calendar"
+class DividendsCompanyStream(CalendarStream):
+    name = "dividends_company"
+    # `event_invalidation`: refetch symbols with a dividend or split event
+    # (splits restate `adj_dividend`).
+    _invalidation_feeds = (
+        InvalidationFeed(
+            DividendsCalendarStream,
+            ("declaration_date", "date", "record_date", "payment_date"),
+            settle_days=2,
+        ),
+        InvalidationFeed(StockSplitsCalendarStream, settle_days=2),
+    )
+
+    schema = th.PropertiesList(
+        th.Property("surrogate_key", th.StringType, required=True),
+        th.Property("symbol", th.StringType, required=True),
+        th.Property("date", th.DateType),
+        th.Property("record_date", th.DateType),
+        th.Property("payment_date", th.DateType),
+        th.Property("declaration_date", th.DateType),
+        th.Property("adj_dividend", th.NumberType),
+        th.Property("dividend", th.NumberType),
+        th.Property("yield", th.NumberType),
+        th.Property("frequency", th.StringType),
+    ).to_dict()
+
+    def get_url(self, context: Context):
+        return f"{self.url_base}/stable/dividends"
+
+    def post_process(self, row: dict, context: Context | None = None) -> dict:
+        blank_strings_to_none(row, _DIVIDEND_DATE_FIELDS)
+        return super().post_process(row, context)
+
+
+class StockSplitDetailsStream(CalendarStream):
+    name = "stock_split_details"
+    # `event_invalidation`: refetch only symbols with a split event.
+    _invalidation_feeds = (InvalidationFeed(StockSplitsCalendarStream, settle_days=2),)
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -213,4 +226,4 @@ class StockSplitsCalendarStream(TimeSliceCalendarStream):
     ).to_dict()
 
     def get_url(self, context: Context):
-        return f"{self.url_base}/stable/splits-calendar"
+        return f"{self.url_base}/stable/splits"
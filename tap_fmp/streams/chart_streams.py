@@ -1,3 +1,9 @@
+from tap_fmp.bulk_planner import (
+    BulkRoute,
+    eod_date_cells,
+    select_window_rows,
+    time_slice_requests,
+)
 from tap_fmp.client import CompanySymbolPartitionTimeSliceStream
 from singer_sdk.helpers.types import Context
 
@@ -11,7 +17,9 @@ from tap_fmp.mixins import (
     Prices30minMixin,
     Prices1HrMixin,
     Prices4HrMixin,
+    UsEquityCalendarMixin,
 )
+from tap_fmp.streams.bulk_streams import EodBulkStream
 
 # -------------------------
 # Historical Daily Prices
@@ -20,10 +28,23 @@ from tap_fmp.mixins import (
 
 class CompanyChartLightStream(ChartLightMixin, CompanySymbolPartitionTimeSliceStream):
     name = "company_chart_light"
+    _listing_date_bounded = True
+    # eod-bulk `close` is as-reported on the day, while the light chart is
+    # split-adjusted history: opt-in only (`source: bulk`).
+    _bulk_route = BulkRoute(
+        EodBulkStream,
+        rename={"close": "price"},
+        exact=False,
+        request_weight=10.0,
+        cells=eod_date_cells,
+        per_symbol_requests=time_slice_requests,
+        select=select_window_rows,
+    )
 
 
 class CompanyChartFullStream(ChartFullMixin, CompanySymbolPartitionTimeSliceStream):
     name = "company_chart_full"
+    _listing_date_bounded = True
 
 
 # -------------------------
@@ -45,12 +66,14 @@ class CompanyUnadjustedPriceStream(
     UnadjustedPriceMixin, CompanySymbolPartitionTimeSliceStream
 ):
     name = "company_unadjusted_price"
+    _listing_date_bounded = True
 
 
 class CompanyDividendAdjustedPriceStream(
     DividendAdjustedPriceMixin, CompanySymbolPartitionTimeSliceStream
 ):
     name = "company_dividend_adjusted_prices"
+    _listing_date_bounded = True
 
 
 # -------------------------
@@ -58,25 +81,43 @@ class CompanyDividendAdjustedPriceStream(
 # -------------------------
 
 
-class Company1minStream(Prices1minMixin, CompanySymbolPartitionTimeSliceStream):
+class Company1minStream(
+    UsEquityCalendarMixin, Prices1minMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_1min"
+    _listing_date_bounded = True
 
 
-class Company5minStream(Prices5minMixin, CompanySymbolPartitionTimeSliceStream):
+class Company5minStream(
+    UsEquityCalendarMixin, Prices5minMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_5min"
+    _listing_date_bounded = True
 
 
-class Company15minStream(Prices15minMixin, CompanySymbolPartitionTimeSliceStream):
+class Company15minStream(
+    UsEquityCalendarMixin, Prices15minMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_15min"
+    _listing_date_bounded = True
 
 
-class Company30minStream(Prices30minMixin, CompanySymbolPartitionTimeSliceStream):
+class Company30minStream(
+    UsEquityCalendarMixin, Prices30minMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_30min"
+    _listing_date_bounded = True
 
 
-class Company1HrStream(Prices1HrMixin, CompanySymbolPartitionTimeSliceStream):
+class Company1HrStream(
+    UsEquityCalendarMixin, Prices1HrMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_1h"
+    _listing_date_bounded = True
 
 
-class Company4HrStream(Prices4HrMixin, CompanySymbolPartitionTimeSliceStream):
+class Company4HrStream(
+    UsEquityCalendarMixin, Prices4HrMixin, CompanySymbolPartitionTimeSliceStream
+):
     name = "company_prices_4h"
+    _listing_date_bounded = True
@@ -8,7 +8,9 @@ from tap_fmp.mixins import SelectableStreamMixin
 class CotPartitionStream(CompanySymbolPartitionTimeSliceStream):
     @property
     def partitions(self):
-        return [{"symbol": s["symbol"]} for s in self._tap.get_cached_cot_symbols()]
+        return self._plan_partitions(
+            [{"symbol": s["symbol"]} for s in self._tap.get_cached_cot_symbols()]
+        )
 
 
 class CotReportStream(CotPartitionStream):
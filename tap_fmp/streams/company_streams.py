@@ -118,14 +118,16 @@ class CikProfileStream(FmpRestStream):
 
     @property
     def partitions(self):
-        return [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        )
 
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/profile-cik"
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update({"cik": context.get("cik")})
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
     def post_process(self, row: dict, context: Context | None = None) -> dict:
         row["cik"] = context.get("cik")
@@ -242,6 +244,7 @@ class CompanyBatchMarketCapStream(
 class HistoricalMarketCapStream(CompanySymbolPartitionTimeSliceStream):
     name = "historical_market_cap"
     primary_keys = ["symbol", "date"]
+    _listing_date_bounded = True
 
     schema = th.PropertiesList(
         th.Property("symbol", th.StringType),
@@ -323,9 +326,9 @@ class SearchMergersAndAcquisitionsStream(LatestMergersAndAcquisitionsStream):
     def partitions(self):
         return self._resolve_name_partitions()
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/mergers-acquisitions-search"
@@ -352,6 +355,7 @@ class CompanyExecutiveStream(CompanySymbolSurrogateKeyStream):
 
 class ExecutiveCompensationStream(CompanySymbolSurrogateKeyStream):
     name = "executive_compensation"
+    _default_negative_cache = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
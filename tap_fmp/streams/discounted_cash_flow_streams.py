@@ -1,4 +1,6 @@
+from tap_fmp.bulk_planner import BulkRoute
 from tap_fmp.client import CompanySymbolPartitionStream
+from tap_fmp.streams.bulk_streams import DcfValuationsBulkStream
 from singer_sdk.helpers.types import Context
 from singer_sdk import typing as th
 
@@ -6,6 +8,7 @@ from singer_sdk import typing as th
 class DcfValuationStream(CompanySymbolPartitionStream):
     name = "dcf_valuation"
     primary_keys = ["symbol", "date"]
+    _bulk_route = BulkRoute(DcfValuationsBulkStream)
 
     schema = th.PropertiesList(
         th.Property("symbol", th.StringType, required=True),
@@ -20,6 +23,7 @@ class DcfValuationStream(CompanySymbolPartitionStream):
 
 class LeveredDcfStream(DcfValuationStream):
     name = "levered_dcf"
+    _bulk_route = None  # dcf-bulk is the unlevered model
 
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/levered-discounted-cash-flow"
@@ -1,3 +1,8 @@
+from tap_fmp.availability import (
+    AvailabilityRoute,
+    fiscal_year_quarter,
+    year_quarter_context,
+)
 from tap_fmp.client import (
     FmpSurrogateKeyStream,
     SymbolYearQuarterPartitionStream,
@@ -12,9 +17,13 @@ class LatestEarningTranscriptsStream(FmpSurrogateKeyStream):
     """Stream for pulling latest earning transcripts."""
 
     name = "latest_earning_transcripts"
+    replication_key = "date"
+    replication_method = "INCREMENTAL"
     _paginate = True
     _paginate_key = "page"
     _max_pages = 100
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -28,6 +37,25 @@ class LatestEarningTranscriptsStream(FmpSurrogateKeyStream):
         return f"{self.url_base}/stable/earning-call-transcript-latest"
 
 
+class TranscriptsDatesBySymbolStream(
+    FmpSurrogateKeyStream, TranscriptSymbolPartitionMixin, BaseSymbolPartitionStream
+):
+    """Stream for pulling transcript dates by symbol."""
+
+    name = "transcripts_dates_by_symbol"
+
+    schema = th.PropertiesList(
+        th.Property("surrogate_key", th.StringType, required=True),
+        th.Property("symbol", th.StringType, required=True),
+        th.Property("quarter", th.NumberType),
+        th.Property("fiscal_year", th.NumberType),
+        th.Property("date", th.DateType),
+    ).to_dict()
+
+    def get_url(self, context: Context | None = None) -> str:
+        return f"{self.url_base}/stable/earning-call-transcript-dates"
+
+
 class EarningsTranscriptStream(
     TranscriptSymbolPartitionMixin,
     FmpSurrogateKeyStream,
@@ -42,6 +70,13 @@ class EarningsTranscriptStream(
     # SDK-forced treat_as_sorted=False is safe since the target upserts on
     # surrogate_key.
     state_partitioning_keys = ["symbol"]
+    # Only request the (year, quarter) combinations the transcript-dates
+    # endpoint lists for each symbol.
+    _availability_route = AvailabilityRoute(
+        TranscriptsDatesBySymbolStream,
+        row_key=fiscal_year_quarter,
+        context_key=year_quarter_context,
+    )
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -67,25 +102,6 @@ class EarningsTranscriptStream(
         return super().post_process(record, context)
 
 
-class TranscriptsDatesBySymbolStream(
-    FmpSurrogateKeyStream, TranscriptSymbolPartitionMixin, BaseSymbolPartitionStream
-):
-    """Stream for pulling transcript dates by symbol."""
-
-    name = "transcripts_dates_by_symbol"
-
-    schema = th.PropertiesList(
-        th.Property("surrogate_key", th.StringType, required=True),
-        th.Property("symbol", th.StringType, required=True),
-        th.Property("quarter", th.NumberType),
-        th.Property("fiscal_year", th.NumberType),
-        th.Property("date", th.DateType),
-    ).to_dict()
-
-    def get_url(self, context: Context | None = None) -> str:
-        return f"{self.url_base}/stable/earning-call-transcript-dates"
-
-
 class AvailableTranscriptSymbolsStream(FmpSurrogateKeyStream):
     """Stream for pulling available transcript symbols."""
 
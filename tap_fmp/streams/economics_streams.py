@@ -84,11 +84,11 @@ class EconomicIndicatorsStream(EconomicsStream):
 
         return [{"name": indicator_name} for indicator_name in indicator_names]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         indicator_name = context.get("name") if context else None
         if indicator_name:
             self.query_params["name"] = indicator_name
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class EconomicCalendarStream(EconomicsStream):
@@ -11,6 +11,8 @@ from datetime import datetime
 class EsgStream(CompanySymbolPartitionStream):
     primary_keys = ["surrogate_key"]
     _add_surrogate_key = True
+    # Empty for most symbols: skip recently empty ones (see `negative_cache`).
+    _default_negative_cache = True
 
 
 class EsgDisclosuresStream(EsgStream):
@@ -80,7 +82,7 @@ class EsgBenchmarkStream(FmpRestStream):
             starting_year = datetime.fromisoformat(starting_year).year
         return starting_year
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         cfg_years = self.stream_config.get("other_params", {}).get("years")
         if cfg_years:
             if isinstance(cfg_years, str):
@@ -97,4 +99,4 @@ class EsgBenchmarkStream(FmpRestStream):
         years = [y for y in years if y >= starting_year]
         for year in years:
             self.query_params.update({"year": year})
-            yield from super().get_records(context)
+            yield from super()._fetch_records(context)
@@ -229,9 +229,9 @@ class MutualFundDisclosuresStream(
             for y in years
             for symbol in symbol_data
         ]
-        return mutual_fund_partitions
+        return self._plan_partitions(mutual_fund_partitions)
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         if context:
             self.query_params.update(
                 {
@@ -240,7 +240,7 @@ class MutualFundDisclosuresStream(
                     "symbol": context.get("symbol"),
                 }
             )
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class MutualFundAndEtfDisclosureNameSearchStream(FmpSurrogateKeyStream):
@@ -269,9 +269,9 @@ class MutualFundAndEtfDisclosureNameSearchStream(FmpSurrogateKeyStream):
     def partitions(self):
         return self._resolve_name_partitions()
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/funds/disclosure-holders-search"
@@ -9,6 +9,7 @@ from singer_sdk.helpers.types import Context
 
 from tap_fmp.client import FmpRestStream, FmpSurrogateKeyStream
 from tap_fmp.helpers import safe_int
+from tap_fmp.partition_grid import PartitionGrid
 
 
 class Form13fCikPartitionStream(FmpRestStream):
@@ -39,16 +40,17 @@ class Form13fCikPartitionStream(FmpRestStream):
             current_year = datetime.today().year
             years = [y for y in range(2020, current_year + 1)]
 
-        return [
-            {"cik": c["cik"], "year": y, "quarter": q}
-            for c in self._tap.get_cached_ciks()
-            for y in years
-            for q in quarters
-        ]
+        return self._plan_partitions(
+            PartitionGrid(
+                ("cik", "year", "quarter"),
+                [c["cik"] for c in self._tap.get_cached_ciks()],
+                (years, quarters),
+            )
+        )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class Form13fSymbolPartitionStream(FmpRestStream):
@@ -79,16 +81,17 @@ class Form13fSymbolPartitionStream(FmpRestStream):
             current_year = datetime.today().year
             years = [y for y in range(2020, current_year + 1)]
 
-        return [
-            {"symbol": s["symbol"], "year": y, "quarter": q}
-            for s in self._tap.get_cached_company_symbols()
-            for y in years
-            for q in quarters
-        ]
+        return self._plan_partitions(
+            PartitionGrid(
+                ("symbol", "year", "quarter"),
+                [s["symbol"] for s in self._tap.get_cached_company_symbols()],
+                (years, quarters),
+            )
+        )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class InstitutionalOwnershipFilingsStream(FmpRestStream):
@@ -160,14 +163,16 @@ class Form13fFilingDatesStream(FmpSurrogateKeyStream):
 
     @property
     def partitions(self):
-        return [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        )
 
     def get_url(self, context):
         return f"{self.url_base}/stable/institutional-ownership/dates"
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
     def post_process(self, record: dict, context: Context | None = None) -> dict:
         record["cik"] = context.get("cik")
@@ -291,11 +296,13 @@ class HolderPerformanceSummaryStream(FmpRestStream):
 
     @property
     def partitions(self):
-        return [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+        )
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class HolderIndustryBreakdownStream(Form13fCikPartitionStream):
@@ -452,7 +459,7 @@ class IndustryPerformanceSummaryStream(FmpRestStream):
 
         return [{"year": y, "quarter": q} for y in years for q in quarters]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         if context:
             self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
@@ -134,14 +134,16 @@ class CrowdfundingByCikStream(FmpRestStream):
 
     @property
     def partitions(self) -> list[dict] | None:
-        return [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        )
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/crowdfunding-offerings"
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class EquityOfferingUpdatesStream(FmpRestStream):
@@ -205,13 +207,15 @@ class EquityOfferingUpdatesStream(FmpRestStream):
     @property
     def partitions(self):
         if self.stream_config.get("other_params", {}).get("use_cached_ciks"):
-            return [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+            return self._plan_partitions(
+                [{"cik": c["cik"]} for c in self._tap.get_cached_ciks()]
+            )
         return None
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         if context:
             self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class _FundraiserSearchBase(FmpRestStream):
@@ -238,10 +242,10 @@ class _FundraiserSearchBase(FmpRestStream):
             return [{"name": n} for n in names]
         return None
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         if context:
             self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class CrowdfundingCampaignSearchStream(_FundraiserSearchBase):
@@ -308,14 +312,16 @@ class EquityOfferingByCikStream(FmpRestStream):
     @property
     def partitions(self):
         """Partition by CIK."""
-        return [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        )
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/fundraising"
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class EquityOfferingSearchStream(_FundraiserSearchBase):
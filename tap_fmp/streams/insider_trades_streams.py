@@ -6,6 +6,7 @@ from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
 
 from tap_fmp.client import FmpRestStream, CompanySymbolPartitionStream
+from tap_fmp.feed_routing import FeedRoute
 from datetime import datetime
 import typing as t
 
@@ -20,6 +21,8 @@ class LatestInsiderTradingStream(FmpRestStream):
     _paginate = True
     _max_pages = 100
     _add_surrogate_key = True
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -50,13 +53,16 @@ class LatestInsiderTradingStream(FmpRestStream):
         other_params = self.stream_config.get("other_params")
         if other_params and "dates" in other_params:
             return [{"date": d} for d in other_params["dates"]]
-        else:
-            return [{"date": datetime.today().date().strftime("%Y-%m-%d")}]
+        if self._bookmark_floor_enabled():
+            # One bookmark across days: a fresh `{"date": today}` partition
+            # each day would have none, so the cut-off could never stop paging.
+            return None
+        return [{"date": datetime.today().date().strftime("%Y-%m-%d")}]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         if context and "date" in context:
             self.query_params["date"] = context["date"]
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class SearchInsiderTradesStream(CompanySymbolPartitionStream):
@@ -67,6 +73,8 @@ class SearchInsiderTradesStream(CompanySymbolPartitionStream):
     _add_surrogate_key = True
     _paginate = True
     _max_pages = 100
+    # `feed_incremental`: new rows come from the latest-filings feed.
+    _feed_route = FeedRoute(LatestInsiderTradingStream, "filing_date")
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -36,9 +36,9 @@ class ExchangeMarketHoursStream(FmpRestStream):
             for exchange_json in self._tap.get_cached_exchanges()
         ]
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update({"exchange": context.get("exchange")})
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class HolidaysByExchangeStream(TimeSliceStream, FmpSurrogateKeyStream):
@@ -67,9 +67,9 @@ class HolidaysByExchangeStream(TimeSliceStream, FmpSurrogateKeyStream):
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/holidays-by-exchange"
 
-    def get_records(self, context: Context | None) -> Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> Iterable[dict]:
         self.query_params.update(context)
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class AllExchangeMarketHoursStream(FmpRestStream):
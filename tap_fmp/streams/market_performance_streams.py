@@ -7,6 +7,7 @@ import typing as t
 from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
 from tap_fmp.client import FmpRestStream, TimeSliceStream, IncrementalDateStream
+from tap_fmp.mixins import UsEquityCalendarMixin
 
 
 class HistoricalMarketPerformanceStream(TimeSliceStream):
@@ -15,12 +16,14 @@ class HistoricalMarketPerformanceStream(TimeSliceStream):
     primary_keys = ["surrogate_key"]
     _add_surrogate_key = True
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
-class MarketSectorPerformanceSnapshotStream(IncrementalDateStream):
+class MarketSectorPerformanceSnapshotStream(
+    UsEquityCalendarMixin, IncrementalDateStream
+):
     """Stream for Market Sector Performance Snapshot API."""
 
     name = "market_sector_performance_snapshot"
@@ -37,7 +40,7 @@ class MarketSectorPerformanceSnapshotStream(IncrementalDateStream):
         return f"{self.url_base}/stable/sector-performance-snapshot"
 
 
-class IndustryPerformanceSnapshotStream(IncrementalDateStream):
+class IndustryPerformanceSnapshotStream(UsEquityCalendarMixin, IncrementalDateStream):
     """Stream for Industry Performance Snapshot API."""
 
     name = "industry_performance_snapshot"
@@ -96,7 +99,7 @@ class HistoricalIndustryPerformanceStream(HistoricalMarketPerformanceStream):
         return f"{self.url_base}/stable/historical-industry-performance"
 
 
-class SectorPeSnapshotStream(IncrementalDateStream):
+class SectorPeSnapshotStream(UsEquityCalendarMixin, IncrementalDateStream):
     """Stream for Sector PE Snapshot API."""
 
     name = "sector_pe_snapshot"
@@ -113,7 +116,7 @@ class SectorPeSnapshotStream(IncrementalDateStream):
         return f"{self.url_base}/stable/sector-pe-snapshot"
 
 
-class IndustryPeSnapshotStream(IncrementalDateStream):
+class IndustryPeSnapshotStream(UsEquityCalendarMixin, IncrementalDateStream):
     """Stream for Industry PE Snapshot API."""
 
     name = "industry_pe_snapshot"
@@ -22,6 +22,10 @@ class BaseNewsTimeSliceStream(TimeSliceStream, FmpSurrogateKeyStream):
     _max_pages = 100
     # 100 pages * 250-record limit = 25k cap per slice.
     _default_time_slice_days: int = 30
+    # Newest-first feed: stop paging at the bookmark instead of re-reading
+    # the whole bookmark day.
+    _default_bookmark_cutoff = True
+    _bookmark_cutoff_field = "published_date"
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
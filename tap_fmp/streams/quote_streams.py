@@ -280,10 +280,10 @@ class BatchExchangeQuoteStream(FmpSurrogateKeyStream):
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/batch-exchange-quote"
 
-    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+    def _fetch_records(self, context: Context | None) -> t.Iterable[dict]:
         if context:
             self.query_params.update(context)
-        yield from super().get_records(context)
+        yield from super()._fetch_records(context)
 
 
 class ETFPriceQuotesStream(QuoteSymbolPartitionStream):
@@ -25,6 +25,9 @@ class BaseSecFilingTimeSliceStream(TimeSliceStream):
     # Firehose endpoints (latest_8k, latest_sec_filings, sec_filings_by_form_type)
     # span all issuers; 25k page cap forces a narrow window.
     _default_time_slice_days: int = 30
+    # Newest-first feed: stop paging at the bookmark instead of re-reading
+    # the whole bookmark day.
+    _default_bookmark_cutoff = True
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -88,9 +91,9 @@ class SecFilingFormTypePartitionMixin(BaseSecFilingTimeSliceStream):
             default_form_types = ["10-K", "10-Q", "8-K", "DEF 14A", "13F-HR"]
             return [{"formType": form_type} for form_type in default_form_types]
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class SecFilingsByFormTypeStream(SecFilingFormTypePartitionMixin):
@@ -164,15 +167,17 @@ class SecFilingsByCikStream(TimeSliceStream):
 
     @property
     def partitions(self) -> list[dict] | None:
-        return [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        )
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/sec-filings-search/cik"
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         if context:
             self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class SecFilingsByNameStream(FmpRestStream):
@@ -200,9 +205,9 @@ class SecFilingsByNameStream(FmpRestStream):
     def partitions(self) -> list[dict] | None:
         return self._resolve_name_partitions(output_key="company")
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class SecFilingsCompanySearchBySymbolStream(CompanySymbolPartitionStream):
@@ -250,11 +255,13 @@ class SecFilingsCompanySearchByCikStream(FmpRestStream):
 
     @property
     def partitions(self) -> list[dict] | None:
-        return [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        return self._plan_partitions(
+            [{"cik": c.get("cik")} for c in self._tap.get_cached_ciks()]
+        )
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class SecCompanyFullProfileStream(CompanySymbolPartitionStream):
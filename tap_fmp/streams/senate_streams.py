@@ -5,6 +5,7 @@ from __future__ import annotations
 from singer_sdk import typing as th
 from singer_sdk.helpers.types import Context
 from tap_fmp.client import FmpRestStream, CompanySymbolPartitionStream
+from tap_fmp.feed_routing import FeedRoute
 
 
 class BaseSenateStream(FmpRestStream):
@@ -42,15 +43,19 @@ class SenateNamePartitionMixin(FmpRestStream):
     def partitions(self):
         return self._resolve_name_partitions()
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class LatestSenateDisclosuresStream(BaseSenateStream):
     """Stream for Latest Senate Financial Disclosures API."""
 
     name = "latest_senate_disclosures"
+    replication_key = "disclosure_date"
+    replication_method = "INCREMENTAL"
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/senate-latest"
@@ -60,6 +65,10 @@ class LatestHouseDisclosuresStream(BaseSenateStream):
     """Stream for Latest House Financial Disclosures API."""
 
     name = "latest_house_disclosures"
+    replication_key = "disclosure_date"
+    replication_method = "INCREMENTAL"
+    # Newest-first feed: stop paging once a page reaches the bookmark.
+    _default_bookmark_cutoff = True
 
     def get_url(self, context: Context | None = None) -> str:
         return f"{self.url_base}/stable/house-latest"
@@ -71,6 +80,9 @@ class SenateTradingActivityStream(CompanySymbolPartitionStream):
     name = "senate_trading_activity"
     primary_keys = ["surrogate_key"]
     _add_surrogate_key = True
+    _default_negative_cache = True
+    # `feed_incremental`: new rows come from the latest-disclosures feed.
+    _feed_route = FeedRoute(LatestSenateDisclosuresStream, "disclosure_date")
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -131,6 +143,9 @@ class HouseTradesStream(CompanySymbolPartitionStream):
     name = "house_trades"
     primary_keys = ["surrogate_key"]
     _add_surrogate_key = True
+    _default_negative_cache = True
+    # `feed_incremental`: new rows come from the latest-disclosures feed.
+    _feed_route = FeedRoute(LatestHouseDisclosuresStream, "disclosure_date")
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
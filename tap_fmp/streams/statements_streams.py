@@ -8,15 +8,36 @@ from singer_sdk.helpers.types import Context
 from singer_sdk import typing as th
 from datetime import datetime
 
+from tap_fmp.availability import (
+    AvailabilityRoute,
+    period_year_context,
+    report_period_year,
+)
 from tap_fmp.client import (
     FmpRestStream,
     SymbolPeriodPartitionStream,
     BaseSymbolPartitionStream,
 )
 
+from tap_fmp.bulk_planner import (
+    BulkRoute,
+    select_statement_rows,
+    statement_cells,
+)
 from tap_fmp.helpers import blank_strings_to_none
+from tap_fmp.invalidation import InvalidationFeed
 from tap_fmp.mixins import FinancialStatementSymbolPartitionMixin
-
+from tap_fmp.partition_grid import PartitionGrid
+from tap_fmp.streams.bulk_streams import (
+    FinancialScoresBulkStream,
+    IncomeStatementBulkStream,
+    KeyMetricsTtmBulkStream,
+)
+from tap_fmp.streams.calendar_streams import EarningsCalendarStream
+from tap_fmp.streams.sec_filings_streams import (
+    Latest8KFilingsStream,
+    LatestSecFilingsStream,
+)
 
 _STATEMENT_DATE_FIELDS = ("filing_date", "accepted_date")
 
@@ -26,6 +47,13 @@ class StatementStream(
 ):
     _add_surrogate_key = True
     primary_keys = ["surrogate_key"]
+    # `event_invalidation`: refetch only symbols that reported or filed.
+    # Statements land a few days after the release or filing.
+    _invalidation_feeds = (
+        InvalidationFeed(EarningsCalendarStream, settle_days=7),
+        InvalidationFeed(Latest8KFilingsStream, ("filing_date",), settle_days=7),
+        InvalidationFeed(LatestSecFilingsStream, ("filing_date",), settle_days=3),
+    )
 
     def post_process(self, row: dict, context: Context | None = None) -> dict:
         if context:
@@ -55,6 +83,16 @@ class TtmStream(FinancialStatementSymbolPartitionMixin, BaseSymbolPartitionStrea
 
 class IncomeStatementStream(StatementStream):
     name = "income_statement"
+    # Each income-statement-bulk cell (year × period) is a large CSV.
+    # Surrogate keys hash every field of the JSON payload, which may carry
+    # fields the schema (and so the bulk CSV mapping) doesn't declare.
+    _bulk_route = BulkRoute(
+        IncomeStatementBulkStream,
+        exact=False,
+        request_weight=200.0,
+        cells=statement_cells,
+        select=select_statement_rows,
+    )
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -588,6 +626,9 @@ class KeyMetricsTtmStream(
 
     name = "key_metrics_ttm"
     _add_surrogate_key = True
+    # Surrogate keys hash every field of the JSON payload, which may carry
+    # fields the schema (and so the bulk CSV mapping) doesn't declare.
+    _bulk_route = BulkRoute(KeyMetricsTtmBulkStream, exact=False)
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -723,6 +764,9 @@ class FinancialScoresStream(
 
     name = "financial_scores"
     _add_surrogate_key = True
+    # Surrogate keys hash every field of the JSON payload, which may carry
+    # fields the schema (and so the bulk CSV mapping) doesn't declare.
+    _bulk_route = BulkRoute(FinancialScoresBulkStream, exact=False)
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -1066,6 +1110,12 @@ class FinancialReportsForm10kJsonStream(StatementStream):
     # elt.buffer_size. Declared per-leaf since sibling StatementStreams
     # partition by (symbol, period).
     state_partitioning_keys = ["symbol"]
+    # Only request the (period, year) reports the report-dates endpoint lists.
+    _availability_route = AvailabilityRoute(
+        FinancialStatementReportDatesStream,
+        row_key=report_period_year,
+        context_key=period_year_context,
+    )
 
     schema = th.PropertiesList(
         th.Property("surrogate_key", th.StringType, required=True),
@@ -1111,12 +1161,16 @@ class FinancialReportsForm10kJsonStream(StatementStream):
         if years is None or years == "*":
             years = [y for y in range(2023, datetime.today().date().year + 1)]
             years = [str(y) for y in years]
-        return [
-            {"symbol": s["symbol"], "period": p, "year": y}
-            for s in self._tap.get_cached_financial_statement_symbols()
-            for p in periods
-            for y in years
-        ]
+        return self._plan_partitions(
+            PartitionGrid(
+                ("symbol", "period", "year"),
+                [
+                    s["symbol"]
+                    for s in self._tap.get_cached_financial_statement_symbols()
+                ],
+                (periods, years),
+            )
+        )
 
     def get_url(self, context: Context):
         return f"{self.url_base}/stable/financial-reports-json"
@@ -22,6 +22,7 @@ class BaseTechnicalIndicatorStream(
 
     primary_keys = ["symbol", "date"]
     replication_key = "date"
+    _listing_date_bounded = True
 
     @classmethod
     def base_schema_properties(cls):
@@ -59,7 +60,9 @@ class BaseTechnicalIndicatorStream(
         """Create partitions combining symbols with timeframes and period lengths."""
         query_params = self.query_params
         other_params = self.stream_config.get("other_params", {})
-        base_partitions = super().partitions
+        # Unplanned symbol list: costs are recorded per expanded context, so
+        # the expanded list is what gets sharded and ordered.
+        base_partitions = self._symbol_partitions()
 
         query_timeframe = query_params.get("timeframe")
         query_period_length = query_params.get("periodLength")
@@ -89,11 +92,11 @@ class BaseTechnicalIndicatorStream(
                     if period_length:
                         partition["periodLength"] = period_length
                     partitions.append(partition)
-        return partitions
+        return self._plan_partitions(partitions)
 
-    def get_records(self, context: Context | None):
+    def _fetch_records(self, context: Context | None):
         self.query_params.update(context)
-        return super().get_records(context)
+        return super()._fetch_records(context)
 
 
 class SimpleMovingAverageStream(BaseTechnicalIndicatorStream):
@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import os
+import sys
 import typing as t
 import threading
+from datetime import date, timedelta
 
-from singer_sdk import Tap
+import click
+import requests
+from singer_sdk import Stream, Tap
 from singer_sdk import typing as th
+from singer_sdk.tap_base import CliTestOptionValue
 
 from tap_fmp.disk_cache import DiskCache, compute_fingerprint
 from tap_fmp.helpers import ExchangeVariantsManager
+from tap_fmp.listing_dates import ListingDates, parse_listing_date
+from tap_fmp.local_store import LocalStore, resolve_store_path
+from tap_fmp.partition_costs import top_market_cap_symbols
+from tap_fmp.shutdown import ShutdownRequested, sigterm_requests
+from tap_fmp.trading_calendar import TradingCalendar
+from tap_fmp.workers import WORK_QUEUE_ENV, WorkQueue, run_workers, worker_args
 
 from tap_fmp.streams.search_streams import (
     CompanyScreenerStream,
@@ -416,9 +427,25 @@ class TapFMP(Tap):
     _transcript_symbols_stream_instance: AvailableTranscriptSymbolsStream | None = None
     _transcript_symbols_lock = threading.Lock()
 
+    _cached_screener_companies: t.List[dict] | None = None
+    _screener_stream_instance: CompanyScreenerStream | None = None
+    _screener_lock = threading.Lock()
+
     _exchange_variants_manager: ExchangeVariantsManager | None = None
     _exchange_variants_lock = threading.Lock()
 
+    _holidays_stream_instance: HolidaysByExchangeStream | None = None
+    _market_hours_stream_instance: ExchangeMarketHoursStream | None = None
+    _trading_calendar_lock = threading.Lock()
+
+    _bulk_stream_lock = threading.Lock()
+
+    _local_store: LocalStore | None = None
+    _local_store_lock = threading.Lock()
+
+    _listing_dates: ListingDates | None = None
+    _listing_dates_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         shared_cache_dir = os.environ.get("MELTANO_SHARED_CACHE_DIR")
@@ -431,6 +458,58 @@ class TapFMP(Tap):
             if shared_cache_dir
             else None
         )
+        self._trading_calendars: t.Dict[tuple[str, ...], TradingCalendar] = {}
+        self._bulk_stream_instances: t.Dict[type, Stream] = {}
+        # Set by SIGTERM; streams stop at the next safe point.
+        self.shutdown_requested = threading.Event()
+        # Set in `--workers` children: partitions are claimed from a shared queue.
+        self.work_queue: WorkQueue | None = WorkQueue.from_env()
+
+    @classmethod
+    def get_singer_command(cls) -> click.Command:
+        command = super().get_singer_command()
+        command.params.append(
+            click.Option(
+                ["--workers"],
+                type=click.IntRange(min=1),
+                default=1,
+                help="Sync with N processes sharing one partition queue.",
+            )
+        )
+        return command
+
+    @classmethod
+    def invoke(cls, *, workers: int = 1, **kwargs) -> None:
+        """Run the sync, or with `--workers N` > 1 run N tap processes that
+        claim partitions from a shared queue and merge their output (see
+        `tap_fmp.workers`). `--about`, `--discover` and `--test` always run
+        in this process: workers only forward config, state and catalog, so
+        they could only sync."""
+        syncs = not (
+            kwargs.get("about")
+            or kwargs.get("discover")
+            or kwargs.get("test", CliTestOptionValue.Disabled.value)
+            != CliTestOptionValue.Disabled.value
+        )
+        if workers > 1 and syncs and not os.environ.get(WORK_QUEUE_ENV):
+            args = worker_args(
+                kwargs.get("config", ()), kwargs.get("state"), kwargs.get("catalog")
+            )
+            sys.exit(run_workers(args, workers))
+        super().invoke(**kwargs)
+
+    def sync_all(self) -> None:
+        """Sync all streams, stopping cleanly on SIGTERM. The in-flight
+        window (or bulk cell, or partition) is finished and its state
+        flushed, so a preempted worker resumes where it stopped."""
+        with sigterm_requests(self.shutdown_requested):
+            try:
+                super().sync_all()
+            except ShutdownRequested:
+                self.logger.warning(
+                    "Sync stopped by SIGTERM; state is flushed up to the last "
+                    "completed window."
+                )
 
     def _build_cache_fingerprint(self, stream) -> str:
         """Build a fingerprint from the stream's effective parsed config."""
@@ -465,7 +544,9 @@ class TapFMP(Tap):
                     stream = stream_getter()
 
                     def _fetch():
-                        data = list(stream.get_records(context=None))
+                        # `_fetch_records`, not `get_records`: lookups must not
+                        # go through change capture or refresh bookkeeping.
+                        data = list(stream._fetch_records(context=None))
                         if apply_filtering and filter_config_key:
                             data = self._apply_country_currency_filtering(
                                 data, filter_config_key
@@ -627,6 +708,28 @@ class TapFMP(Tap):
             self._company_symbols_stream_instance = CompanySymbolsStream(self)
         return self._company_symbols_stream_instance
 
+    def get_cached_screener_companies(self) -> t.List[dict]:
+        """Company screener rows (symbol, market cap, sector, ...), used to
+        rank symbols for `priority_top_market_cap`."""
+        return self._get_cached_data(
+            {
+                "cache_attr": "_cached_screener_companies",
+                "lock": self._screener_lock,
+                "stream_getter": self.get_screener_stream,
+                "data_type": "screener companies",
+                "sort_key": "symbol",
+            }
+        )
+
+    def get_screener_stream(self) -> CompanyScreenerStream:
+        if self._screener_stream_instance is None:
+            self.logger.info("Creating CompanyScreenerStream instance...")
+            self._screener_stream_instance = CompanyScreenerStream(self)
+        return self._screener_stream_instance
+
+    def get_top_market_cap_symbols(self, count: int) -> set[str]:
+        return top_market_cap_symbols(self.get_cached_screener_companies(), count)
+
     def get_cached_financial_statement_symbols(self) -> t.List[dict]:
         """Thread-safe financial statement symbols caching for parallel execution."""
         return self._get_cached_data(
@@ -790,6 +893,135 @@ class TapFMP(Tap):
         caches so the 89k-entry dict is built once per tap run."""
         return self.get_exchange_variants_manager().get_variants_by_symbol()
 
+    def get_holidays_stream(self) -> HolidaysByExchangeStream:
+        if self._holidays_stream_instance is None:
+            self.logger.info("Creating HolidaysByExchangeStream instance...")
+            self._holidays_stream_instance = HolidaysByExchangeStream(self)
+        return self._holidays_stream_instance
+
+    def get_market_hours_stream(self) -> ExchangeMarketHoursStream:
+        if self._market_hours_stream_instance is None:
+            self.logger.info("Creating ExchangeMarketHoursStream instance...")
+            self._market_hours_stream_instance = ExchangeMarketHoursStream(self)
+        return self._market_hours_stream_instance
+
+    def get_local_store(self) -> LocalStore:
+        """Process-wide sqlite store for cross-run bookkeeping (change
+        capture hashes, ...). Path: `local_store_path` config or
+        `.tap_fmp/local_store.sqlite3`."""
+        if self._local_store is None:
+            with self._local_store_lock:
+                if self._local_store is None:
+                    path = resolve_store_path(self.config)
+                    self.logger.info(f"Opening local store at {path}")
+                    self._local_store = LocalStore(path)
+        return self._local_store
+
+    def get_listing_date(self, symbol: str, probe: bool = False) -> date | None:
+        """Listing (IPO) date of `symbol` from exchange variants or earlier
+        probes; with `probe`, fall back to one `/stable/profile` request."""
+        if self._listing_dates is None:
+            with self._listing_dates_lock:
+                if self._listing_dates is None:
+                    self._listing_dates = ListingDates(
+                        self.get_cached_exchange_variants_by_symbol,
+                        self.get_local_store(),
+                        self._probe_listing_date,
+                    )
+        return self._listing_dates.get(symbol, probe=probe)
+
+    def _probe_listing_date(self, symbol: str) -> date | None:
+        profile_stream = self.get_bulk_stream(CompanyProfileBySymbolStream)
+        rows = profile_stream._fetch_with_retry(
+            profile_stream.get_url(None),
+            {"apikey": self.config.get("api_key"), "symbol": symbol},
+        )
+        return parse_listing_date(rows[0].get("ipo_date")) if rows else None
+
+    def get_bulk_stream(self, stream_cls: type[Stream]) -> Stream:
+        """Shared helper stream instance whose URL, parsing and retry settings
+        are borrowed outside its own sync (bulk planner, listing probes)."""
+        with self._bulk_stream_lock:
+            if stream_cls not in self._bulk_stream_instances:
+                self.logger.info(f"Creating {stream_cls.__name__} instance...")
+                self._bulk_stream_instances[stream_cls] = stream_cls(self)
+            return self._bulk_stream_instances[stream_cls]
+
+    def get_trading_calendar(self, exchanges: t.Iterable[str]) -> TradingCalendar:
+        """Thread-safe union trading calendar for `exchanges`, built once per
+        tap run (and shared across subprocesses via the L2 disk cache)."""
+        key = tuple(sorted({e.upper() for e in exchanges}))
+        calendar = self._trading_calendars.get(key)
+        if calendar is None:
+            with self._trading_calendar_lock:
+                calendar = self._trading_calendars.get(key)
+                if calendar is None:
+                    calendar = TradingCalendar.merge(
+                        self._load_exchange_calendar(e) for e in key
+                    )
+                    self._trading_calendars[key] = calendar
+                    self.logger.info(
+                        f"Built trading calendar for {key}: "
+                        f"{sum(len(d) for d in calendar.closed_days.values())} "
+                        f"holiday closures, sessions for {sorted(calendar.sessions)}"
+                    )
+        return calendar
+
+    def _load_exchange_calendar(self, exchange: str) -> TradingCalendar:
+        """Fetch one exchange's holidays (yearly windows) and session hours.
+        Failures degrade to the weekday rule: skipping a day we *think* is a
+        holiday would drop data, an extra request on a real holiday is cheap."""
+        start = date.fromisoformat(
+            str(self.config.get("trading_calendar_start_date", "1990-01-01"))[:10]
+        )
+        end = date.today() + timedelta(days=365)  # FMP publishes future closures
+
+        def _fetch():
+            holidays_stream = self.get_holidays_stream()
+            url = holidays_stream.get_url(None)
+            holidays: list[dict] = []
+            window_start = start
+            while window_start <= end:
+                window_end = min(window_start + timedelta(days=365), end)
+                params = {
+                    "apikey": self.config.get("api_key"),
+                    "exchange": exchange,
+                    "from": window_start.isoformat(),
+                    "to": window_end.isoformat(),
+                }
+                holidays.extend(
+                    {**r, "exchange": exchange}
+                    for r in holidays_stream._fetch_with_retry(url, params)
+                )
+                window_start = window_end + timedelta(days=1)
+
+            hours_stream = self.get_market_hours_stream()
+            hours = hours_stream._fetch_with_retry(
+                hours_stream.get_url(None),
+                {"apikey": self.config.get("api_key"), "exchange": exchange},
+            )
+            return TradingCalendar.from_records(
+                holidays,
+                [{**r, "exchange": exchange} for r in hours],
+                coverage=(start, end),
+                exchanges=[exchange],
+            ).to_dict()
+
+        try:
+            if self._disk_cache is not None:
+                data = self._disk_cache.get_or_fetch(
+                    f"trading_calendar/{exchange}/{start.isoformat()}", _fetch
+                )
+            else:
+                data = _fetch()
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(
+                f"Trading calendar unavailable for {exchange} ({e}); "
+                f"falling back to weekdays-only for this exchange."
+            )
+            return TradingCalendar(closed_days={exchange: set()})
+        return TradingCalendar.from_dict(data)
+
     def _apply_country_currency_filtering(
         self, symbols: list[dict], config_key: str
     ) -> list[dict]:
@@ -0,0 +1,296 @@
+"""Trading-calendar service built from FMP holiday and market-hours data.
+
+Date fan-out (`IncrementalDateStream`) and intraday window sizing
+(`TimeSliceStream`) consult a `TradingCalendar` so weekends and exchange
+holidays stop costing requests. A calendar covers a *union* of exchanges: a
+day is a trading day when any of them holds a session on it. Days outside
+the loaded holiday range fall back to the weekday rule, so an incomplete
+holiday feed can only cost an extra request, never drop a trading day.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import typing as t
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+WEEKEND_DAYS = frozenset({5, 6})  # date.weekday(): Saturday, Sunday
+
+_HOUR_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})(?::\d{2})?\s*([AaPp][Mm])?")
+
+
+def parse_session_time(value: str | None) -> time | None:
+    """Parse FMP session times ("09:30 AM -04:00", "13:00", "1:00 PM").
+
+    The trailing UTC offset is ignored on purpose: it reflects the offset at
+    fetch time, while sessions are pinned to the exchange's IANA timezone and
+    shift with DST."""
+    if not value or not isinstance(value, str):
+        return None
+    match = _HOUR_RE.match(value)
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem.lower() == "pm" else 0)
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        return None
+    return time(hour, minute)
+
+
+def holiday_closes_market(record: dict) -> bool:
+    """A holiday row closes the market for the day when FMP flags it fully
+    closed, or closed without adjusted (half-day) session times."""
+    if record.get("is_fully_closed"):
+        return True
+    return bool(record.get("is_closed")) and not (
+        record.get("adj_open_time") or record.get("adj_close_time")
+    )
+
+
+class TradingCalendar:
+    """Union trading calendar over one or more exchanges.
+
+    Parameters
+    ----------
+    closed_days : dict[str, set[date]]
+        Exchange → full-closure dates.
+    sessions : dict[str, dict]
+        Exchange → ``{"open": time, "close": time, "timezone": str}``.
+    early_closes : dict[str, dict[date, tuple[time | None, time | None]]]
+        Exchange → half-day adjusted (open, close) times.
+    coverage : tuple[date, date] | None
+        Inclusive date range the holiday data was loaded for.
+    """
+
+    def __init__(
+        self,
+        closed_days: dict[str, set[date]] | None = None,
+        sessions: dict[str, dict] | None = None,
+        early_closes: (
+            dict[str, dict[date, tuple[time | None, time | None]]] | None
+        ) = None,
+        coverage: tuple[date, date] | None = None,
+    ) -> None:
+        self.closed_days = {k: set(v) for k, v in (closed_days or {}).items()}
+        self.sessions = dict(sessions or {})
+        self.early_closes = {k: dict(v) for k, v in (early_closes or {}).items()}
+        self.coverage = coverage
+        self.exchanges = tuple(
+            sorted(set(self.closed_days) | set(self.sessions) | set(self.early_closes))
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        holidays: t.Iterable[dict],
+        market_hours: t.Iterable[dict] = (),
+        coverage: tuple[date, date] | None = None,
+        exchanges: t.Iterable[str] = (),
+    ) -> TradingCalendar:
+        """Build from `holidays_by_exchange` / `exchange_market_hours` rows."""
+        closed: dict[str, set[date]] = {e: set() for e in exchanges}
+        early: dict[str, dict[date, tuple[time | None, time | None]]] = {}
+        for record in holidays:
+            exchange = record.get("exchange")
+            try:
+                day = date.fromisoformat(str(record.get("date"))[:10])
+            except ValueError:
+                continue
+            if not exchange:
+                continue
+            closed.setdefault(exchange, set())
+            if holiday_closes_market(record):
+                closed[exchange].add(day)
+            elif record.get("adj_open_time") or record.get("adj_close_time"):
+                early.setdefault(exchange, {})[day] = (
+                    parse_session_time(record.get("adj_open_time")),
+                    parse_session_time(record.get("adj_close_time")),
+                )
+
+        sessions: dict[str, dict] = {}
+        for record in market_hours:
+            exchange = record.get("exchange")
+            opening = parse_session_time(record.get("opening_hour"))
+            closing = parse_session_time(record.get("closing_hour"))
+            if exchange and opening and closing and record.get("timezone"):
+                sessions[exchange] = {
+                    "open": opening,
+                    "close": closing,
+                    "timezone": record["timezone"],
+                }
+        return cls(closed, sessions, early, coverage)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form for `DiskCache` manifests."""
+        return {
+            "closed_days": {
+                e: sorted(d.isoformat() for d in days)
+                for e, days in self.closed_days.items()
+            },
+            "sessions": {
+                e: {
+                    "open": s["open"].strftime("%H:%M"),
+                    "close": s["close"].strftime("%H:%M"),
+                    "timezone": s["timezone"],
+                }
+                for e, s in self.sessions.items()
+            },
+            "early_closes": {
+                e: {
+                    d.isoformat(): [v.strftime("%H:%M") if v else None for v in times]
+                    for d, times in days.items()
+                }
+                for e, days in self.early_closes.items()
+            },
+            "coverage": (
+                [self.coverage[0].isoformat(), self.coverage[1].isoformat()]
+                if self.coverage
+                else None
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TradingCalendar:
+        return cls(
+            closed_days={
+                e: {date.fromisoformat(d) for d in days}
+                for e, days in data.get("closed_days", {}).items()
+            },
+            sessions={
+                e: {
+                    "open": parse_session_time(s["open"]),
+                    "close": parse_session_time(s["close"]),
+                    "timezone": s["timezone"],
+                }
+                for e, s in data.get("sessions", {}).items()
+            },
+            early_closes={
+                e: {
+                    date.fromisoformat(d): tuple(parse_session_time(v) for v in times)
+                    for d, times in days.items()
+                }
+                for e, days in data.get("early_closes", {}).items()
+            },
+            coverage=(
+                tuple(date.fromisoformat(d) for d in data["coverage"])
+                if data.get("coverage")
+                else None
+            ),
+        )
+
+    @classmethod
+    def merge(cls, calendars: t.Iterable[TradingCalendar]) -> TradingCalendar:
+        """Union several single-exchange calendars into one."""
+        closed: dict[str, set[date]] = {}
+        sessions: dict[str, dict] = {}
+        early: dict[str, dict] = {}
+        coverage = None
+        for calendar in calendars:
+            closed.update(calendar.closed_days)
+            sessions.update(calendar.sessions)
+            early.update(calendar.early_closes)
+            if calendar.coverage:
+                coverage = (
+                    calendar.coverage
+                    if coverage is None
+                    else (
+                        max(coverage[0], calendar.coverage[0]),
+                        min(coverage[1], calendar.coverage[1]),
+                    )
+                )
+        return cls(closed, sessions, early, coverage)
+
+    def _covers(self, day: date) -> bool:
+        return self.coverage is None or self.coverage[0] <= day <= self.coverage[1]
+
+    def is_trading_day(self, day: date | datetime) -> bool:
+        if isinstance(day, datetime):
+            day = day.date()
+        if day.weekday() in WEEKEND_DAYS:
+            return False
+        if not self.exchanges or not self._covers(day):
+            return True
+        return any(day not in self.closed_days.get(e, ()) for e in self.exchanges)
+
+    def trading_days(self, start: date, end: date) -> list[date]:
+        """Trading days in ``[start, end]`` inclusive."""
+        days = []
+        current = start
+        while current <= end:
+            if self.is_trading_day(current):
+                days.append(current)
+            current += timedelta(days=1)
+        return days
+
+    def add_trading_days(self, start: date, count: int) -> date:
+        """Return the date reached after advancing `count` trading days past
+        `start` (exclusive of `start`). Used to size windows in sessions
+        rather than calendar days."""
+        current = start
+        remaining = count
+        # Bounded scan: even a fully-closed stretch can't exceed a few weeks,
+        # but guard against a misconfigured calendar closing every day.
+        limit = count * 7 + 31
+        while remaining > 0 and limit > 0:
+            current += timedelta(days=1)
+            limit -= 1
+            if self.is_trading_day(current):
+                remaining -= 1
+        return current
+
+    def session_bounds(
+        self, exchange: str, day: date
+    ) -> tuple[datetime, datetime] | None:
+        """Timezone-aware (open, close) for `exchange` on `day`, or None when
+        closed or session hours are unknown."""
+        session = self.sessions.get(exchange)
+        if session is None or day.weekday() in WEEKEND_DAYS:
+            return None
+        if day in self.closed_days.get(exchange, ()):
+            return None
+        try:
+            tz = ZoneInfo(session["timezone"])
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Unknown timezone {session['timezone']!r} for {exchange}")
+            return None
+        opening, closing = session["open"], session["close"]
+        adj_open, adj_close = self.early_closes.get(exchange, {}).get(day, (None, None))
+        return (
+            datetime.combine(day, adj_open or opening, tzinfo=tz),
+            datetime.combine(day, adj_close or closing, tzinfo=tz),
+        )
+
+    def had_session(self, start: datetime, end: datetime) -> bool:
+        """True when any exchange session overlaps ``[start, end]``
+        (timezone-aware). Without session hours the market counts as open,
+        so callers fall back to requesting."""
+        if not self.sessions:
+            return True
+        for exchange, session in self.sessions.items():
+            try:
+                tz = ZoneInfo(session["timezone"])
+            except (ZoneInfoNotFoundError, ValueError):
+                return True
+            day = start.astimezone(tz).date() - timedelta(days=1)
+            last = end.astimezone(tz).date()
+            while day <= last:
+                bounds = self.session_bounds(exchange, day)
+                if bounds and bounds[0] <= end and start <= bounds[1]:
+                    return True
+                day += timedelta(days=1)
+        return False
+
+    def is_open(self, at: datetime) -> bool:
+        """True when any exchange with known session hours is open at `at`
+        (timezone-aware)."""
+        for exchange in self.sessions:
+            tz = ZoneInfo(self.sessions[exchange]["timezone"])
+            bounds = self.session_bounds(exchange, at.astimezone(tz).date())
+            if bounds and bounds[0] <= at < bounds[1]:
+                return True
+        return False
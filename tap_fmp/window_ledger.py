@@ -0,0 +1,113 @@
+"""Window-completion ledger for time-slice streams.
+
+FULL_TABLE reruns, runs after a state reset, and streams without bookmarks
+fetch every historical window again. Most of those windows can't have
+changed: old EOD/intraday bars, and windows that returned nothing. With
+``other_params.window_ledger: true``, each completed window is recorded in
+the `LocalStore` as (stream, partition, from, to) with its row count and
+content hash. A window that ends before the immutability horizon and is
+fully covered by recorded windows is skipped on later runs.
+
+Coverage is checked on dates, not on exact window boundaries, so adaptive
+window sizing between runs doesn't invalidate the ledger. Windows flagged
+DATA_TRUNCATED are never recorded. Deleting the store, or setting
+``force_refetch: true``, fetches everything again.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from datetime import date, datetime, timedelta, timezone
+
+from tap_fmp.change_capture import partition_key
+from tap_fmp.local_store import LocalStore
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS window_ledger (
+    stream TEXT NOT NULL,
+    partition_key TEXT NOT NULL,
+    window_from TEXT NOT NULL,
+    window_to TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (stream, partition_key, window_from, window_to)
+);
+"""
+
+
+def _day(value: str) -> date:
+    return date.fromisoformat(value[:10])
+
+
+def merge_ranges(ranges: t.Iterable[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Merge inclusive date ranges that overlap or touch."""
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class WindowLedger:
+    """Completed windows of one partition of one stream.
+
+    Parameters
+    ----------
+    store : LocalStore
+    stream_name : str
+    context : dict | None
+        Partition context (the symbol, for per-symbol streams).
+    immutable_before : date
+        Only windows ending before this date can be skipped.
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        stream_name: str,
+        context: dict | None,
+        immutable_before: date,
+    ) -> None:
+        self._store = store
+        self._stream = stream_name
+        self._partition = partition_key(context)
+        self.immutable_before = immutable_before
+        store.ensure_table("window_ledger", _DDL)
+        rows = store.query(
+            "SELECT window_from, window_to FROM window_ledger "
+            "WHERE stream = ? AND partition_key = ?",
+            (self._stream, self._partition),
+        )
+        self._covered = merge_ranges((_day(f), _day(to)) for f, to in rows)
+
+    def is_complete(self, from_date: str, to_date: str) -> bool:
+        """True when [from_date, to_date] ends before the horizon and lies
+        inside ranges already recorded as complete."""
+        start, end = _day(from_date), _day(to_date)
+        if end >= self.immutable_before:
+            return False
+        return any(lo <= start and end <= hi for lo, hi in self._covered)
+
+    def pending(self, windows: t.Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        return [w for w in windows if not self.is_complete(*w)]
+
+    def record(
+        self, from_date: str, to_date: str, row_count: int, content_hash: str
+    ) -> None:
+        self._store.execute(
+            "INSERT OR REPLACE INTO window_ledger "
+            "(stream, partition_key, window_from, window_to, row_count, "
+            "content_hash, completed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                self._stream,
+                self._partition,
+                from_date,
+                to_date,
+                row_count,
+                content_hash,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
@@ -0,0 +1,281 @@
+"""Multi-process sync with a shared partition queue.
+
+``tap-fmp --workers N`` starts N copies of the tap. All of them walk the same
+partition list, and each partition goes to whichever worker claims it first
+(an ``O_EXCL`` file per partition in a run directory under
+``MELTANO_SHARED_CACHE_DIR``, or the system temp dir). A worker that is done
+with a heavy symbol simply claims the next free partition, so a few long
+histories no longer leave the other cores idle the way static sharding
+(`tap_fmp.sharding`) does.
+
+The parent process merges the workers' stdout into one Singer stream:
+SCHEMA messages are deduplicated, RECORDs pass through in arrival order and
+STATE is the `merge_states` of each worker's latest state, emitted after the
+records it covers and at most every few seconds. Every worker reports the
+whole state it started from, so a partition's entry is taken from the worker
+that claimed it. SIGTERM is forwarded to the workers, which checkpoint and
+exit (see `tap_fmp.shutdown`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+
+from tap_fmp.sharding import merge_states
+
+logger = logging.getLogger(__name__)
+
+WORK_QUEUE_ENV = "TAP_FMP_WORK_QUEUE"
+WORKER_ENV = "TAP_FMP_WORKER"
+
+_RECORD_PREFIX = '{"type":"RECORD"'
+_STATE_PREFIX = '{"type":"STATE"'
+
+# Merging re-reads every worker's full state, so merged STATE is written at
+# most this often (and once more at the end of the run).
+STATE_INTERVAL_SECONDS = 5.0
+
+
+class WorkQueue:
+    """Partition claims shared by the workers of one run.
+
+    `claim` is idempotent for the owner: it returns True when this worker
+    took the partition now or earlier, False when another worker has it.
+    """
+
+    def __init__(self, path: str, worker: str) -> None:
+        self.path = path
+        self.worker = worker
+
+    @classmethod
+    def from_env(cls) -> WorkQueue | None:
+        path = os.environ.get(WORK_QUEUE_ENV)
+        if not path:
+            return None
+        return cls(path, os.environ.get(WORKER_ENV, str(os.getpid())))
+
+    def _claim_path(self, stream_name: str, context: dict | None) -> str:
+        key = json.dumps([stream_name, context or {}], sort_keys=True, default=str)
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest())
+
+    def claim(self, stream_name: str, context: dict | None) -> bool:
+        path = self._claim_path(stream_name, context)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            with open(path) as f:
+                return f.read() == self.worker
+        with os.fdopen(fd, "w") as f:
+            f.write(self.worker)
+        return True
+
+    def owner(self, stream_name: str, context: dict | None) -> str | None:
+        """The worker that claimed the partition, or None if nobody has."""
+        try:
+            with open(self._claim_path(stream_name, context)) as f:
+                return f.read() or None
+        except FileNotFoundError:
+            return None
+
+
+class SingerMerger:
+    """Folds the stdout lines of several workers into one Singer stream.
+
+    With `work_queue`, each claimed partition's state comes from the worker
+    that claimed it (once that worker has reported state): the others still
+    carry the copy they started from, which would win ties on the bookmark.
+    """
+
+    def __init__(
+        self,
+        work_queue: WorkQueue | None = None,
+        min_interval: float = STATE_INTERVAL_SECONDS,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._schemas: dict[str, str] = {}
+        self._state_lines: dict[str, str] = {}
+        self._states: dict[str, dict] = {}
+        self._last_state: dict | None = None
+        self._work_queue = work_queue
+        self._owners: dict[tuple[str, str], str] = {}
+        self._min_interval = min_interval
+        self._clock = clock
+        self._last_write = -float("inf")
+
+    def feed(self, worker: t.Hashable, line: str) -> list[str]:
+        """Lines to write for one line read from `worker`."""
+        if line.startswith(_RECORD_PREFIX):
+            return [line]
+        if not line.startswith(_STATE_PREFIX):
+            try:
+                message = json.loads(line)
+            except ValueError:
+                return [line]
+            kind = message.get("type") if isinstance(message, dict) else None
+            if kind == "SCHEMA":
+                schema = json.dumps(message, sort_keys=True)
+                if self._schemas.get(message.get("stream")) == schema:
+                    return []
+                self._schemas[message.get("stream")] = schema
+                return [line]
+            if kind != "STATE":
+                return [line]
+        # Parsed only when merged: a worker's full state per STATE line.
+        self._state_lines[str(worker)] = line
+        if self._clock() - self._last_write < self._min_interval:
+            return []
+        return self.state_lines()
+
+    def state_lines(self) -> list[str]:
+        """The merged STATE, if it changed since the last one written."""
+        for worker, line in self._state_lines.items():
+            self._states[worker] = json.loads(line).get("value") or {}
+        self._state_lines.clear()
+        if not self._states:
+            return []
+        self._last_write = self._clock()
+        merged = merge_states(
+            self._owned(worker, state) for worker, state in self._states.items()
+        )
+        if merged == self._last_state:
+            return []
+        self._last_state = merged
+        return [json.dumps({"type": "STATE", "value": merged}) + "\n"]
+
+    def _claimed_elsewhere(
+        self, worker: str, stream: str, context: dict | None
+    ) -> bool:
+        key = (stream, json.dumps(context or {}, sort_keys=True, default=str))
+        owner = self._owners.get(key)
+        if owner is None:
+            owner = self._work_queue.owner(stream, context)
+            if owner is None:
+                return False
+            self._owners[key] = owner  # claims never change hands
+        return owner != worker and owner in self._states
+
+    def _owned(self, worker: str, state: dict) -> dict:
+        """`state` without the entries another worker claimed."""
+        if self._work_queue is None:
+            return state
+        bookmarks = {}
+        for stream, stream_state in state.get("bookmarks", {}).items():
+            if "partitions" not in stream_state:
+                if not self._claimed_elsewhere(worker, stream, None):
+                    bookmarks[stream] = stream_state
+                continue
+            bookmarks[stream] = {
+                **stream_state,
+                "partitions": [
+                    entry
+                    for entry in stream_state["partitions"]
+                    if not self._claimed_elsewhere(worker, stream, entry.get("context"))
+                ],
+            }
+        return {**state, "bookmarks": bookmarks}
+
+
+def worker_args(
+    config: t.Iterable[str] = (),
+    state: t.Any = None,
+    catalog: t.Any = None,
+) -> list[str]:
+    """Sync arguments for a worker, mirroring the parent's CLI options."""
+    args = []
+    for value in config:
+        args += ["--config", str(value)]
+    if state is not None:
+        args += ["--state", str(state)]
+    if catalog is not None:
+        args += ["--catalog", str(catalog)]
+    return args
+
+
+def _pump(index: int, stream: t.IO[str], lines: queue.Queue) -> None:
+    for line in stream:
+        lines.put((index, line))
+    lines.put((index, None))
+
+
+def run_workers(
+    args: list[str],
+    workers: int,
+    out: t.IO[str] | None = None,
+    command: list[str] | None = None,
+) -> int:
+    """Run `workers` tap processes over one partition queue, write their
+    merged output to `out` and return the first non-zero exit code (0 if
+    all succeeded)."""
+    out = out or sys.stdout
+    command = command or [sys.executable, "-m", "tap_fmp"]
+    base = os.environ.get("MELTANO_SHARED_CACHE_DIR") or tempfile.gettempdir()
+    os.makedirs(base, exist_ok=True)
+    run_dir = tempfile.mkdtemp(prefix="tap-fmp-work-", dir=base)
+    logger.info(f"Starting {workers} workers, partition queue at {run_dir}")
+
+    procs = []
+    lines: queue.Queue = queue.Queue(maxsize=10000)
+    try:
+        for index in range(workers):
+            env = {**os.environ, WORK_QUEUE_ENV: run_dir, WORKER_ENV: str(index)}
+            proc = subprocess.Popen(
+                [*command, *args],
+                stdout=subprocess.PIPE,
+                env=env,
+                text=True,
+                bufsize=1,
+            )
+            procs.append(proc)
+            threading.Thread(
+                target=_pump,
+                args=(index, proc.stdout, lines),
+                name=f"tap-fmp-worker-{index}",
+                daemon=True,
+            ).start()
+
+        def _forward_sigterm(signum, frame):
+            logger.warning("SIGTERM received: forwarding to workers.")
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.send_signal(signal.SIGTERM)
+
+        on_main = threading.current_thread() is threading.main_thread()
+        previous = signal.signal(signal.SIGTERM, _forward_sigterm) if on_main else None
+        try:
+            merger = SingerMerger(WorkQueue(run_dir, "parent"))
+            running = workers
+            while running:
+                index, line = lines.get()
+                if line is None:
+                    running -= 1
+                    continue
+                out.writelines(merger.feed(index, line))
+            out.writelines(merger.state_lines())
+            out.flush()
+        finally:
+            if on_main:
+                signal.signal(signal.SIGTERM, previous)
+
+        codes = [proc.wait() for proc in procs]
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+    failed = [code for code in codes if code]
+    if failed:
+        logger.error(f"{len(failed)} of {workers} workers failed: exit codes {codes}")
+    return failed[0] if failed else 0
@@ -0,0 +1,93 @@
+"""Adaptive time-slice sizing tests.
+
+A learned `records_per_day` must size the next run's windows just under the
+per-request cap, so dense partitions stop paying for full-response splits
+and sparse partitions can use fewer, larger windows — but only up to the
+opt-in `max_time_slice_days`, never past the configured window by default.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from tests.test_time_slice_correctness import (
+    _make_paginated_stream,
+    _make_stream,
+)
+
+
+def _window_days(stream, other_params):
+    stream.other_params = other_params
+    stream._fake_stream_config = {"other_params": other_params}
+    stream._fake_config = {"start_date": "2024-01-01"}
+    first_from, first_to = stream.create_time_slice_chunks(context=None)[0]
+    return (datetime.fromisoformat(first_to) - datetime.fromisoformat(first_from)).days
+
+
+@pytest.mark.parametrize(
+    "density, other_params, expected",
+    [
+        (None, {}, 90),  # nothing learned yet
+        (100.0, {}, 31),  # 4000 * 0.8 / 100 - 1
+        (1.0, {}, 90),  # sparse: growth needs max_time_slice_days
+        (1.0, {"max_time_slice_days": 365}, 365),
+        (10_000.0, {}, 1),  # never below one day
+        (100.0, {"adaptive_time_slices": False}, 90),
+    ],
+)
+def test_window_fitted_to_learned_density(density, other_params, expected):
+    stream = _make_stream()
+    if density is not None:
+        stream._fake_state["records_per_day"] = density
+    assert _window_days(stream, other_params) == expected
+
+
+def test_hidden_cap_overrides_configured_limit():
+    stream = _make_stream()
+    stream._fake_state.update({"records_per_day": 10.0, "hidden_record_cap": 100})
+    assert _window_days(stream, {}) == 7  # 100 * 0.8 / 10 - 1
+
+
+def test_paginated_streams_keep_fixed_windows():
+    stream = _make_paginated_stream()
+    stream._fake_state["records_per_day"] = 100.0
+    assert _window_days(stream, {}) == 90
+
+
+def _run_window(stream, records, from_date="2024-01-01", to_date="2024-01-10"):
+    with patch.object(stream, "_fetch_with_retry", return_value=records):
+        list(
+            stream.fetch_window(
+                url="http://example/test",
+                query_params={"symbol": "AAPL"},
+                from_date=from_date,
+                to_date=to_date,
+                max_records=4000,
+                context={"symbol": "AAPL"},
+            )
+        )
+    stream._store_window_density({"symbol": "AAPL"})
+
+
+def test_density_learned_from_completed_windows_and_blended():
+    stream = _make_stream()
+    _run_window(stream, [{"date": "2024-01-05"}] * 50)
+    assert stream._fake_state["records_per_day"] == 5.0  # 50 / 10 inclusive days
+
+    _run_window(stream, [{"date": "2024-01-05"}] * 150)
+    assert stream._fake_state["records_per_day"] == 10.0  # (5 + 15) / 2
+
+
+def test_silently_truncated_window_records_cap_not_density():
+    stream = _make_stream()
+    # 120 rows that only cover the last day of a 60-day window.
+    _run_window(
+        stream,
+        [{"date": "2024-03-01"}] * 120,
+        from_date="2024-01-01",
+        to_date="2024-03-01",
+    )
+    assert stream._fake_state == {"hidden_record_cap": 120}
@@ -0,0 +1,125 @@
+"""Availability-driven pruning tests.
+
+Partitions the companion stream doesn't list must be skipped without a
+request; everything else, and every symbol whose companion request fails,
+must be fetched as before.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import requests
+
+from tap_fmp.availability import AvailabilityIndex
+from tap_fmp.local_store import LocalStore
+from tap_fmp.streams.earnings_transcript_streams import EarningsTranscriptStream
+
+# What /stable/earning-call-transcript-dates lists per symbol.
+DATES = {
+    "AAPL": [
+        {"symbol": "AAPL", "fiscal_year": 2024, "quarter": 1},
+        {"symbol": "AAPL", "fiscal_year": 2024, "quarter": 2},
+    ],
+    "NEWCO": [],
+}
+
+
+class _FakeCompanion:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def get_url(self, context):
+        return "https://example.invalid/stable/earning-call-transcript-dates"
+
+    def _fetch_with_retry(self, url, query_params):
+        symbol = query_params["symbol"]
+        self.calls.append(symbol)
+        if symbol not in DATES:
+            raise requests.exceptions.HTTPError("503")
+        return DATES[symbol]
+
+
+class _FakeTap:
+    def __init__(self, store):
+        self.store = store
+        self.companion_calls: list[str] = []
+        self.streams = {}
+
+    def get_local_store(self):
+        return self.store
+
+    def get_bulk_stream(self, stream_cls):
+        return _FakeCompanion(self.companion_calls)
+
+    def get_listing_date(self, symbol, probe=False):
+        return None
+
+
+class _StubTranscripts(EarningsTranscriptStream):
+    def __init__(self, store, other_params=None):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = {"source": "per_symbol", **(other_params or {})}
+        self.logger = logging.getLogger("tap-fmp.test_transcripts")
+        self._tap = _FakeTap(store)
+        self._config = {}
+        self.fetched: list[tuple] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append(
+            (query_params["symbol"], query_params["year"], query_params["quarter"])
+        )
+        return [{"date": f"{query_params['year']}-01-01"}]
+
+
+def _run(stream, symbols=("AAPL", "NEWCO", "FAILCO")):
+    for symbol in symbols:
+        for year in (2023, 2024):
+            for quarter in (1, 2, 3, 4):
+                context = {"symbol": symbol, "year": year, "quarter": quarter}
+                list(stream.get_records(context))
+    return stream.fetched
+
+
+def test_only_listed_combinations_are_requested(tmp_path):
+    stream = _StubTranscripts(LocalStore(tmp_path / "store.sqlite3"))
+    fetched = _run(stream)
+    assert [f for f in fetched if f[0] != "FAILCO"] == [
+        ("AAPL", 2024, 1),
+        ("AAPL", 2024, 2),
+    ]
+    # A failed companion request prunes nothing.
+    assert len([f for f in fetched if f[0] == "FAILCO"]) == 8
+    # One companion request per symbol; the failure is retried.
+    assert stream._tap.companion_calls == ["AAPL", "NEWCO", *["FAILCO"] * 8]
+
+
+def test_availability_is_cached_until_ttl(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    _run(_StubTranscripts(store), symbols=("AAPL",))
+
+    cached = _StubTranscripts(store)
+    assert _run(cached, symbols=("AAPL",)) == [("AAPL", 2024, 1), ("AAPL", 2024, 2)]
+    assert cached._tap.companion_calls == []
+
+    expired = _StubTranscripts(store, {"availability_ttl_hours": 0})
+    _run(expired, symbols=("AAPL",))
+    assert expired._tap.companion_calls == ["AAPL"]
+
+
+def test_pruning_can_be_disabled(tmp_path):
+    stream = _StubTranscripts(
+        LocalStore(tmp_path / "store.sqlite3"), {"availability_pruning": False}
+    )
+    assert len(_run(stream, symbols=("NEWCO",))) == 8
+    assert stream._tap.companion_calls == []
+
+
+def test_index_round_trips_string_keys(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    route = EarningsTranscriptStream._availability_route
+    rows = [{"fiscal_year": "2024", "quarter": "3"}, {"fiscal_year": None}]
+    AvailabilityIndex(store, "s", route, lambda symbol: rows).available("X")
+    reloaded = AvailabilityIndex(store, "s", route, lambda symbol: [])
+    assert reloaded.available("X") == {(2024, 3)}
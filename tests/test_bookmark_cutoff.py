@@ -0,0 +1,157 @@
+"""Bookmark cut-off tests for newest-first paginated feeds (news, filings,
+"latest" feeds).
+
+An incremental refresh must drop items older than the bookmark, keep items
+stamped exactly at it, and stop paging once a page reaches it — without that
+stop being mistaken for truncation.
+"""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+from tap_fmp.client import DATA_TRUNCATED_TOKEN
+from tap_fmp.streams.insider_trades_streams import LatestInsiderTradingStream
+from tap_fmp.streams.news_streams import BaseNewsTimeSliceStream
+from tap_fmp.streams.sec_filings_streams import BaseSecFilingTimeSliceStream
+from tap_fmp.streams.senate_streams import LatestSenateDisclosuresStream
+
+from tests.test_time_slice_correctness import _make_paginated_stream
+
+PAGES = [
+    [
+        {"date": "2024-03-05 16:00:00", "id": 1},
+        {"date": "2024-03-05 12:00:00", "id": 2},
+    ],
+    [
+        {"date": "2024-03-05 09:30:00", "id": 3},
+        {"date": "2024-03-05 08:00:00", "id": 4},
+    ],
+    [
+        {"date": "2024-03-04 20:00:00", "id": 5},
+        {"date": "2024-03-04 18:00:00", "id": 6},
+    ],
+]
+
+
+def _stream(state, **other_params):
+    stream = _make_paginated_stream()
+    stream.replication_method = "INCREMENTAL"
+    stream.replication_key = "date"
+    stream.other_params = {"bookmark_cutoff": True, **other_params}
+    stream._fake_state = state
+    return stream
+
+
+def _run(stream, caplog):
+    pages: list[int] = []
+
+    def fetch(url, qp, page=None):
+        pages.append(page)
+        return [dict(r) for r in PAGES[page]] if page < len(PAGES) else []
+
+    with (
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(
+            stream,
+            "create_time_slice_chunks",
+            return_value=[("2024-03-05", "2024-03-06")],
+        ),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+        caplog.at_level(logging.ERROR, logger="tap-fmp.test_stream"),
+    ):
+        records = list(stream.get_records({"symbol": "AAPL"}))
+    drift = [r for r in caplog.records if DATA_TRUNCATED_TOKEN in r.message]
+    return pages, records, drift
+
+
+def test_paging_stops_at_the_bookmark_and_older_items_are_dropped(caplog):
+    state = {"replication_key_value": "2024-03-05T09:30:00"}
+    pages, records, drift = _run(_stream(state), caplog)
+    assert pages == [0, 1, 2]  # one overlap page past the bookmark
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert drift == []
+
+
+def test_cold_partition_and_disabled_cutoff_read_every_page(caplog):
+    pages, records, _ = _run(_stream({}), caplog)
+    assert pages[:3] == [0, 1, 2] and len(records) == 6
+    state = {"replication_key_value": "2024-03-05T09:30:00"}
+    pages, records, _ = _run(_stream(state, bookmark_cutoff=False), caplog)
+    assert len(records) == 6
+
+
+def test_news_and_filings_cut_off_by_default():
+    assert BaseNewsTimeSliceStream._default_bookmark_cutoff is True
+    assert BaseNewsTimeSliceStream._bookmark_cutoff_field == "published_date"
+    assert BaseSecFilingTimeSliceStream._default_bookmark_cutoff is True
+
+
+class _StubLatestSenate(LatestSenateDisclosuresStream):
+    def __init__(self, state, other_params=None):
+        self.query_params = {}
+        self.other_params = other_params or {}
+        self.logger = logging.getLogger("tap-fmp.test_latest")
+        self._fake_state = state
+
+    def get_context_state(self, context):
+        return self._fake_state
+
+
+LATEST_PAGES = [
+    [{"disclosure_date": "2024-03-07"}, {"disclosure_date": "2024-03-06"}],
+    [{"disclosure_date": "2024-03-05"}, {"disclosure_date": "2024-03-04"}],
+    [{"disclosure_date": "2024-03-03"}, {"disclosure_date": "2024-03-02"}],
+    [{"disclosure_date": "2024-03-01"}],
+]
+
+
+def _run_latest(stream):
+    pages: list[int] = []
+
+    def fetch(url, qp, page=None):
+        pages.append(page)
+        return [dict(r) for r in LATEST_PAGES[page]] if page < len(LATEST_PAGES) else []
+
+    with patch.object(stream, "_fetch_with_retry", side_effect=fetch):
+        records = list(stream._handle_pagination("http://example/test", {}, None))
+    return pages, [r["disclosure_date"] for r in records]
+
+
+def test_latest_feed_reads_one_overlap_page_past_the_bookmark():
+    state = {"replication_key_value": "2024-03-05"}
+    pages, dates = _run_latest(_StubLatestSenate(state))
+    assert pages == [0, 1, 2]
+    assert dates == ["2024-03-07", "2024-03-06", "2024-03-05"]
+
+
+def test_latest_feed_without_overlap_stops_at_the_bookmark():
+    state = {"replication_key_value": "2024-03-05"}
+    stream = _StubLatestSenate(state, {"bookmark_overlap_pages": 0})
+    pages, dates = _run_latest(stream)
+    assert pages == [0, 1]
+    assert dates == ["2024-03-07", "2024-03-06", "2024-03-05"]
+
+
+def test_latest_feed_without_bookmark_reads_until_empty():
+    pages, dates = _run_latest(_StubLatestSenate({}))
+    assert pages == [0, 1, 2, 3, 4, 5] and len(dates) == 7
+
+
+class _StubLatestInsider(LatestInsiderTradingStream):
+    def __init__(self, other_params=None):
+        self.other_params = other_params or {}
+
+    @property
+    def config(self):
+        return {self.name: {"other_params": self.other_params}}
+
+
+def test_latest_insider_bookmark_is_not_keyed_by_day():
+    # A new `{"date": today}` partition every day would never have a bookmark.
+    assert _StubLatestInsider().partitions is None
+    dated = _StubLatestInsider({"dates": ["2024-03-05"]})
+    assert dated.partitions == [{"date": "2024-03-05"}]
+    disabled = _StubLatestInsider({"bookmark_cutoff": False})
+    assert [list(p) for p in disabled.partitions] == [["date"]]
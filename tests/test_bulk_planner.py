@@ -0,0 +1,379 @@
+"""Bulk planner tests.
+
+A per-symbol stream served from a bulk endpoint must emit the same records
+(schema, natural and surrogate keys) as the per-symbol path, only for the
+selected universe, and must fall back to per-symbol requests whenever the
+bulk path is more expensive or not available on the account's plan.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import Counter
+
+import pytest
+import requests
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_fmp.bulk_planner import BulkPlan, RowSpool, coerce_value
+from tap_fmp.client import SymbolPeriodPartitionStream
+from tap_fmp.streams.analyst_streams import RatingSnapshotStream
+from tap_fmp.streams.discounted_cash_flow_streams import DcfValuationStream
+from tap_fmp.streams.statements_streams import (
+    FinancialScoresStream,
+    IncomeStatementStream,
+)
+
+
+class _FakeBulkStream:
+    def __init__(self, rows=None, error=None):
+        self.query_params = {"apikey": "k"}
+        self.rows = rows or []
+        self.error = error
+        self.calls: list[dict] = []
+        self._lock = threading.Lock()
+
+    def get_url(self, context=None):
+        return "https://example.invalid/stable/bulk"
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        with self._lock:
+            self.calls.append(query_params)
+        if self.error is not None:
+            raise self.error
+        cell = {
+            k: str(query_params[k]) for k in ("period", "year") if k in query_params
+        }
+        cell = {("fiscal_year" if k == "year" else k): v for k, v in cell.items()}
+        return [r for r in self.rows if all(r.get(k) == v for k, v in cell.items())]
+
+
+class _FakeTap:
+    def __init__(self, bulk_stream, symbols=()):
+        self.bulk_stream = bulk_stream
+        self.symbols = symbols
+        self.requested: list[type] = []
+
+    def get_cached_company_symbols(self):
+        return [{"symbol": s} for s in self.symbols]
+
+    def get_bulk_stream(self, stream_cls):
+        self.requested.append(stream_cls)
+        return self.bulk_stream
+
+
+class _StubMixin:
+    def __init__(self, symbols, bulk_stream, other_params=None, json_rows=None):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = other_params or {}
+        self.logger = logging.getLogger("tap-fmp.test_bulk_planner")
+        self._symbols = symbols
+        self._tap = _FakeTap(bulk_stream, symbols)
+        self.json_rows = json_rows or {}
+        self.per_symbol_calls: list[str] = []
+
+    @property
+    def partitions(self):
+        return [{"symbol": s} for s in self._symbols]
+
+    @property
+    def config(self):
+        return {}
+
+    @property
+    def stream_config(self):
+        return {"other_params": self.other_params}
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.per_symbol_calls.append(query_params["symbol"])
+        return [dict(r) for r in self.json_rows.get(query_params["symbol"], [])]
+
+    def run(self):
+        return {p["symbol"]: list(self.get_records(p)) for p in self.partitions}
+
+
+class _StubDcf(_StubMixin, DcfValuationStream):
+    pass
+
+
+class _StubScores(_StubMixin, FinancialScoresStream):
+    pass
+
+
+class _StubRating(_StubMixin, RatingSnapshotStream):
+    pass
+
+
+class _StubIncome(_StubMixin, IncomeStatementStream):
+    pass
+
+
+class _StubIncomePeriods(_StubIncome):
+    # The stream's own symbol × period partitions.
+    partitions = SymbolPeriodPartitionStream.partitions
+
+
+def _symbols(n):
+    return [f"S{i:04d}" for i in range(n)]
+
+
+def _dcf_csv_row(symbol):
+    return {
+        "symbol": symbol,
+        "date": "2025-01-02",
+        "dcf": "147.5",
+        "stock_price": "180",
+    }
+
+
+def test_auto_serves_universe_from_one_bulk_request_when_cheaper():
+    symbols = _symbols(120)
+    bulk = _FakeBulkStream(
+        [_dcf_csv_row(s) for s in symbols] + [_dcf_csv_row("NOT_SELECTED")]
+    )
+    stream = _StubDcf(symbols, bulk)
+
+    records = stream.run()
+
+    assert len(bulk.calls) == 1
+    assert stream.per_symbol_calls == []
+    assert records["S0007"] == [
+        {"symbol": "S0007", "date": "2025-01-02", "dcf": 147.5, "stock_price": 180}
+    ]
+    assert "NOT_SELECTED" not in records
+
+
+def test_auto_stays_per_symbol_for_small_universe():
+    bulk = _FakeBulkStream([_dcf_csv_row("AAPL")])
+    stream = _StubDcf(
+        ["AAPL", "MSFT"],
+        bulk,
+        json_rows={"AAPL": [{"symbol": "AAPL", "date": "2025-01-02", "dcf": 1.0}]},
+    )
+
+    records = stream.run()
+
+    assert bulk.calls == []
+    assert stream.per_symbol_calls == ["AAPL", "MSFT"]
+    assert records["AAPL"][0]["dcf"] == 1.0
+
+
+@pytest.mark.parametrize(
+    "source, symbols, expect_bulk",
+    [("bulk", ["AAPL"], True), ("per_symbol", _symbols(500), False)],
+)
+def test_source_override_beats_cost_model(source, symbols, expect_bulk):
+    bulk = _FakeBulkStream([_dcf_csv_row(s) for s in symbols])
+    stream = _StubDcf(symbols, bulk, other_params={"source": source})
+    stream.run()
+    assert bool(bulk.calls) is expect_bulk
+    assert bool(stream.per_symbol_calls) is not expect_bulk
+
+
+def test_invalid_source_is_a_config_error():
+    stream = _StubDcf(["AAPL"], _FakeBulkStream(), other_params={"source": "csv"})
+    with pytest.raises(ConfigValidationError):
+        list(stream.get_records({"symbol": "AAPL"}))
+
+
+def test_schema_shaped_json_rows_match_opted_in_bulk_rows():
+    json_row = {
+        "symbol": "AAPL",
+        "reported_currency": "USD",
+        "altman_z_score": 9.25,
+        "piotroski_score": 7,
+        "working_capital": -1742000000,
+        "total_assets": 364980000000,
+        "revenue": 391035000000,
+    }
+    csv_row = {k: str(v) for k, v in json_row.items()}
+    symbols = ["AAPL"] + _symbols(99)
+
+    via_json = _StubScores(
+        symbols, _FakeBulkStream(), {"source": "per_symbol"}, {"AAPL": [json_row]}
+    )
+    via_bulk = _StubScores(symbols, _FakeBulkStream([csv_row]), {"source": "bulk"})
+
+    json_records = list(via_json.get_records({"symbol": "AAPL"}))
+    bulk_records = list(via_bulk.get_records({"symbol": "AAPL"}))
+
+    assert via_bulk.per_symbol_calls == []
+    assert bulk_records == json_records
+    assert bulk_records[0]["surrogate_key"] == json_records[0]["surrogate_key"]
+
+
+@pytest.mark.parametrize("stub", [_StubScores, _StubIncome])
+def test_surrogate_keyed_routes_are_not_chosen_by_auto(stub):
+    # Their JSON payloads may hold fields outside the schema, which the
+    # surrogate key hashes and bulk rows can't reproduce.
+    symbols = _symbols(500)
+    bulk = _FakeBulkStream([{"symbol": s} for s in symbols])
+    stream = stub(symbols, bulk, {"bulk_request_weight": 1})
+    stream.run()
+    assert bulk.calls == []
+    assert len(stream.per_symbol_calls) == 500
+
+
+def test_inexact_route_requires_explicit_opt_in():
+    symbols = _symbols(500)
+    rows = [
+        {
+            "symbol": s,
+            "date": "2025-01-02",
+            "rating": "A",
+            "return_on_equity_score": "5",
+        }
+        for s in symbols
+    ]
+    auto = _StubRating(symbols, _FakeBulkStream(rows))
+    auto.run()
+    assert len(auto.per_symbol_calls) == 500
+
+    opted_in = _StubRating(symbols, _FakeBulkStream(rows), {"source": "bulk"})
+    records = opted_in.run()
+    assert opted_in.per_symbol_calls == []
+    # Fields outside the per-symbol schema (`date`) are dropped.
+    assert records["S0001"] == [
+        {"symbol": "S0001", "rating": "A", "return_on_equity_score": 5}
+    ]
+
+
+def test_auto_falls_back_when_bulk_is_not_on_the_plan():
+    response = requests.Response()
+    response.status_code = 402
+    bulk = _FakeBulkStream(
+        error=requests.exceptions.HTTPError("402", response=response)
+    )
+    symbols = _symbols(200)
+    stream = _StubDcf(symbols, bulk)
+
+    stream.run()
+
+    assert len(bulk.calls) == 1
+    assert len(stream.per_symbol_calls) == 200
+
+
+def test_explicit_bulk_surfaces_entitlement_errors():
+    response = requests.Response()
+    response.status_code = 402
+    bulk = _FakeBulkStream(
+        error=requests.exceptions.HTTPError("402", response=response)
+    )
+    stream = _StubDcf(["AAPL"], bulk, {"source": "bulk"})
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(stream.get_records({"symbol": "AAPL"}))
+
+
+def test_income_statement_cells_and_selection_follow_per_symbol_request():
+    rows = [
+        {
+            "symbol": "AAPL",
+            "date": f"2024-{m:02d}-28",
+            "period": p,
+            "fiscal_year": "2024",
+        }
+        for m, p in ((3, "Q1"), (6, "Q2"), (9, "Q3"), (12, "Q4"))
+    ] + [
+        {"symbol": "AAPL", "date": "2024-12-28", "period": "FY", "fiscal_year": "2024"}
+    ]
+    bulk = _FakeBulkStream(rows)
+    stream = _StubIncome(
+        ["AAPL"],
+        bulk,
+        {"source": "bulk", "bulk_start_year": 2023},
+    )
+    stream.query_params.update({"period": "quarter", "limit": 2})
+
+    records = list(stream.get_records({"symbol": "AAPL"}))
+
+    assert {c["period"] for c in bulk.calls} == {"Q1", "Q2", "Q3", "Q4"}
+    assert {c["year"] for c in bulk.calls} >= {2023, 2024}
+    # Newest first, capped by `limit`, FY rows excluded for `period: quarter`.
+    assert [r["period"] for r in records] == ["Q4", "Q3"]
+    assert records[0]["fiscal_year"] == 2024
+    assert records[0]["surrogate_key"]
+
+
+def test_income_statement_serves_every_period_partition():
+    rows = [
+        {"symbol": s, "date": f"2024-{m:02d}-28", "period": p, "fiscal_year": "2024"}
+        for s in ("AAPL", "MSFT")
+        for m, p in ((3, "Q1"), (6, "Q2"), (9, "Q3"), (12, "Q4"), (12, "FY"))
+    ]
+    bulk = _FakeBulkStream(rows)
+    stream = _StubIncomePeriods(
+        ["AAPL", "MSFT"], bulk, {"source": "bulk", "bulk_start_year": 2024}
+    )
+
+    records = {
+        (p["symbol"], p["period"]): list(stream.get_records(p))
+        for p in stream.partitions
+    }
+
+    assert len(records) == 14
+    assert {c["period"] for c in bulk.calls} == {"Q1", "Q2", "Q3", "Q4", "FY"}
+    assert stream.per_symbol_calls == []
+    for symbol in ("AAPL", "MSFT"):
+        # Each partition gets the rows its per-symbol request would return,
+        # labelled with the partition's period.
+        assert [r["date"] for r in records[symbol, "Q1"]] == ["2024-03-28"]
+        assert [r["date"] for r in records[symbol, "FY"]] == ["2024-12-28"]
+        assert [r["date"] for r in records[symbol, "annual"]] == ["2024-12-28"]
+        assert len(records[symbol, "quarter"]) == 4
+        assert {r["period"] for r in records[symbol, "quarter"]} == {"quarter"}
+    # Every partition was served, so the spooled rows are gone.
+    assert stream._bulk_plan.rows.closed
+
+
+def test_bulk_rows_are_spooled_and_released_per_symbol():
+    spool = RowSpool()
+    spool.add({"symbol": s, "n": n} for s in ("AAPL", "MSFT") for n in range(3))
+    bulk_plan = BulkPlan("bulk", rows=spool, pending=Counter(AAPL=2, MSFT=1))
+
+    assert [r["n"] for r in bulk_plan.take("AAPL")] == [0, 1, 2]
+    assert len(spool) == 6  # AAPL has a partition left
+    assert [r["n"] for r in bulk_plan.take("MSFT")] == [0, 1, 2]
+    assert len(spool) == 3
+    assert len(bulk_plan.take("AAPL")) == 3
+    assert spool.closed
+
+
+def test_failed_download_removes_the_spool(monkeypatch):
+    spools = []
+
+    def spool():
+        spools.append(RowSpool())
+        return spools[-1]
+
+    monkeypatch.setattr("tap_fmp.bulk_planner.RowSpool", spool)
+    response = requests.Response()
+    response.status_code = 500
+    bulk = _FakeBulkStream(
+        error=requests.exceptions.HTTPError("500", response=response)
+    )
+    stream = _StubDcf(["AAPL"], bulk, {"source": "bulk"})
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(stream.get_records({"symbol": "AAPL"}))
+    assert spools and spools[0].closed
+
+
+@pytest.mark.parametrize(
+    "value, prop, expected",
+    [
+        ("42", {"type": ["number", "null"]}, 42),
+        ("4.20", {"type": ["number", "null"]}, 4.2),
+        ("1.5e3", {"type": ["number"]}, 1500.0),
+        ("7.0", {"type": ["integer", "null"]}, 7),
+        ("", {"type": ["number", "null"]}, None),
+        ("true", {"type": ["boolean", "null"]}, True),
+        ("", {"type": ["string", "null"]}, ""),
+        ("2025-01-02", {"type": ["string"], "format": "date"}, "2025-01-02"),
+        (3, {"type": ["number"]}, 3),
+    ],
+)
+def test_coerce_value_matches_json_types(value, prop, expected):
+    result = coerce_value(value, prop)
+    assert result == expected
+    assert type(result) is type(expected)
@@ -0,0 +1,175 @@
+"""Change-data-capture tests.
+
+Skipping a record is only safe if the target already has exactly that
+content: hashes must be committed only after a partition completes, and
+tombstones must only come from complete (FULL_TABLE) snapshots of the same
+partition.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_fmp.change_capture import DELETED_AT_FIELD
+from tap_fmp.client import FmpRestStream
+from tap_fmp.local_store import LocalStore
+from tap_fmp.tap import TapFMP
+
+
+class _FakeTap:
+    def __init__(self, store):
+        self.store = store
+
+    def get_local_store(self):
+        return self.store
+
+
+class _StubSnapshotStream(FmpRestStream):
+    name = "test_snapshot"
+    primary_keys = ["symbol", "name"]
+    replication_method = "FULL_TABLE"
+    schema = {
+        "properties": {"symbol": {}, "name": {}, "pay": {}, "price": {}},
+        "required": ["symbol"],
+    }
+
+    def __init__(self, store, other_params=None):
+        self.other_params = {"change_data_capture": True, **(other_params or {})}
+        self._tap = _FakeTap(store)
+        self._config = {}
+        self.logger = logging.getLogger("tap-fmp.test_snapshot")
+        self.rows: dict[str, list[dict]] = {}
+        self.fail_after: int | None = None
+
+    def _fetch_records(self, context):
+        for i, row in enumerate(self.rows.get(context["symbol"], [])):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise RuntimeError("boom")
+            yield dict(row)
+
+    def sync(self, symbol):
+        return list(self.get_records({"symbol": symbol}))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    yield store
+    store.close()
+
+
+def _exec(name, pay, price=1.0):
+    return {"symbol": "AAPL", "name": name, "pay": pay, "price": price}
+
+
+def test_unchanged_rows_are_not_re_emitted(store):
+    stream = _StubSnapshotStream(store)
+    stream.rows = {"AAPL": [_exec("Tim", 1), _exec("Jeff", 2)]}
+    assert len(stream.sync("AAPL")) == 2
+    assert stream.sync("AAPL") == []
+
+    stream.rows["AAPL"][1] = _exec("Jeff", 3)
+    assert stream.sync("AAPL") == [_exec("Jeff", 3)]
+
+
+def test_ignored_fields_do_not_count_as_changes(store):
+    stream = _StubSnapshotStream(store, {"cdc_ignore_fields": ["price"]})
+    stream.rows = {"AAPL": [_exec("Tim", 1, price=10.0)]}
+    stream.sync("AAPL")
+    stream.rows = {"AAPL": [_exec("Tim", 1, price=11.0)]}
+    assert stream.sync("AAPL") == []
+
+
+def test_tombstones_for_vanished_keys_are_emitted_once(store):
+    stream = _StubSnapshotStream(store, {"cdc_tombstones": True})
+    stream.rows = {"AAPL": [_exec("Tim", 1), _exec("Jeff", 2)]}
+    stream.sync("AAPL")
+
+    stream.rows = {"AAPL": [_exec("Tim", 1)]}
+    records = stream.sync("AAPL")
+    assert len(records) == 1
+    assert records[0]["symbol"] == "AAPL"
+    assert records[0]["name"] == "Jeff"
+    assert records[0][DELETED_AT_FIELD]
+    assert "pay" not in records[0]
+
+    assert stream.sync("AAPL") == []
+
+
+def test_tombstones_are_scoped_to_the_partition(store):
+    stream = _StubSnapshotStream(store, {"cdc_tombstones": True})
+    stream.rows = {"AAPL": [_exec("Tim", 1)], "MSFT": []}
+    stream.sync("AAPL")
+    # A different partition never tombstones AAPL's rows.
+    assert stream.sync("MSFT") == []
+    assert stream.sync("AAPL") == []
+
+
+def test_incremental_streams_never_emit_tombstones(store):
+    stream = _StubSnapshotStream(store, {"cdc_tombstones": True})
+    stream.replication_method = "INCREMENTAL"
+    stream.rows = {"AAPL": [_exec("Tim", 1), _exec("Jeff", 2)]}
+    stream.sync("AAPL")
+    stream.rows = {"AAPL": [_exec("Tim", 1)]}
+    assert stream.sync("AAPL") == []
+
+
+def test_failed_partition_commits_no_hashes(store):
+    stream = _StubSnapshotStream(store)
+    stream.rows = {"AAPL": [_exec("Tim", 1), _exec("Jeff", 2)]}
+    stream.fail_after = 1
+    with pytest.raises(RuntimeError):
+        stream.sync("AAPL")
+
+    stream.fail_after = None
+    # Tim was emitted before the failure but is re-emitted, never skipped.
+    assert len(stream.sync("AAPL")) == 2
+
+
+def test_change_capture_needs_key_fields(store):
+    stream = _StubSnapshotStream(store)
+    stream.primary_keys = []
+    stream.rows = {"AAPL": [_exec("Tim", 1)]}
+    with pytest.raises(ConfigValidationError):
+        stream.sync("AAPL")
+
+
+def test_disabled_change_capture_passes_records_through(store):
+    stream = _StubSnapshotStream(store)
+    stream.other_params = {}
+    stream.rows = {"AAPL": [_exec("Tim", 1)]}
+    assert stream.sync("AAPL") == stream.sync("AAPL") == [_exec("Tim", 1)]
+
+
+class _StubSymbolCache:
+    """Just what `TapFMP._get_cached_data` reads from the tap."""
+
+    def __init__(self):
+        self.logger = logging.getLogger("tap-fmp.test")
+        self._disk_cache = None
+        self._cached_symbols = None
+
+
+def test_symbol_lookups_bypass_change_capture(store):
+    stream = _StubSnapshotStream(store)
+    stream._fetch_records = lambda context: iter([_exec("Tim", 1)])
+
+    def cached_symbols():
+        return TapFMP._get_cached_data(
+            _StubSymbolCache(),
+            {
+                "cache_attr": "_cached_symbols",
+                "lock": threading.Lock(),
+                "stream_getter": lambda: stream,
+                "data_type": "symbols",
+                "sort_key": "symbol",
+            },
+        )
+
+    # Each call is a fresh run against the same store; the universe must
+    # not shrink to the rows that changed since the last one.
+    assert cached_symbols() == cached_symbols() == [_exec("Tim", 1)]
@@ -0,0 +1,109 @@
+"""Mid-partition checkpoints and graceful SIGTERM.
+
+A killed partition must resume after its last completed window, not from
+its last bookmark, and SIGTERM must stop the sync only between windows,
+after state is flushed.
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from tap_fmp.shutdown import ShutdownRequested, sigterm_requests
+
+from tests.test_time_slice_correctness import _StubTimeSliceStream
+
+WINDOWS = [
+    ("2024-01-01", "2024-01-10"),
+    ("2024-01-10", "2024-01-20"),
+    ("2024-01-20", "2024-01-30"),
+]
+
+
+class _FakeTap:
+    def __init__(self):
+        self.shutdown_requested = threading.Event()
+
+    def get_trading_calendar(self, exchanges):
+        return None
+
+    def get_listing_date(self, symbol, probe=False):
+        return None
+
+
+def _stream(state=None):
+    stream = _StubTimeSliceStream()
+    stream.replication_method = "INCREMENTAL"
+    stream._tap = _FakeTap()
+    stream._fake_state = state if state is not None else {}
+    return stream
+
+
+def _run(stream, on_fetch=None):
+    fetched: list[str] = []
+
+    def fetch(url, qp):
+        fetched.append(qp["from"])
+        if on_fetch is not None:
+            on_fetch(qp)
+        return [{"date": qp["from"]}]
+
+    with (
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(stream, "create_time_slice_chunks", return_value=WINDOWS),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+    ):
+        records = list(stream.get_records({"symbol": "AAPL"}))
+    return fetched, records
+
+
+def test_completed_windows_are_checkpointed_then_cleared():
+    stream = _stream()
+    stream.other_params = {"window_checkpoint_seconds": 0}
+    _run(stream)
+    checkpoints = [m.get("window_checkpoint") for m in stream._state_messages]
+    # No checkpoint after the last window: the partition is complete.
+    assert checkpoints == ["2024-01-10", "2024-01-20"]
+    assert "window_checkpoint" not in stream._fake_state
+
+
+def test_checkpoint_flushes_are_rate_limited():
+    stream = _stream()
+    _run(stream)  # three quick windows, well inside the default 60s
+    assert stream._state_messages == []
+
+
+def test_resumed_partition_starts_at_the_checkpoint():
+    stream = _stream(
+        {"replication_key_value": "2020-01-01", "window_checkpoint": "2024-01-20"}
+    )
+    stream.other_params = {"time_slice_days": 30}
+    assert stream.create_time_slice_chunks({"symbol": "AAPL"})[0][0] == "2024-01-20"
+
+    stream.other_params["window_checkpoints"] = False
+    assert stream.create_time_slice_chunks({"symbol": "AAPL"})[0][0] == "2020-01-01"
+
+
+def test_sigterm_finishes_the_in_flight_window_and_flushes_state():
+    stream = _stream()
+
+    def sigterm_during_first_window(qp):
+        stream._tap.shutdown_requested.set()
+
+    with pytest.raises(ShutdownRequested):
+        _run(stream, on_fetch=sigterm_during_first_window)
+    assert stream._fake_state["window_checkpoint"] == "2024-01-10"
+    assert stream._state_messages[-1]["window_checkpoint"] == "2024-01-10"
+
+
+def test_sigterm_handler_sets_the_event_and_is_restored():
+    previous = signal.getsignal(signal.SIGTERM)
+    event = threading.Event()
+    with sigterm_requests(event):
+        signal.raise_signal(signal.SIGTERM)
+        assert event.is_set()
+    assert signal.getsignal(signal.SIGTERM) == previous
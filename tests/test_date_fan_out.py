@@ -0,0 +1,146 @@
+"""Concurrent date fan-out tests for `IncrementalDateStream`.
+
+Dates are fetched in parallel but must be emitted in ascending order, and a
+failed date must end up either emitted (after a retry) or recorded in
+`quarantined_dates` — never silently skipped behind an advancing bookmark.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+
+import pytest
+
+from tap_fmp.client import IncrementalDateStream
+from tap_fmp.concurrency import ordered_map
+
+
+class _StubDateStream(IncrementalDateStream):
+    name = "test_date_stream"
+    schema = {"properties": {"date": {}, "value": {}, "surrogate_key": {}}}
+
+    def __init__(self, date_range, max_workers=4, state=None):
+        self.query_params = {"apikey": "k"}
+        self.other_params = {"date_range": date_range, "max_workers": max_workers}
+        self.logger = logging.getLogger("tap-fmp.test_date_stream")
+        self._state = state if state is not None else {}
+        self.fetched: list[str] = []
+        self._lock = threading.Lock()
+        self.fail_dates: dict[str, int] = {}
+
+    @property
+    def config(self):
+        return {}
+
+    @property
+    def stream_config(self):
+        return {"other_params": self.other_params}
+
+    def get_context_state(self, context):
+        return self._state
+
+    def get_url(self, context=None):
+        return "https://example.invalid/stable/snapshot"
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        day = query_params["date"]
+        assert query_params["apikey"] == "k"
+        with self._lock:
+            self.fetched.append(day)
+            remaining = self.fail_dates.get(day, 0)
+            if remaining:
+                self.fail_dates[day] = remaining - 1
+        # Random latency so completion order differs from submission order.
+        time.sleep(random.uniform(0, 0.01))
+        if remaining:
+            raise RuntimeError(f"boom {day}")
+        return [{"date": day, "value": 1}]
+
+
+def _dates(records):
+    return [r["date"] for r in records]
+
+
+def test_concurrent_dates_emit_in_ascending_order():
+    stream = _StubDateStream(["2024-01-01", "2024-01-20"], max_workers=8)
+    records = list(stream.get_records(None))
+    assert _dates(records) == sorted(_dates(records))
+    assert len(records) == 20
+    assert "quarantined_dates" not in stream._state
+
+
+def test_failed_date_is_retried_after_remaining_dates():
+    stream = _StubDateStream(["2024-01-01", "2024-01-05"])
+    stream.fail_dates = {"2024-01-02": 1}
+    records = list(stream.get_records(None))
+    # Later dates are not blocked; the retried date is emitted at the end.
+    assert _dates(records) == [
+        "2024-01-01",
+        "2024-01-03",
+        "2024-01-04",
+        "2024-01-05",
+        "2024-01-02",
+    ]
+    assert "quarantined_dates" not in stream._state
+
+
+def test_persistently_failing_date_is_quarantined_and_retried_next_run():
+    stream = _StubDateStream(["2024-01-01", "2024-01-05"])
+    stream.fail_dates = {"2024-01-02": 2}
+    records = list(stream.get_records(None))
+    assert "2024-01-02" not in _dates(records)
+    assert stream._state["quarantined_dates"] == ["2024-01-02"]
+
+    # Next run: bookmark is past the failed date, but quarantine pulls it back.
+    next_run = _StubDateStream(["2024-01-01", "2024-01-06"], state=stream._state)
+    next_run._state["replication_key_value"] = "2024-01-05"
+    next_run.replication_method = "INCREMENTAL"
+    records = list(next_run.get_records(None))
+    assert _dates(records) == ["2024-01-02", "2024-01-05", "2024-01-06"]
+    assert "quarantined_dates" not in next_run._state
+
+
+def test_serial_mode_matches_concurrent_semantics():
+    stream = _StubDateStream(["2024-01-01", "2024-01-04"], max_workers=1)
+    stream.fail_dates = {"2024-01-03": 1}
+    records = list(stream.get_records(None))
+    assert _dates(records) == ["2024-01-01", "2024-01-02", "2024-01-04", "2024-01-03"]
+
+
+def test_ordered_map_bounds_work_in_flight():
+    started = []
+    release = threading.Event()
+
+    def work(i):
+        started.append(i)
+        if i:
+            release.wait(1)
+        return i
+
+    results = ordered_map(work, range(100), max_workers=2, max_in_flight=4)
+    first = next(results)
+    assert first.item == 0
+    # 4 initially submitted + 1 refill; nowhere near all 100.
+    assert len(started) <= 5
+    release.set()
+    assert [r.result for r in results] == list(range(1, 100))
+
+
+def test_ordered_map_captures_errors_per_item():
+    def work(i):
+        if i == 2:
+            raise ValueError("bad item")
+        return i * 10
+
+    results = list(ordered_map(work, range(4), max_workers=3))
+    assert [r.item for r in results] == [0, 1, 2, 3]
+    assert isinstance(results[2].error, ValueError)
+    assert [r.result for r in results if r.error is None] == [0, 10, 30]
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_ordered_map_empty_input(max_workers):
+    assert list(ordered_map(lambda x: x, [], max_workers=max_workers)) == []
@@ -0,0 +1,146 @@
+"""Global-feed incremental mode tests.
+
+Once backfilled, per-symbol partitions must be served from one read of the
+global feed, with records identical to a per-symbol fetch; partitions the
+read doesn't cover must still be fetched per symbol.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from tap_fmp.feed_routing import read_feed
+from tap_fmp.streams.senate_streams import (
+    HouseTradesStream,
+    LatestHouseDisclosuresStream,
+)
+
+SYMBOLS = ("AAPL", "MSFT")
+TODAY = datetime.now(timezone.utc).date()
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+def _trade(symbol, day, owner="Self"):
+    return {"symbol": symbol, "disclosure_date": day.isoformat(), "owner": owner}
+
+
+class _FakeFeed:
+    name = "latest_house_disclosures"
+    _max_pages = 100
+    _max_consecutive_empty_pages = 2
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested: list[int] = []
+
+    def get_url(self, context):
+        return "https://example.invalid/stable/house-latest"
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.requested.append(page)
+        return [dict(r) for r in self.pages[page]] if page < len(self.pages) else []
+
+
+class _FakeTap:
+    streams = {}
+
+    def __init__(self, pages):
+        self.feed = _FakeFeed(pages)
+
+    def get_bulk_stream(self, stream_cls):
+        assert stream_cls is LatestHouseDisclosuresStream
+        return self.feed
+
+
+class _StubHouseTrades(HouseTradesStream):
+    def __init__(self, state, pages=(), other_params=None):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = {
+            "source": "per_symbol",
+            "negative_cache": False,
+            "feed_incremental": True,
+            **(other_params or {}),
+        }
+        self.logger = logging.getLogger("tap-fmp.test_house_trades")
+        self._tap = _FakeTap(list(pages))
+        self._tap_state = state
+        self._state_partitioning_keys = None
+        self._config = {}
+        self._replication_key = None
+        self.fetched: list[str] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append(query_params["symbol"])
+        return [_trade(query_params["symbol"], TODAY)]
+
+
+def _run(stream):
+    records = []
+    for symbol in SYMBOLS:
+        records.extend(stream.get_records({"symbol": symbol}))
+    return records
+
+
+def test_backfilled_partitions_are_served_from_the_feed():
+    state: dict = {}
+    cold = _StubHouseTrades(state)
+    backfill = _run(cold)
+    assert cold.fetched == ["AAPL", "MSFT"]
+    assert cold._tap.feed.requested == []
+
+    pages = [
+        [_trade("AAPL", TODAY), _trade("NVDA", TODAY), _trade("AAPL", TODAY, "Spouse")],
+        [_trade("AAPL", YESTERDAY)],
+        [_trade("MSFT", YESTERDAY)],
+    ]
+    warm = _StubHouseTrades(state, pages)
+    records = _run(warm)
+    assert warm.fetched == []
+    assert warm._tap.feed.requested == [0, 1]  # stopped once past the cutoff
+    assert [(r["symbol"], r["owner"]) for r in records] == [
+        ("AAPL", "Self"),
+        ("AAPL", "Spouse"),
+    ]
+    # Identical rows get identical surrogate keys either way.
+    assert records[0]["surrogate_key"] == backfill[0]["surrogate_key"]
+
+
+def test_uncovered_partitions_fall_back_to_per_symbol():
+    state: dict = {}
+    _run(_StubHouseTrades(state))
+    stale = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    state["bookmarks"]["house_trades"]["partitions"][1]["refreshed_at"] = stale
+    # Page cap: only today is fully read, so MSFT (3 days old) is fetched.
+    pages = [
+        [_trade("AAPL", TODAY)],
+        [_trade("AAPL", YESTERDAY)],
+        [_trade("AAPL", YESTERDAY)],
+    ]
+    capped = _StubHouseTrades(state, pages)
+    capped._tap.feed._max_pages = 1
+    _run(capped)
+    assert capped.fetched == ["MSFT"]
+
+    off = _StubHouseTrades(state, other_params={"feed_incremental": False})
+    _run(off)
+    assert off.fetched == ["AAPL", "MSFT"]
+
+
+def test_read_feed_coverage():
+    now = datetime.now(timezone.utc)
+    day = "2026-03-10"
+
+    def pages(rows):
+        return lambda page: rows[page] if page < len(rows) else []
+
+    rows = [[{"symbol": "A", "d": "2026-03-12"}], [{"symbol": "A", "d": "2026-03-09"}]]
+    assert read_feed(pages(rows), "d", day, 100, 2, now).covers_from == day
+    capped = read_feed(pages(rows), "d", day, 0, 2, now)
+    assert capped.covers_from == "2026-03-13"
+    assert not capped.covers("2026-03-12T10:00:00+00:00")
+    ended = read_feed(pages(rows[:1]), "d", day, 100, 2, now)
+    assert ended.covers("2026-03-10T00:00:00+00:00")
+    assert ended.take("A", "2026-03-11T00:00:00") == rows[0]
+    assert ended.take("A", "2026-03-11T00:00:00") == []
@@ -0,0 +1,170 @@
+"""Event-driven invalidation tests.
+
+Under `event_invalidation`, only never-refreshed partitions and symbols with
+a feed event since their last refresh must be refetched; an unreadable feed
+must refetch everything.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+import requests
+
+from tap_fmp.invalidation import EventIndex, InvalidationFeed
+from tap_fmp.streams.calendar_streams import (
+    StockSplitDetailsStream,
+    StockSplitsCalendarStream,
+)
+from tap_fmp.streams.statements_streams import FinancialReportsForm10kJsonStream
+
+SYMBOLS = ("AAPL", "MSFT", "NVDA")
+TODAY = datetime.now(timezone.utc).date()
+
+
+class _FakeFeed:
+    name = "stock_splits_calendar"
+    _default_time_slice_days = 90
+    other_params: dict = {}
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.windows: list[tuple[str, str]] = []
+
+    def get_url(self, context):
+        return "https://example.invalid/stable/splits-calendar"
+
+    def _fetch_window_records(self, url, query_params, from_date, to_date, max_rec):
+        self.windows.append((from_date, to_date))
+        if self.rows is None:
+            raise requests.exceptions.HTTPError("503")
+        return self.rows
+
+
+class _FakeTap:
+    streams = {}
+
+    def __init__(self, rows):
+        self.feed = _FakeFeed(rows)
+
+    def get_bulk_stream(self, stream_cls):
+        assert stream_cls is StockSplitsCalendarStream
+        return self.feed
+
+
+class _StubSplits(StockSplitDetailsStream):
+    def __init__(self, state, rows=(), other_params=None):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = {
+            "source": "per_symbol",
+            "event_invalidation": True,
+            **(other_params or {}),
+        }
+        self.logger = logging.getLogger("tap-fmp.test_stock_split_details")
+        self._tap = _FakeTap(None if rows is None else list(rows))
+        self._tap_state = state
+        self._state_partitioning_keys = None
+        self._config = {}
+        self._replication_key = None
+        self.fetched: list[str] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append(query_params["symbol"])
+        return [{"symbol": query_params["symbol"], "date": "2020-08-31"}]
+
+
+def _run(stream):
+    for symbol in SYMBOLS:
+        list(stream.get_records({"symbol": symbol}))
+    return stream.fetched
+
+
+def test_only_symbols_with_events_are_refetched():
+    state: dict = {}
+    cold = _StubSplits(state)
+    assert _run(cold) == list(SYMBOLS)
+    assert cold._tap.feed.windows == []  # nothing refreshed yet: no feed read
+
+    events = [
+        {"symbol": "AAPL", "date": TODAY.isoformat()},
+        {"symbol": "MSFT", "date": (TODAY + timedelta(days=10)).isoformat()},
+    ]
+    warm = _StubSplits(state, events)
+    assert _run(warm) == ["AAPL"]
+    assert len(warm._tap.feed.windows) == 1
+
+    assert _run(_StubSplits(state, rows=None)) == list(SYMBOLS)
+    off = _StubSplits(state, other_params={"event_invalidation": False})
+    assert _run(off) == list(SYMBOLS)
+
+
+class _FakeStatementFeedsTap:
+    streams = {}
+
+    def __init__(self, rows):
+        self.feed = _FakeFeed(rows)
+
+    def get_bulk_stream(self, stream_cls):
+        return self.feed
+
+
+class _StubForm10k(FinancialReportsForm10kJsonStream):
+    # State is kept per symbol while partitions are symbol × period × year.
+    def __init__(self, state, rows=()):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = {
+            "source": "per_symbol",
+            "event_invalidation": True,
+            "availability_pruning": False,
+        }
+        self.logger = logging.getLogger("tap-fmp.test_form_10k_json")
+        self._tap = _FakeStatementFeedsTap(list(rows))
+        self._tap_state = state
+        self._config = {}
+        self._replication_key = None
+        self.fetched: list[tuple[str, str]] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append((query_params["symbol"], query_params["year"]))
+        return [{"symbol": query_params["symbol"], "revenue": 1}]
+
+
+def _run_10k(stream, years):
+    for symbol in ("AAPL", "MSFT"):
+        for year in years:
+            context = {"symbol": symbol, "period": "FY", "year": year}
+            list(stream.get_records(context))
+    return stream.fetched
+
+
+def test_partitions_sharing_symbol_state_are_invalidated_separately():
+    state: dict = {}
+    assert len(_run_10k(_StubForm10k(state), ["2023"])) == 2
+    # 2024 shares each symbol's state entry but was never refreshed.
+    assert _run_10k(_StubForm10k(state), ["2023", "2024"]) == [
+        ("AAPL", "2024"),
+        ("MSFT", "2024"),
+    ]
+    events = [{"symbol": "AAPL", "date": TODAY.isoformat()}]
+    assert _run_10k(_StubForm10k(state, events), ["2023", "2024"]) == [
+        ("AAPL", "2023"),
+        ("AAPL", "2024"),
+    ]
+
+
+def test_event_index_settles_and_expires():
+    feed = InvalidationFeed(StockSplitsCalendarStream, ("date",), settle_days=2)
+    since, today = date(2026, 1, 1), date(2026, 2, 1)
+    index = EventIndex.from_rows(
+        since,
+        today,
+        [(feed, [{"symbol": "AAPL", "date": "2026-01-20"}, {"symbol": None}])],
+    )
+    assert index.stale_until == {"AAPL": date(2026, 1, 22)}
+    assert not index.is_current("AAPL", "2026-01-22T09:00:00+00:00")
+    assert index.is_current("AAPL", "2026-01-23T09:00:00+00:00")
+    assert index.is_current("MSFT", "2026-01-02T09:00:00+00:00")
+    assert not index.is_current("MSFT", "2025-12-31T09:00:00+00:00")
@@ -0,0 +1,181 @@
+"""Listing-date lower bounds.
+
+A cold backfill must not request years before a symbol was listed, but a
+bound must never cut history that exists: unknown symbols stay unbounded,
+failed probes aren't cached, and learned first-data years only move when
+every earlier year was actually requested and empty.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime
+
+import pytest
+import requests
+
+from tap_fmp.client import IncrementalYearStream, SymbolYearQuarterPartitionStream
+from tap_fmp.listing_dates import ListingDates, get_first_data_year
+from tap_fmp.local_store import LocalStore
+
+from tests.test_time_slice_correctness import _StubTimeSliceStream
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    yield store
+    store.close()
+
+
+class _FakeTap:
+    def __init__(self, store=None, listing_dates=None):
+        self.store = store
+        self.listing_dates = listing_dates or {}
+        self.probes: list[tuple[str, bool]] = []
+
+    def get_local_store(self):
+        return self.store
+
+    def get_listing_date(self, symbol, probe=False):
+        self.probes.append((symbol, probe))
+        return self.listing_dates.get(symbol)
+
+
+def test_variants_then_store_then_probe(store):
+    probed: list[str] = []
+
+    def probe(symbol):
+        probed.append(symbol)
+        return {"NEW": date(2021, 6, 1)}.get(symbol)
+
+    variants = {"AAPL": {"symbol": "AAPL", "ipo_date": "1980-12-12"}}
+    listing = ListingDates(lambda: variants, store, probe)
+
+    assert listing.get("AAPL", probe=True) == date(1980, 12, 12)
+    assert listing.get("NEW") is None  # no probe requested
+    assert listing.get("NEW", probe=True) == date(2021, 6, 1)
+    assert listing.get("GONE", probe=True) is None
+    assert probed == ["NEW", "GONE"]
+
+    # A new run reads both answers (including "unknown") from the store.
+    rerun = ListingDates(lambda: {}, store, probe)
+    assert rerun.get("NEW", probe=True) == date(2021, 6, 1)
+    assert rerun.get("GONE", probe=True) is None
+    assert probed == ["NEW", "GONE"]
+
+
+def test_failed_probe_is_retried_and_missing_variants_are_tolerated(store):
+    calls: list[str] = []
+
+    def probe(symbol):
+        calls.append(symbol)
+        if len(calls) == 1:
+            raise requests.exceptions.HTTPError("503")
+        return date(2021, 6, 1)
+
+    def no_variants():
+        raise RuntimeError("exchange_variants unavailable")
+
+    listing = ListingDates(no_variants, store, probe)
+    assert listing.get("NEW", probe=True) is None
+    assert listing.get("NEW", probe=True) == date(2021, 6, 1)
+
+
+def test_cold_time_slice_partition_starts_at_listing_date():
+    stream = _StubTimeSliceStream()
+    stream._listing_date_bounded = True
+    stream._tap = _FakeTap(listing_dates={"NEW": date(2021, 6, 1)})
+    stream.other_params = {"time_slice_days": 365}
+
+    unknown = stream.create_time_slice_chunks({"symbol": "OLD"})
+    listed = stream.create_time_slice_chunks({"symbol": "NEW"})
+
+    assert unknown[0][0] == "1970-01-01"
+    assert listed[0][0] == "2021-05-02"  # 30-day margin
+    assert ("NEW", True) in stream._tap.probes
+
+    stream.other_params = {"time_slice_days": 365, "listing_date_bounds": False}
+    assert stream.create_time_slice_chunks({"symbol": "NEW"})[0][0] == "1970-01-01"
+
+
+def test_streams_without_equity_listings_are_not_bounded():
+    # COT codes, forex pairs and pre-IPO filings: no clamp and no probe.
+    stream = _StubTimeSliceStream()
+    stream._tap = _FakeTap(listing_dates={"KC": date(2020, 5, 8)})
+    stream.other_params = {"time_slice_days": 365}
+
+    assert stream.create_time_slice_chunks({"symbol": "KC"})[0][0] == "1970-01-01"
+    assert stream._tap.probes == []
+
+    stream.other_params = {"time_slice_days": 365, "listing_date_bounds": True}
+    assert stream.create_time_slice_chunks({"symbol": "KC"})[0][0] == "2020-04-08"
+
+
+class _StubTranscripts(SymbolYearQuarterPartitionStream):
+    name = "test_transcripts"
+
+    def __init__(self, tap):
+        self.query_params = {}
+        self.other_params = {}
+        self._tap = tap
+
+    @property
+    def config(self):
+        return {}
+
+    def _partition_symbols(self):
+        return [{"symbol": "OLD"}, {"symbol": "NEW"}]
+
+
+def test_symbol_year_partitions_skip_years_before_listing():
+    tap = _FakeTap(listing_dates={"NEW": date(2021, 6, 1)})
+    partitions = _StubTranscripts(tap).partitions
+
+    years = {
+        symbol: sorted({p["year"] for p in partitions if p["symbol"] == symbol})
+        for symbol in ("OLD", "NEW")
+    }
+    assert years["OLD"][0] == 1970
+    assert years["NEW"][0] == 2021
+    # Partition enumeration never probes the API.
+    assert all(probe is False for _, probe in tap.probes)
+
+
+class _StubYearStream(IncrementalYearStream):
+    name = "test_years"
+
+    def __init__(self, tap, other_params=None):
+        self.query_params = {}
+        self.other_params = other_params or {}
+        self._tap = tap
+        self.logger = logging.getLogger("tap-fmp.test_years")
+
+    @property
+    def config(self):
+        return {}
+
+    def run(self, first_year_with_data):
+        for partition in self.partitions:
+            self._observe_year(
+                partition["year"], partition["year"] >= first_year_with_data
+            )
+
+
+def test_year_stream_learns_first_year_with_data(store):
+    tap = _FakeTap(store)
+    current_year = datetime.today().year
+
+    _StubYearStream(tap).run(first_year_with_data=2008)
+    assert get_first_data_year(store, "test_years") == 2008
+    assert _StubYearStream(tap).partitions[0] == {"year": 2008}
+
+    # Only a run that requested the earlier years again can move the bound.
+    _StubYearStream(tap).run(first_year_with_data=2005)
+    assert get_first_data_year(store, "test_years") == 2008
+    _StubYearStream(tap, {"years": "*"}).run(first_year_with_data=2005)
+    assert get_first_data_year(store, "test_years") == 2005
+
+    disabled = _StubYearStream(tap, {"listing_date_bounds": False})
+    assert disabled.partitions[0] == {"year": 1970}
+    assert disabled.partitions[-1] == {"year": current_year}
@@ -0,0 +1,93 @@
+"""Negative-result cache tests.
+
+Symbols that came back empty must be skipped until their TTL expires, apart
+from the re-probe sample; a symbol that returns data again must be fetched on
+every run.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from tap_fmp.local_store import LocalStore
+from tap_fmp.negative_cache import NegativeCache
+from tap_fmp.streams.esg_streams import EsgRatingsStream
+
+ROWS = {"AAPL": [{"symbol": "AAPL", "fiscal_year": 2024}]}
+
+
+class _FakeTap:
+    def __init__(self, store):
+        self.store = store
+        self.streams = {}
+
+    def get_local_store(self):
+        return self.store
+
+
+class _StubEsgRatings(EsgRatingsStream):
+    def __init__(self, store, other_params=None, rows=ROWS):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        # Nothing is re-probed at random: the cache alone decides what is
+        # skipped.
+        self.other_params = {
+            "source": "per_symbol",
+            "negative_cache_recheck_rate": 0,
+            **(other_params or {}),
+        }
+        self.logger = logging.getLogger("tap-fmp.test_esg_ratings")
+        self._tap = _FakeTap(store)
+        self._config = {}
+        self._replication_key = None
+        self.rows = rows
+        self.fetched: list[str] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append(query_params["symbol"])
+        return list(self.rows.get(query_params["symbol"], []))
+
+
+def _run(stream, symbols=("AAPL", "EMPTY1", "EMPTY2")):
+    for symbol in symbols:
+        list(stream.get_records({"symbol": symbol}))
+    return stream.fetched
+
+
+def test_empty_symbols_are_skipped_on_later_runs(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    assert _run(_StubEsgRatings(store)) == ["AAPL", "EMPTY1", "EMPTY2"]
+    assert _run(_StubEsgRatings(store)) == ["AAPL"]
+
+    # Off: everything is requested, and nothing is forgotten.
+    assert len(_run(_StubEsgRatings(store, {"negative_cache": False}))) == 3
+    assert _run(_StubEsgRatings(store)) == ["AAPL"]
+
+
+def test_ttl_and_recheck_rate_bring_symbols_back(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    _run(_StubEsgRatings(store))
+    expired = _StubEsgRatings(store, {"negative_cache_ttl_days": 0})
+    assert _run(expired) == ["AAPL", "EMPTY1", "EMPTY2"]
+    always = _StubEsgRatings(store, {"negative_cache_recheck_rate": 1})
+    assert _run(always) == ["AAPL", "EMPTY1", "EMPTY2"]
+
+
+def test_symbol_with_new_data_leaves_the_cache(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    _run(_StubEsgRatings(store))
+    covered = {**ROWS, "EMPTY1": [{"symbol": "EMPTY1", "fiscal_year": 2025}]}
+    _run(_StubEsgRatings(store, {"negative_cache_recheck_rate": 1}, rows=covered))
+    assert _run(_StubEsgRatings(store, rows=covered)) == ["AAPL", "EMPTY1"]
+
+
+def test_recheck_sample_uses_rng(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    NegativeCache(store, "s", timedelta(days=1), 0).record({"symbol": "X"}, True)
+    draws = iter([0.5, 0.01])
+    cache = NegativeCache(store, "s", timedelta(days=1), 0.02, rng=lambda: next(draws))
+    assert len(cache) == 1
+    assert cache.should_skip({"symbol": "X"})
+    assert not cache.should_skip({"symbol": "X"})
+    assert cache.skipped == 1
@@ -0,0 +1,205 @@
+"""Cost-aware partition scheduling tests.
+
+A completed partition's requests, bytes and seconds must be recorded, and the
+next run must start with the priority symbols, then the heaviest partitions.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from tap_fmp.client import SymbolPeriodPartitionStream
+from tap_fmp.local_store import LocalStore
+from tap_fmp.partition_costs import CostMeter, PartitionCosts, top_market_cap_symbols
+from tap_fmp.streams.technical_indicators_streams import SimpleMovingAverageStream
+
+# Rows returned per request: HEAVY's partitions cost the most.
+ROWS = {"AAPL": 2, "MSFT": 1, "HEAVY": 50, "NVDA": 5}
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, rows):
+        self.text = json.dumps(rows)
+        self.content = self.text.encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class _FakeSession:
+    def get(self, url, params=None, timeout=None):
+        # Wide margins: a GC pause on a light request must not outrank HEAVY.
+        time.sleep(ROWS[params["symbol"]] / 250)
+        rows = [
+            {"symbol": params["symbol"], "period": params["period"], "n": n}
+            for n in range(ROWS[params["symbol"]])
+        ]
+        return _FakeResponse(rows)
+
+
+class _FakeTap:
+    def __init__(self, store):
+        self._store = store
+        self.streams = {}
+
+    def get_local_store(self):
+        return self._store
+
+    def get_cached_company_symbols(self):
+        return [{"symbol": s} for s in ROWS]
+
+    def get_top_market_cap_symbols(self, count):
+        return top_market_cap_symbols(
+            [
+                {"symbol": "NVDA", "market_cap": 3e12},
+                {"symbol": "MSFT", "market_cap": 2e12},
+                {"symbol": "AAPL", "market_cap": None},
+            ],
+            count,
+        )
+
+
+class _StubStream(SymbolPeriodPartitionStream):
+    name = "test_cost_stream"
+    schema = {"properties": {"symbol": {}, "period": {}, "n": {}, "surrogate_key": {}}}
+    requests_session = None
+
+    def __init__(self, store, other_params):
+        self.query_params = {"apikey": "k"}
+        self.other_params = {"periods": ["Q1"], "source": "per_symbol", **other_params}
+        self.logger = logging.getLogger("tap-fmp.test_cost_stream")
+        self._tap = _FakeTap(store)
+        self._config = {}
+        self._tap_state = {}
+        self._state_partitioning_keys = None
+        self.requests_session = _FakeSession()
+        self._throttle_lock = threading.Lock()
+        self._min_interval = 0.0
+        self._last_call_ts = 0.0
+
+    @property
+    def config(self):
+        return self._config
+
+    def get_url(self, context=None):
+        return "https://example.invalid/stable/income-statement"
+
+
+def _sync(stream):
+    order = []
+    for context in stream.partitions:
+        order.append(context["symbol"])
+        for _ in stream.get_records(context):
+            pass
+    return order
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_costs_are_recorded_and_heaviest_partitions_run_first(tmp_path, workers):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    params = {"cost_scheduling": True, "partition_workers": workers}
+    assert _sync(_StubStream(store, params)) == list(ROWS)
+
+    costs = PartitionCosts(store, "test_cost_stream")
+    heavy = costs._costs[json.dumps({"period": "Q1", "symbol": "HEAVY"})]
+    light = costs._costs[json.dumps({"period": "Q1", "symbol": "MSFT"})]
+    assert heavy[0] == light[0] == 1  # one request each
+    assert heavy[1] > 10 * light[1]  # bytes
+    assert heavy[3] == 1  # runs
+
+    # Next run: heaviest first.
+    assert _sync(_StubStream(store, params))[0] == "HEAVY"
+
+
+def test_schedule_puts_priority_first_then_longest_with_unknown_as_heaviest(
+    tmp_path,
+):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    costs = PartitionCosts(store, "prices")
+    for symbol, seconds in (("A", 1.0), ("B", 5.0), ("C", 3.0), ("D", 0.5)):
+        meter = CostMeter()
+        meter.add(seconds=seconds, requests=1)
+        costs.record({"symbol": symbol}, meter)
+    costs = PartitionCosts(store, "prices")
+    partitions = [{"symbol": s} for s in ("A", "B", "C", "D", "NEW")]
+    assert [p["symbol"] for p in costs.schedule(partitions)] == [
+        "NEW",
+        "B",
+        "C",
+        "A",
+        "D",
+    ]
+    assert [p["symbol"] for p in costs.schedule(partitions, {"D", "A"})][:2] == [
+        "A",
+        "D",
+    ]
+
+
+def test_costs_are_smoothed_across_runs(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    for seconds in (10.0, 2.0):
+        meter = CostMeter()
+        meter.add(seconds=seconds)
+        PartitionCosts(store, "prices").record({"symbol": "A"}, meter)
+    assert PartitionCosts(store, "prices").seconds({"symbol": "A"}) == 6.0
+
+
+def test_priority_class_from_market_cap_and_config(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    stream = _StubStream(
+        store,
+        {
+            "cost_scheduling": True,
+            "priority_top_market_cap": 1,
+            "priority_symbols": "AAPL",
+        },
+    )
+    assert stream._priority_symbols() == {"NVDA", "AAPL"}
+    assert _sync(stream)[:2] == ["AAPL", "NVDA"]
+
+    # Off by default: symbol order, nothing recorded.
+    fresh = LocalStore(tmp_path / "fresh.sqlite3")
+    assert _sync(_StubStream(fresh, {})) == list(ROWS)
+    assert PartitionCosts(fresh, "test_cost_stream")._costs == {}
+
+
+class _StubIndicator(SimpleMovingAverageStream):
+    def __init__(self, store):
+        self.query_params = {}
+        self.other_params = {"cost_scheduling": True}
+        self._tap = _FakeTap(store)
+        self._config = {
+            self.name: {
+                "other_params": {
+                    "timeframes": ["1day", "1hour"],
+                    "period_lengths": [10],
+                }
+            }
+        }
+
+    @property
+    def config(self):
+        return self._config
+
+
+def test_expanded_indicator_partitions_are_cost_ordered(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    costs = PartitionCosts(store, SimpleMovingAverageStream.name)
+    for context in _StubIndicator(store).partitions:
+        meter = CostMeter()
+        heavy = context["symbol"] == "MSFT" and context["timeframe"] == "1hour"
+        meter.add(seconds=5.0 if heavy else 1.0, requests=1)
+        costs.record(context, meter)
+
+    first = _StubIndicator(store).partitions[0]
+    assert first == {"symbol": "MSFT", "timeframe": "1hour", "periodLength": 10}
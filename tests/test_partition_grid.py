@@ -0,0 +1,88 @@
+"""Lazy partition enumeration tests.
+
+A `PartitionGrid` must behave exactly like the list of dicts it replaces,
+while building a universe-sized grid stays cheap.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from tap_fmp.local_store import LocalStore
+from tap_fmp.partition_costs import CostMeter, PartitionCosts
+from tap_fmp.partition_grid import PartitionGrid
+from tap_fmp.sharding import shard_partitions
+
+SYMBOLS = ["AAPL", "ABNB", "MSFT"]
+YEARS = [2018, 2019, 2020, 2021]
+QUARTERS = [1, 2, 3, 4]
+FLOORS = {"ABNB": 2020}
+
+
+def _as_list():
+    return [
+        {"symbol": s, "year": y, "quarter": q}
+        for s in SYMBOLS
+        for y in YEARS
+        if y >= FLOORS.get(s, 0)
+        for q in QUARTERS
+    ]
+
+
+def _grid():
+    return PartitionGrid(
+        ("symbol", "year", "quarter"), SYMBOLS, (YEARS, QUARTERS), floors=FLOORS
+    )
+
+
+def test_grid_matches_the_equivalent_list():
+    grid, expected = _grid(), _as_list()
+    assert len(grid) == len(expected) == 40
+    assert list(grid) == expected
+    assert [grid[i] for i in range(len(grid))] == expected
+    assert grid[-1] == expected[-1] and grid[5:9] == expected[5:9]
+    for i, partition in enumerate(expected):
+        assert partition in grid
+        assert grid.index(partition) == i
+    assert {"symbol": "ABNB", "year": 2019, "quarter": 1} not in grid
+    assert {"symbol": "AAPL", "year": 2018} not in grid
+    with pytest.raises(ValueError):
+        grid.index({"symbol": "TSLA", "year": 2018, "quarter": 1})
+    with pytest.raises(IndexError):
+        grid[40]
+
+
+def test_universe_sized_grid_is_cheap_and_shards_lazily():
+    symbols = [f"SYM{i}" for i in range(70000)]
+    started = time.monotonic()
+    grid = PartitionGrid(
+        ("symbol", "year", "quarter"),
+        symbols,
+        (list(range(1970, 2027)), QUARTERS),
+        floors={s: 2000 for s in symbols[::2]},
+    )
+    assert time.monotonic() - started < 2
+    assert len(grid) == 35000 * 57 * 4 + 35000 * 27 * 4
+    assert grid[-1] == {"symbol": "SYM69999", "year": 2026, "quarter": 4}
+
+    shards = [shard_partitions(grid, i, 4) for i in range(4)]
+    assert all(isinstance(s, PartitionGrid) for s in shards)
+    assert sum(len(s) for s in shards) == len(grid)
+
+
+def test_cost_schedule_orders_grid_symbols_by_total_cost(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    costs = PartitionCosts(store, "transcripts")
+    for symbol, seconds in (("AAPL", 1.0), ("ABNB", 0.5), ("MSFT", 2.0)):
+        for quarter in QUARTERS:
+            meter = CostMeter()
+            meter.add(seconds=seconds)
+            costs.record({"symbol": symbol, "year": 2021, "quarter": quarter}, meter)
+    costs = PartitionCosts(store, "transcripts")
+    scheduled = costs.schedule(_grid(), priority={"ABNB"})
+    assert isinstance(scheduled, PartitionGrid)
+    assert scheduled.leads == ["ABNB", "MSFT", "AAPL"]
+    assert scheduled[0] == {"symbol": "ABNB", "year": 2020, "quarter": 1}
+    assert len(scheduled) == len(_grid())
@@ -0,0 +1,141 @@
+"""Partition look-ahead tests.
+
+Partitions may run on worker threads, but the SDK must see them in order,
+each partition's `get_records` must see only its own params even when it
+updates `self.query_params` in place, and buffered records must stay
+bounded.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+
+import pytest
+
+from tap_fmp.client import SymbolPeriodPartitionStream
+from tap_fmp.concurrency import prefetch_iterables
+
+PARTITIONS = [
+    {"symbol": symbol, "period": period}
+    for symbol in ("AAPL", "MSFT", "NVDA", "AMZN", "META")
+    for period in ("Q1", "Q2")
+]
+
+
+class _StubPeriodStream(SymbolPeriodPartitionStream):
+    name = "test_period_stream"
+    schema = {"properties": {"symbol": {}, "period": {}, "surrogate_key": {}}}
+
+    def __init__(self, workers=4):
+        self.query_params = {"apikey": "k"}
+        self.other_params = {"partition_workers": workers, "source": "per_symbol"}
+        self._config = {}
+        self._tap_state = {}
+        self._state_partitioning_keys = None
+        self.logger = logging.getLogger("tap-fmp.test_period_stream")
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    @property
+    def partitions(self):
+        return [dict(p) for p in PARTITIONS]
+
+    def get_url(self, context=None):
+        return "https://example.invalid/stable/income-statement"
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(random.uniform(0, 0.01))
+        with self._lock:
+            self.running -= 1
+        return [
+            {"symbol": query_params["symbol"], "period": query_params["period"]}
+        ] * 3
+
+
+def _sync(stream):
+    """Consume partitions in order, the way `Stream._sync_records` does."""
+    out = []
+    for context in stream.partitions:
+        for record in stream.get_records(context):
+            assert record["symbol"] == context["symbol"]
+            assert record["period"] == context["period"]
+            out.append((record["symbol"], record["period"]))
+    return out
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_partitions_emit_in_order_with_their_own_params(workers):
+    stream = _StubPeriodStream(workers)
+    out = _sync(stream)
+    assert out == [(p["symbol"], p["period"]) for p in PARTITIONS for _ in range(3)]
+    if workers > 1:
+        # Worker copies never leak into the shared params.
+        assert stream.query_params == {"apikey": "k"}
+    assert stream.max_running <= workers
+
+
+def test_failing_partition_raises_in_order_and_stops_lookahead():
+    stream = _StubPeriodStream(4)
+    fetch = stream._fetch_with_retry
+
+    def failing(url, query_params, page=None):
+        if query_params["symbol"] == "NVDA":
+            raise RuntimeError("boom")
+        return fetch(url, query_params, page)
+
+    stream._fetch_with_retry = failing
+    emitted = []
+    with pytest.raises(RuntimeError, match="boom"):
+        for context in stream.partitions:
+            emitted.extend(stream.get_records(context))
+    assert {r["symbol"] for r in emitted} == {"AAPL", "MSFT"}
+    assert "_partition_lookahead" not in stream.__dict__
+
+
+def test_partition_state_entries_are_created_on_the_sdk_thread():
+    stream = _StubPeriodStream(4)
+    fetch = stream._fetch_with_retry
+    created_on_workers = []
+
+    def reading_state(url, query_params, page=None):
+        context = {"symbol": query_params["symbol"], "period": query_params["period"]}
+        bookmarks = stream.tap_state.get("bookmarks", {}).get(stream.name, {})
+        if context not in [p["context"] for p in bookmarks.get("partitions", [])]:
+            created_on_workers.append(context)
+        stream.get_context_state(context)
+        return fetch(url, query_params, page)
+
+    stream._fetch_with_retry = reading_state
+    _sync(stream)
+    assert created_on_workers == []
+    partitions = stream.tap_state["bookmarks"][stream.name]["partitions"]
+    assert [p["context"] for p in partitions] == PARTITIONS
+
+
+def test_prefetch_buffers_are_bounded_and_abandoned_items_stop():
+    produced: dict[int, int] = {}
+
+    def values(item):
+        for n in range(100):
+            produced[item] = n + 1
+            yield n
+
+    pairs = prefetch_iterables(values, range(3), max_workers=3, max_buffered=5)
+    item, first = next(pairs)
+    assert item == 0 and next(first) == 0
+    time.sleep(0.3)
+    # Items running ahead block once their buffer is full.
+    assert produced[1] <= 6 and produced[2] <= 6
+    item, _ = next(pairs)  # abandon the rest of item 0
+    assert item == 1
+    stopped_at = produced[0]
+    time.sleep(0.3)
+    assert produced[0] == stopped_at < 100
+    pairs.close()
@@ -0,0 +1,132 @@
+"""Refresh cadence tests.
+
+Partitions refreshed within `refresh_every` must be skipped without a
+request, and the refresh time must survive in (merged) partition state.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_fmp.refresh_cadence import parse_interval
+from tap_fmp.sharding import merge_states
+from tap_fmp.streams.company_streams import CompanyNotesStream
+
+SYMBOLS = ("AAPL", "MSFT")
+
+
+class _FakeTap:
+    streams = {}
+
+
+class _StubNotes(CompanyNotesStream):
+    def __init__(self, state, other_params=None):
+        self.query_params = {"apikey": "k"}
+        self.path_params = {}
+        self.other_params = {
+            "source": "per_symbol",
+            "refresh_every": "30d",
+            **(other_params or {}),
+        }
+        self.logger = logging.getLogger("tap-fmp.test_company_notes")
+        self._tap = _FakeTap()
+        self._tap_state = state
+        self._state_partitioning_keys = None
+        self._config = {}
+        self._replication_key = None
+        self.fetched: list[str] = []
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        self.fetched.append(query_params["symbol"])
+        return [{"cik": "1", "symbol": query_params["symbol"], "title": "note"}]
+
+
+def _run(stream):
+    for symbol in SYMBOLS:
+        list(stream.get_records({"symbol": symbol}))
+    return stream.fetched
+
+
+def _refreshed_at(state, symbol):
+    partitions = state["bookmarks"]["company_notes"]["partitions"]
+    entry = next(p for p in partitions if p["context"] == {"symbol": symbol})
+    return entry.get("refreshed_at")
+
+
+def test_fresh_partitions_are_skipped():
+    state: dict = {}
+    assert _run(_StubNotes(state)) == ["AAPL", "MSFT"]
+    assert _refreshed_at(state, "AAPL")
+    assert _run(_StubNotes(state)) == []
+
+    stale = (datetime.now(timezone.utc) - timedelta(days=31)).isoformat()
+    state["bookmarks"]["company_notes"]["partitions"][0]["refreshed_at"] = stale
+    assert _run(_StubNotes(state)) == ["AAPL"]
+    assert _refreshed_at(state, "AAPL") > stale
+
+
+def test_cadence_is_opt_in_and_can_be_overridden():
+    state: dict = {}
+    _run(_StubNotes(state))
+    off = _StubNotes(state)
+    del off.other_params["refresh_every"]
+    assert _run(off) == ["AAPL", "MSFT"]
+    assert _run(_StubNotes(state, {"refresh_every": None})) == ["AAPL", "MSFT"]
+    assert _run(_StubNotes(state, {"refresh_every": "0d"})) == ["AAPL", "MSFT"]
+    assert _run(_StubNotes(state, {"refresh_every": "1m"})) == []
+
+
+def test_partitions_sharing_a_state_partition_refresh_separately():
+    state: dict = {}
+
+    def run(years):
+        stream = _StubNotes(state)
+        stream._state_partitioning_keys = ["symbol"]
+        for year in years:
+            list(stream.get_records({"symbol": "AAPL", "year": year}))
+        return len(stream.fetched)
+
+    assert run([2023]) == 1
+    # 2024 shares 2023's state partition but was never fetched.
+    assert run([2023, 2024]) == 1
+    assert run([2023, 2024]) == 0
+    (entry,) = state["bookmarks"]["company_notes"]["partitions"]
+    assert entry["context"] == {"symbol": "AAPL"}
+    assert len(entry["partition_refreshed_at"]) == 2
+
+
+def test_merge_keeps_latest_refresh():
+    ctx = {"symbol": "AAPL"}
+    older = {"context": ctx, "refreshed_at": "2026-01-01T00:00:00+00:00"}
+    newer = {"context": ctx, "refreshed_at": "2026-02-01T00:00:00+00:00"}
+    states = [
+        {"bookmarks": {"company_notes": {"partitions": [entry]}}}
+        for entry in (newer, older, {"context": ctx})
+    ]
+    merged = merge_states(states)
+    assert merged["bookmarks"]["company_notes"]["partitions"] == [newer]
+
+    shared = [
+        {"context": ctx, "partition_refreshed_at": {"2023": a, "2024": b}}
+        for a, b in (("2026-01-01", "2026-03-01"), ("2026-02-01", "2026-01-01"))
+    ]
+    merged = merge_states({"bookmarks": {"s": {"partitions": [e]}}} for e in shared)
+    (entry,) = merged["bookmarks"]["s"]["partitions"]
+    assert entry["partition_refreshed_at"] == {
+        "2023": "2026-02-01",
+        "2024": "2026-03-01",
+    }
+
+
+def test_parse_interval():
+    assert parse_interval("30d") == timedelta(days=30)
+    assert parse_interval("12h") == timedelta(hours=12)
+    assert parse_interval("2w") == timedelta(weeks=2)
+    assert parse_interval(1.5) == timedelta(days=1.5)
+    assert parse_interval(None) is None and parse_interval(0) is None
+    with pytest.raises(ConfigValidationError):
+        parse_interval("monthly")
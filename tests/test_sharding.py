@@ -0,0 +1,187 @@
+"""Universe sharding tests.
+
+Shards must cover the universe exactly once, keep every partition of a
+symbol together, stay stable across runs, and merge back into one state.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_fmp.client import CompanySymbolPartitionStream
+from tap_fmp.sharding import main, merge_states, shard_of, shard_partitions
+from tap_fmp.streams.fundraisers_streams import (
+    CrowdfundingByCikStream,
+    EquityOfferingByCikStream,
+    EquityOfferingUpdatesStream,
+)
+
+SYMBOLS = [f"SYM{i}" for i in range(5000)]
+
+
+class _StubSymbolStream(CompanySymbolPartitionStream):
+    name = "test_symbol_stream"
+
+    def __init__(self, config=None, other_params=None):
+        self.query_params = {}
+        self.other_params = other_params or {}
+        self._config = config or {}
+
+    @property
+    def config(self):
+        return self._config
+
+    @property
+    def stream_config(self):
+        return {"other_params": self.other_params}
+
+    def _partition_symbols(self):
+        return [{"symbol": s} for s in SYMBOLS]
+
+
+def test_shards_cover_the_universe_exactly_once():
+    shards = [
+        {
+            p["symbol"]
+            for p in _StubSymbolStream({"shard_index": i, "shard_count": 10}).partitions
+        }
+        for i in range(10)
+    ]
+    assert sum(len(s) for s in shards) == len(SYMBOLS)
+    assert set().union(*shards) == set(SYMBOLS)
+    assert all(350 < len(s) < 650 for s in shards)
+
+
+def test_partitions_of_one_symbol_share_a_shard():
+    partitions = [
+        {"symbol": s, "year": y} for s in SYMBOLS[:50] for y in (2020, 2021, 2022)
+    ]
+    for index in range(4):
+        kept = shard_partitions(partitions, index, 4)
+        for p in kept:
+            assert shard_of(p["symbol"], 4) == index
+        assert len(kept) % 3 == 0
+
+
+def test_shard_assignment_is_stable_and_keyed_by_cik_too():
+    # Pinned: changing the hash would silently reshuffle every node.
+    assert [shard_of(s, 10) for s in ("AAPL", "MSFT", "NVDA", "0000320193")] == [
+        3,
+        8,
+        5,
+        5,
+    ]
+    assert shard_of(" aapl ", 10) == shard_of("AAPL", 10)
+    ciks = [{"cik": f"{i:010d}"} for i in range(100)]
+    assert sum(len(shard_partitions(ciks, i, 3)) for i in range(3)) == 100
+
+
+class _FakeCikTap:
+    def get_cached_ciks(self):
+        return [{"cik": f"{i:010d}"} for i in range(300)]
+
+
+@pytest.mark.parametrize(
+    "stream_cls",
+    [CrowdfundingByCikStream, EquityOfferingUpdatesStream, EquityOfferingByCikStream],
+)
+def test_cik_streams_are_sharded(stream_cls):
+    class _Stub(stream_cls):
+        def __init__(self, config):
+            self.query_params = {}
+            self.other_params = {"use_cached_ciks": True}
+            self._config = config
+            self._tap = _FakeCikTap()
+
+        @property
+        def config(self):
+            return self._config
+
+        @property
+        def stream_config(self):
+            return {"other_params": self.other_params}
+
+    shards = [
+        {p["cik"] for p in _Stub({"shard_index": i, "shard_count": 3}).partitions}
+        for i in range(3)
+    ]
+    assert sum(len(s) for s in shards) == 300
+    assert all(len(s) < 300 for s in shards)
+
+
+def test_unsharded_and_invalid_config():
+    assert len(_StubSymbolStream().partitions) == len(SYMBOLS)
+    one = _StubSymbolStream({"shard_index": 0, "shard_count": 1})
+    assert len(one.partitions) == len(SYMBOLS)
+    with pytest.raises(ConfigValidationError):
+        _StubSymbolStream({"shard_index": 10, "shard_count": 10}).partitions
+    with pytest.raises(ConfigValidationError):
+        _StubSymbolStream({"shard_count": 10}).partitions
+    # Per-stream override.
+    stream = _StubSymbolStream(
+        {"shard_index": 0, "shard_count": 10}, {"shard_count": 1}
+    )
+    assert len(stream.partitions) == len(SYMBOLS)
+
+
+def _state(stream, *partitions, **top):
+    return {"bookmarks": {stream: {**top, "partitions": list(partitions)}}}
+
+
+def test_merge_states_unions_partitions_and_keeps_later_bookmarks():
+    a = _state(
+        "prices",
+        {"context": {"symbol": "AAPL"}, "replication_key_value": "2024-03-01"},
+        {"context": {"symbol": "MSFT"}, "replication_key_value": "2024-03-01"},
+    )
+    b = _state(
+        "prices",
+        {"context": {"symbol": "MSFT"}, "replication_key_value": "2024-03-05"},
+        {"context": {"symbol": "NVDA"}, "replication_key_value": "2024-03-02"},
+    )
+    c = {"singer_state": _state("news", replication_key_value="2024-03-04")}
+    merged = merge_states([a, b, c])["singer_state"]["bookmarks"]
+    assert {
+        p["context"]["symbol"]: p["replication_key_value"]
+        for p in merged["prices"]["partitions"]
+    } == {"AAPL": "2024-03-01", "MSFT": "2024-03-05", "NVDA": "2024-03-02"}
+    assert merged["news"]["replication_key_value"] == "2024-03-04"
+
+
+@pytest.mark.parametrize(
+    "older, newer",
+    [
+        (9, 10),
+        ("9", "10"),
+        ("2024-03-05", "2024-03-05T10:00:00"),
+        ("2024-03-06T01:00:00", "2024-03-05T23:00:00-05:00"),
+    ],
+)
+def test_merge_states_compares_bookmarks_by_value(older, newer):
+    def state(value):
+        return _state("ids", replication_key_value=value)
+
+    for order in ([older, newer], [newer, older]):
+        merged = merge_states([state(v) for v in order])["bookmarks"]["ids"]
+        assert merged["replication_key_value"] == newer
+
+
+def test_merge_cli_writes_merged_state(tmp_path, capsys):
+    paths = []
+    for i, symbol in enumerate(("AAPL", "MSFT")):
+        path = tmp_path / f"shard{i}.json"
+        path.write_text(
+            json.dumps(
+                _state(
+                    "prices",
+                    {"context": {"symbol": symbol}, "replication_key_value": "x"},
+                )
+            )
+        )
+        paths.append(str(path))
+    assert main(["merge", *paths]) == 0
+    merged = json.loads(capsys.readouterr().out)
+    assert len(merged["bookmarks"]["prices"]["partitions"]) == 2
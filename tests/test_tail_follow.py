@@ -0,0 +1,133 @@
+"""Tail-follow tests for intraday streams.
+
+An incremental refresh must not re-emit bars before the bookmark, must
+re-emit the bookmark bar itself (it may have been in progress), and may only
+skip the request when no session overlapped the time since the last fetch.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from tap_fmp.streams.chart_streams import Company1minStream
+
+from tests.test_time_slice_correctness import _StubTimeSliceStream
+from tests.test_trading_calendar import _nyse
+
+
+class _FakeTap:
+    def __init__(self, calendar):
+        self.calendar = calendar
+
+    def get_trading_calendar(self, exchanges):
+        return self.calendar
+
+
+BARS = [
+    {"date": "2024-07-01 15:59:00"},
+    {"date": "2024-07-01 15:58:00"},
+    {"date": "2024-07-01 15:57:00"},
+]
+
+
+def _stream(state, calendar=None):
+    stream = _StubTimeSliceStream()
+    stream.replication_method = "INCREMENTAL"
+    stream.other_params = {"tail_follow": True}
+    stream._fake_state = state
+    if calendar is not None:
+        stream._tap = _FakeTap(calendar)
+        stream.other_params["trading_calendar_exchanges"] = ["NYSE"]
+    return stream
+
+
+def _run(stream, now=None):
+    fetched: list[str] = []
+
+    def fetch(url, qp):
+        fetched.append(qp["from"])
+        return [dict(b) for b in BARS]
+
+    patches = [
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(
+            stream,
+            "create_time_slice_chunks",
+            return_value=[("2024-07-01", "2024-07-02")],
+        ),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        if now is None:
+            records = list(stream.get_records({"symbol": "AAPL"}))
+        else:
+            with patch("tap_fmp.client.datetime") as fake_datetime:
+                fake_datetime.now.return_value = now
+                fake_datetime.fromisoformat = datetime.fromisoformat
+                records = list(stream.get_records({"symbol": "AAPL"}))
+    finally:
+        for p in patches:
+            p.stop()
+    return fetched, records
+
+
+def test_bars_before_the_bookmark_are_not_re_emitted():
+    state = {"replication_key_value": "2024-07-01T15:58:00"}
+    _, records = _run(_stream(state))
+    assert [r["date"] for r in records] == [
+        "2024-07-01 15:59:00",
+        "2024-07-01 15:58:00",
+    ]
+    assert "tail_checked_at" in state
+
+
+def test_cold_partition_and_disabled_tail_emit_everything():
+    assert len(_run(_stream({}))[1]) == 3
+    stream = _stream({"replication_key_value": "2024-07-01 15:58:00"})
+    stream.other_params["tail_follow"] = False
+    assert len(_run(stream)[1]) == 3
+
+
+def test_market_closed_since_last_fetch_costs_no_request():
+    # Last fetch Friday 2024-07-05 17:00 ET; now Saturday noon ET.
+    state = {
+        "replication_key_value": "2024-07-05 15:59:00",
+        "tail_checked_at": "2024-07-05T21:00:00+00:00",
+    }
+    saturday = datetime(2024, 7, 6, 16, 0, tzinfo=timezone.utc)
+    fetched, records = _run(_stream(state, _nyse()), now=saturday)
+    assert fetched == [] and records == []
+    assert state["tail_checked_at"] == "2024-07-05T21:00:00+00:00"
+
+
+def test_fetch_just_after_close_is_repeated_within_grace():
+    # Last fetch at 16:05 ET may have missed bars published after the close.
+    state = {
+        "replication_key_value": "2024-07-05 15:59:00",
+        "tail_checked_at": "2024-07-05T20:05:00+00:00",
+    }
+    saturday = datetime(2024, 7, 6, 16, 0, tzinfo=timezone.utc)
+    fetched, _ = _run(_stream(state, _nyse()), now=saturday)
+    assert fetched == ["2024-07-01"]
+
+
+def test_had_session_spans_overnight_and_holidays():
+    calendar = _nyse()
+    utc = timezone.utc
+    # Thu 2024-03-28 after close → Mon 2024-04-01 pre-open (Good Friday).
+    assert not calendar.had_session(
+        datetime(2024, 3, 28, 21, 0, tzinfo=utc),
+        datetime(2024, 4, 1, 13, 0, tzinfo=utc),
+    )
+    assert calendar.had_session(
+        datetime(2024, 3, 28, 21, 0, tzinfo=utc),
+        datetime(2024, 4, 1, 14, 0, tzinfo=utc),
+    )
+
+
+def test_intraday_streams_tail_follow_by_default():
+    assert Company1minStream._default_tail_follow is True
+    assert _StubTimeSliceStream._default_tail_follow is False
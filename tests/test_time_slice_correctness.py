@@ -18,6 +18,7 @@ If either invariant breaks, time-slice streams will silently lose data.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime
 from unittest.mock import patch
 
@@ -44,6 +45,14 @@ class _StubTimeSliceStream(TimeSliceStream):
         self.logger = logging.getLogger("tap-fmp.test_stream")
         self._fake_stream_config = {"other_params": {"max_records_per_request": 10}}
         self._fake_config: dict = {}
+        self._fake_state: dict = {}
+        self._state_messages: list[dict] = []
+
+    def get_context_state(self, context):
+        return self._fake_state
+
+    def _write_state_message(self):
+        self._state_messages.append(dict(self._fake_state))
 
     @property
     def stream_config(self):
@@ -518,3 +527,154 @@ def test_paginated_window_natural_exhaustion_no_ceiling_alert(caplog):
     assert drift == []
     # Defensive: even outside tolerance, the page-ceiling reason must not fire
     assert not any("hit_page_ceiling" in r.message for r in caplog.records)
+
+
+def _run_concurrent_windows(stream, fetch, yielded):
+    stream.other_params = {"max_workers": 4}
+    windows = [
+        ("2024-01-01", "2024-02-01"),
+        ("2024-02-01", "2024-03-01"),
+        ("2024-03-01", "2024-04-01"),
+        ("2024-04-01", "2024-05-01"),
+    ]
+    with (
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(stream, "create_time_slice_chunks", return_value=windows),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+    ):
+        for record in stream.get_records(context=None):
+            yielded.append(record)
+
+
+def test_concurrent_windows_emit_in_chronological_order():
+    """Look-ahead completes windows out of order; emission must not be."""
+    stream = _make_stream()
+    yielded: list[dict] = []
+
+    def fetch(url, qp):
+        # Earlier windows finish last.
+        time.sleep(0.01 * (5 - int(qp["from"][6])))
+        return [{"date": qp["from"]}]
+
+    _run_concurrent_windows(stream, fetch, yielded)
+
+    assert [r["date"] for r in yielded] == [
+        "2024-01-01",
+        "2024-02-01",
+        "2024-03-01",
+        "2024-04-01",
+    ]
+
+
+def test_concurrent_window_failure_emits_nothing_from_failed_or_later_windows():
+    """Invariant 1 with look-ahead: later windows may already be downloaded
+    when window K fails, but none of their records reach the consumer."""
+    stream = _make_stream()
+    yielded: list[dict] = []
+
+    def fetch(url, qp):
+        if qp["from"] == "2024-02-01":
+            time.sleep(0.02)  # let later windows finish first
+            raise RuntimeError("simulated FMP outage")
+        return [{"date": qp["from"]}]
+
+    with pytest.raises(RuntimeError, match="simulated FMP outage"):
+        _run_concurrent_windows(stream, fetch, yielded)
+
+    assert yielded == [{"date": "2024-01-01"}]
+
+
+def _daily_api(days, max_records, desc=True):
+    """Fake FMP endpoint: one record per day, capped at `max_records` with
+    the newest (or, ASC, the oldest) rows kept."""
+    calls: list[tuple[str, str]] = []
+
+    def fetch(url, qp):
+        calls.append((qp["from"], qp["to"]))
+        rows = [{"date": d} for d in days if qp["from"] <= d <= qp["to"]]
+        rows.sort(key=lambda r: r["date"], reverse=desc)
+        return rows[:max_records]
+
+    return fetch, calls
+
+
+_JANUARY = [f"2024-01-{d:02d}" for d in range(1, 32)]
+
+
+def test_split_keeps_covered_days_and_refetches_only_the_remainder():
+    stream = _make_stream()
+    fetch, calls = _daily_api(_JANUARY, max_records=10)
+
+    with patch.object(stream, "_fetch_with_retry", side_effect=fetch):
+        records = list(
+            stream.fetch_window(
+                "http://example/test", {}, "2024-01-01", "2024-01-31", 10, None
+            )
+        )
+
+    assert sorted(r["date"] for r in records) == _JANUARY
+    assert calls == [
+        ("2024-01-01", "2024-01-31"),
+        ("2024-01-01", "2024-01-22"),
+        ("2024-01-01", "2024-01-13"),
+        ("2024-01-01", "2024-01-04"),
+    ]
+
+
+def test_halving_fallback_drops_midpoint_duplicates():
+    """ASC responses don't tell which days are complete: halve, and emit the
+    shared midpoint day once."""
+    stream = _make_stream()
+    fetch, _ = _daily_api(_JANUARY, max_records=20, desc=False)
+
+    with patch.object(stream, "_fetch_with_retry", side_effect=fetch):
+        records = list(
+            stream.fetch_window(
+                "http://example/test", {}, "2024-01-01", "2024-01-31", 20, None
+            )
+        )
+
+    assert sorted(r["date"] for r in records) == _JANUARY
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_adjacent_windows_do_not_repeat_their_shared_boundary_day(max_workers):
+    stream = _make_stream()
+    stream.other_params = {"max_workers": max_workers}
+    fetch, _ = _daily_api(_JANUARY, max_records=100)
+
+    with (
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(
+            stream,
+            "create_time_slice_chunks",
+            return_value=[
+                ("2024-01-01", "2024-01-10"),
+                ("2024-01-10", "2024-01-20"),
+                ("2024-01-20", "2024-01-31"),
+            ],
+        ),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+    ):
+        records = list(stream.get_records(context=None))
+
+    assert sorted(r["date"] for r in records) == _JANUARY
+
+
+def test_paginated_window_streams_records_before_fetching_next_page():
+    """Time-to-first-record and memory must not scale with the window."""
+    stream = _make_paginated_stream()
+    pages = [[{"date": "2024-03-29", "id": 1}], [{"date": "2024-03-28", "id": 2}]]
+    requested: list[int] = []
+
+    def fetch(url, qp, page=None):
+        requested.append(page)
+        return pages[page] if page < len(pages) else []
+
+    with patch.object(stream, "_fetch_with_retry", side_effect=fetch):
+        records = stream.fetch_window(
+            "http://example/test", {}, "2024-03-25", "2024-04-01", 10, None
+        )
+        assert next(records)["id"] == 1
+        assert requested == [0]
+        assert [r["id"] for r in records] == [2]
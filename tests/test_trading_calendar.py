@@ -0,0 +1,185 @@
+"""Trading-calendar tests.
+
+Skipping a day that actually traded silently drops data, so the calendar
+must only ever close days FMP explicitly marks fully closed (or weekends),
+and unknown/uncovered days must fall back to "trading".
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timezone
+
+from tap_fmp.client import IncrementalDateStream
+from tap_fmp.trading_calendar import TradingCalendar, parse_session_time
+
+from tests.test_time_slice_correctness import _StubTimeSliceStream
+
+NYSE_HOLIDAYS = [
+    # Good Friday — fully closed.
+    {"exchange": "NYSE", "date": "2024-03-29", "is_closed": True},
+    # Day after Thanksgiving — early close, still a trading day.
+    {
+        "exchange": "NYSE",
+        "date": "2024-11-29",
+        "is_closed": True,
+        "adj_close_time": "01:00 PM",
+    },
+    {
+        "exchange": "NYSE",
+        "date": "2024-12-25",
+        "is_closed": True,
+        "is_fully_closed": True,
+    },
+]
+LSE_HOLIDAYS = [
+    {"exchange": "LSE", "date": "2024-03-29", "is_fully_closed": True},
+    {"exchange": "LSE", "date": "2024-05-27", "is_fully_closed": True},
+]
+NYSE_HOURS = [
+    {
+        "exchange": "NYSE",
+        "opening_hour": "09:30 AM -04:00",
+        "closing_hour": "04:00 PM -04:00",
+        "timezone": "America/New_York",
+    }
+]
+COVERAGE = (date(2024, 1, 1), date(2024, 12, 31))
+
+
+def _nyse() -> TradingCalendar:
+    return TradingCalendar.from_records(NYSE_HOLIDAYS, NYSE_HOURS, COVERAGE)
+
+
+def test_weekends_and_full_closures_are_not_trading_days():
+    calendar = _nyse()
+    assert not calendar.is_trading_day(date(2024, 3, 29))
+    assert not calendar.is_trading_day(date(2024, 12, 25))
+    assert not calendar.is_trading_day(date(2024, 3, 30))  # Saturday
+    assert calendar.is_trading_day(date(2024, 3, 28))
+    # Half-day is still a session.
+    assert calendar.is_trading_day(date(2024, 11, 29))
+
+
+def test_days_outside_coverage_fall_back_to_weekday_rule():
+    calendar = _nyse()
+    assert calendar.is_trading_day(date(2023, 12, 25))
+    assert not calendar.is_trading_day(date(2023, 12, 23))  # Saturday
+
+
+def test_union_calendar_is_open_when_any_exchange_trades():
+    calendar = TradingCalendar.merge(
+        [
+            _nyse(),
+            TradingCalendar.from_records(LSE_HOLIDAYS, coverage=COVERAGE),
+        ]
+    )
+    assert not calendar.is_trading_day(date(2024, 3, 29))  # both closed
+    assert calendar.is_trading_day(date(2024, 5, 27))  # Memorial Day: LSE closed
+    assert calendar.is_trading_day(date(2024, 12, 25))  # LSE has no row
+
+
+def test_add_trading_days_skips_weekends_and_holidays():
+    calendar = _nyse()
+    # Thu 2024-03-28 + 2 sessions: Good Friday and the weekend are skipped.
+    assert calendar.add_trading_days(date(2024, 3, 28), 2) == date(2024, 4, 2)
+
+
+def test_round_trips_through_disk_cache_payload():
+    calendar = _nyse()
+    restored = TradingCalendar.from_dict(calendar.to_dict())
+    assert restored.closed_days == calendar.closed_days
+    assert restored.early_closes == calendar.early_closes
+    assert restored.sessions == calendar.sessions
+    assert restored.coverage == calendar.coverage
+
+
+def test_session_bounds_use_exchange_timezone_and_early_close():
+    calendar = _nyse()
+    assert parse_session_time("04:00 PM -04:00").hour == 16
+    assert calendar.is_open(datetime(2024, 7, 1, 14, 0, tzinfo=timezone.utc))
+    # 13:30 UTC in winter is 08:30 ET — pre-open.
+    assert not calendar.is_open(datetime(2024, 1, 2, 13, 30, tzinfo=timezone.utc))
+    # Early close at 13:00 ET on 2024-11-29 (18:00 UTC).
+    assert not calendar.is_open(datetime(2024, 11, 29, 18, 30, tzinfo=timezone.utc))
+    assert calendar.session_bounds("NYSE", date(2024, 12, 25)) is None
+
+
+class _FakeTap:
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.requested = []
+
+    def get_trading_calendar(self, exchanges):
+        self.requested.append(tuple(exchanges))
+        return self.calendar
+
+
+class _StubDateStream(IncrementalDateStream):
+    name = "test_date_stream"
+
+    def __init__(self, other_params, calendar_exchanges=()):
+        self.query_params = {}
+        self.other_params = other_params
+        self._trading_calendar_exchanges = calendar_exchanges
+        self._tap = _FakeTap(_nyse())
+        self.logger = logging.getLogger("tap-fmp.test_date_stream")
+
+
+def test_date_fan_out_skips_closed_days_when_exchanges_configured():
+    other_params = {"date_range": ["2024-03-27", "2024-04-02"]}
+    stream = _StubDateStream(other_params, ("NYSE",))
+    assert [d["date"] for d in stream._get_dates_dict()] == [
+        "2024-03-27",
+        "2024-03-28",
+        "2024-04-01",
+        "2024-04-02",
+    ]
+
+
+def test_date_fan_out_is_calendar_days_without_exchanges():
+    """Global feeds (eod_bulk) span every exchange — skipping US holidays
+    there would drop LSE/TSX rows, so the calendar stays opt-in."""
+    stream = _StubDateStream({"date_range": ["2024-03-27", "2024-04-02"]})
+    assert len(stream._get_dates_dict()) == 7
+    assert stream._tap.requested == []
+
+    stream.other_params["trading_calendar_exchanges"] = ["NYSE"]
+    assert len(stream._get_dates_dict()) == 4
+
+
+def test_time_slices_size_windows_in_sessions():
+    stream = _StubTimeSliceStream()
+    stream._tap = _FakeTap(_nyse())
+    stream.other_params = {
+        "time_slice_days": 2,
+        "trading_calendar_exchanges": ["NYSE"],
+    }
+    stream._fake_stream_config = {
+        "query_params": {"to": "2024-04-03"},
+        "other_params": stream.other_params,
+    }
+    stream._fake_config = {"start_date": "2024-03-27"}
+
+    chunks = stream.create_time_slice_chunks(context=None)
+
+    assert chunks == [
+        ("2024-03-27", "2024-04-01"),
+        ("2024-04-01", "2024-04-03"),
+    ]
+
+
+def test_time_slices_drop_windows_without_sessions():
+    stream = _StubTimeSliceStream()
+    stream._tap = _FakeTap(_nyse())
+    stream.other_params = {
+        "time_slice_days": 1,
+        "trading_calendar_exchanges": ["NYSE"],
+    }
+    stream._fake_stream_config = {
+        "query_params": {"to": "2024-03-31"},
+        "other_params": stream.other_params,
+    }
+    # Starts on closed Good Friday; the remainder of the range is a weekend.
+    stream._fake_config = {"start_date": "2024-03-29"}
+    assert stream.create_time_slice_chunks(context=None) == []
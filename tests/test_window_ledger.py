@@ -0,0 +1,129 @@
+"""Window-completion ledger tests.
+
+A window may only be skipped when it is immutable (ends before the horizon)
+and an earlier run emitted it completely; truncated windows and windows
+inside the horizon are always fetched again.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from tap_fmp.local_store import LocalStore
+from tap_fmp.window_ledger import WindowLedger, merge_ranges
+
+from tests.test_time_slice_correctness import _StubTimeSliceStream
+
+
+class _FakeTap:
+    def __init__(self, store):
+        self.store = store
+
+    def get_local_store(self):
+        return self.store
+
+    def get_trading_calendar(self, exchanges):
+        return None
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(tmp_path / "store.sqlite3")
+    yield store
+    store.close()
+
+
+def _stream(store, **other_params):
+    stream = _StubTimeSliceStream()
+    stream._tap = _FakeTap(store)
+    stream.other_params = {"window_ledger": True, **other_params}
+    return stream
+
+
+def _sync(stream, windows, rows_per_window=2, max_records=100):
+    fetched: list[str] = []
+
+    def fetch(url, qp):
+        fetched.append(qp["from"])
+        return [{"date": qp["from"], "n": i} for i in range(rows_per_window)]
+
+    with (
+        patch.object(stream, "_fetch_with_retry", side_effect=fetch),
+        patch.object(stream, "create_time_slice_chunks", return_value=windows),
+        patch.object(stream, "get_url", return_value="http://example/test"),
+    ):
+        stream.other_params.setdefault("max_records_per_request", max_records)
+        records = list(stream.get_records({"symbol": "AAPL"}))
+    return fetched, records
+
+
+OLD = [("2020-01-01", "2020-04-01"), ("2020-04-01", "2020-07-01")]
+
+
+def _recent():
+    today = date.today()
+    return [((today - timedelta(days=3)).isoformat(), today.isoformat())]
+
+
+def test_immutable_completed_windows_are_skipped(store):
+    fetched, _ = _sync(_stream(store), OLD + _recent())
+    assert len(fetched) == 3
+
+    fetched, records = _sync(_stream(store), OLD + _recent())
+    assert fetched == [_recent()[0][0]]
+    assert len(records) == 2
+
+
+def test_empty_windows_are_recorded_and_skipped(store):
+    _sync(_stream(store), OLD, rows_per_window=0)
+    fetched, _ = _sync(_stream(store), OLD, rows_per_window=0)
+    assert fetched == []
+
+
+def test_coverage_survives_different_window_boundaries(store):
+    _sync(_stream(store), OLD)
+    fetched, _ = _sync(
+        _stream(store), [("2020-02-01", "2020-05-01"), ("2020-05-01", "2020-08-01")]
+    )
+    assert fetched == ["2020-05-01"]
+
+
+def test_force_refetch_and_disabled_ledger_fetch_everything(store):
+    _sync(_stream(store), OLD)
+    assert len(_sync(_stream(store, force_refetch=True), OLD)[0]) == 2
+    stream = _stream(store)
+    stream.other_params["window_ledger"] = False
+    assert len(_sync(stream, OLD)[0]) == 2
+
+
+def test_truncated_windows_are_not_recorded(store):
+    # Every request returns a full response at the 1-day split floor.
+    windows = [("2020-01-01", "2020-01-02")]
+    _sync(_stream(store), windows, rows_per_window=5, max_records=5)
+    fetched, _ = _sync(_stream(store), windows, rows_per_window=5, max_records=5)
+    assert fetched == ["2020-01-01"]
+
+
+def test_ledger_is_scoped_to_the_partition(store):
+    ledger = WindowLedger(store, "s", {"symbol": "AAPL"}, date(2030, 1, 1))
+    ledger.record("2020-01-01", "2020-02-01", 1, "h")
+    assert WindowLedger(store, "s", {"symbol": "AAPL"}, date(2030, 1, 1)).is_complete(
+        "2020-01-05", "2020-01-10"
+    )
+    assert not WindowLedger(
+        store, "s", {"symbol": "MSFT"}, date(2030, 1, 1)
+    ).is_complete("2020-01-05", "2020-01-10")
+
+
+def test_merge_ranges_joins_touching_days():
+    d = date.fromisoformat
+    assert merge_ranges(
+        [
+            (d("2020-01-05"), d("2020-01-09")),
+            (d("2020-01-01"), d("2020-01-04")),
+            (d("2020-01-11"), d("2020-01-12")),
+        ]
+    ) == [(d("2020-01-01"), d("2020-01-09")), (d("2020-01-11"), d("2020-01-12"))]
@@ -0,0 +1,223 @@
+"""Multi-process runner tests.
+
+Every partition must be fetched by exactly one worker, and the merged
+output must be one well-formed Singer stream: each schema once, every
+record, and a final state covering all workers' bookmarks.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+import textwrap
+
+import pytest
+from singer_sdk import Tap
+
+from tap_fmp import tap as tap_module
+from tap_fmp.tap import TapFMP
+from tap_fmp.workers import SingerMerger, WorkQueue, run_workers
+
+from tests.test_partition_workers import PARTITIONS, _StubPeriodStream
+
+
+class _FakeTap:
+    def __init__(self, work_queue):
+        self.work_queue = work_queue
+        self.streams = {}
+
+
+def test_claims_are_exclusive_and_idempotent_for_the_owner(tmp_path):
+    a, b = WorkQueue(str(tmp_path), "0"), WorkQueue(str(tmp_path), "1")
+    assert a.claim("prices", {"symbol": "AAPL"})
+    assert not b.claim("prices", {"symbol": "AAPL"})
+    assert a.claim("prices", {"symbol": "AAPL"})
+    assert b.claim("prices", {"symbol": "MSFT"})
+    assert b.claim("news", {"symbol": "AAPL"})
+    assert a.claim("profiles", None) and not b.claim("profiles", {})
+
+
+def test_workers_split_partitions_between_them(tmp_path):
+    fetched = []
+    streams = []
+    for worker in ("0", "1"):
+        stream = _StubPeriodStream(workers=2)
+        stream._tap = _FakeTap(WorkQueue(str(tmp_path), worker))
+        stream._tap.streams[stream.name] = stream
+        fetch = stream._fetch_with_retry
+
+        def tracking(url, qp, page=None, fetch=fetch, worker=worker):
+            fetched.append((worker, qp["symbol"], qp["period"]))
+            return fetch(url, qp, page)
+
+        stream._fetch_with_retry = tracking
+        streams.append(stream)
+
+    # Interleave the two workers partition by partition.
+    records = []
+    for context in PARTITIONS:
+        for stream in streams:
+            records.extend(stream.get_records(dict(context)))
+    assert sorted((s, p) for _, s, p in fetched) == sorted(
+        (p["symbol"], p["period"]) for p in PARTITIONS
+    )
+    assert len(records) == 3 * len(PARTITIONS)
+
+    # A lookup instance of the same stream (not the one being synced) reads
+    # everything regardless of claims.
+    lookup = _StubPeriodStream(workers=1)
+    lookup._tap = streams[1]._tap
+    assert all(list(lookup.get_records(dict(p))) for p in PARTITIONS)
+
+
+def _line(message):
+    return json.dumps(message, separators=(",", ":")) + "\n"
+
+
+def _state(*partitions):
+    return {"bookmarks": {"prices": {"partitions": list(partitions)}}}
+
+
+def test_merger_dedupes_schemas_and_merges_state():
+    schema = _line({"type": "SCHEMA", "stream": "prices", "schema": {}})
+    merger = SingerMerger(min_interval=0)
+    out = []
+    out += merger.feed(0, schema)
+    out += merger.feed(1, schema)
+    out += merger.feed(0, _line({"type": "RECORD", "stream": "prices"}))
+    out += merger.feed(
+        0,
+        _line(
+            {
+                "type": "STATE",
+                "value": _state(
+                    {"context": {"symbol": "AAPL"}, "replication_key_value": "b"},
+                    {"context": {"symbol": "MSFT"}, "replication_key_value": "a"},
+                ),
+            }
+        ),
+    )
+    out += merger.feed(
+        1,
+        _line(
+            {
+                "type": "STATE",
+                "value": _state(
+                    {"context": {"symbol": "AAPL"}, "replication_key_value": "a"},
+                    {"context": {"symbol": "MSFT"}, "replication_key_value": "c"},
+                ),
+            }
+        ),
+    )
+    messages = [json.loads(line) for line in out]
+    assert [m["type"] for m in messages] == ["SCHEMA", "RECORD", "STATE", "STATE"]
+    partitions = messages[-1]["value"]["bookmarks"]["prices"]["partitions"]
+    assert {p["context"]["symbol"]: p["replication_key_value"] for p in partitions} == {
+        "AAPL": "b",
+        "MSFT": "c",
+    }
+    assert merger.state_lines() == []
+
+
+def test_merger_takes_each_partition_from_its_claimant(tmp_path):
+    queue = WorkQueue(str(tmp_path), "parent")
+    assert WorkQueue(str(tmp_path), "0").claim("prices", {"symbol": "AAPL"})
+    assert WorkQueue(str(tmp_path), "1").claim("prices", {"symbol": "MSFT"})
+    stale = {"replication_key_value": "a"}
+    fresh = {"replication_key_value": "a", "refreshed_at": "2026-01-02"}
+
+    def state(aapl, msft, nvda):
+        return _line(
+            {
+                "type": "STATE",
+                "value": _state(
+                    {"context": {"symbol": "AAPL"}, **aapl},
+                    {"context": {"symbol": "MSFT"}, **msft},
+                    {"context": {"symbol": "NVDA"}, **nvda},
+                ),
+            }
+        )
+
+    merger = SingerMerger(queue, min_interval=0)
+    # Before worker 1 reports, its partition keeps worker 0's copy.
+    (line,) = merger.feed(0, state(fresh, {"replication_key_value": "0"}, stale))
+    partitions = json.loads(line)["value"]["bookmarks"]["prices"]["partitions"]
+    assert partitions[1]["replication_key_value"] == "0"
+
+    # Ties on the bookmark go to the claimant, not to the first worker.
+    (line,) = merger.feed(1, state(stale, fresh, stale))
+    partitions = json.loads(line)["value"]["bookmarks"]["prices"]["partitions"]
+    assert [p.get("refreshed_at") for p in partitions] == [
+        "2026-01-02",
+        "2026-01-02",
+        None,  # unclaimed: every worker's copy is the input state
+    ]
+
+
+def test_merged_state_is_throttled():
+    now = [0.0]
+    merger = SingerMerger(min_interval=5, clock=lambda: now[0])
+    lines = [
+        _line({"type": "STATE", "value": _state({"replication_key_value": v})})
+        for v in "abc"
+    ]
+    assert len(merger.feed(0, lines[0])) == 1
+    now[0] = 3
+    assert merger.feed(0, lines[1]) == []
+    now[0] = 6
+    (line,) = merger.feed(1, lines[2])
+    assert json.loads(line)["value"]["bookmarks"]["prices"]["partitions"] == [
+        {"replication_key_value": "c"}
+    ]
+    assert merger.state_lines() == []
+
+
+_CHILD = textwrap.dedent("""
+    import json, sys
+    from tap_fmp.workers import WorkQueue
+
+    queue = WorkQueue.from_env()
+    print(json.dumps({"type": "SCHEMA", "stream": "prices", "schema": {}}))
+    done = []
+    for symbol in ["S%d" % i for i in range(40)]:
+        if queue.claim("prices", {"symbol": symbol}):
+            print(json.dumps({"type": "RECORD", "stream": "prices",
+                              "record": {"symbol": symbol}}))
+            done.append({"context": {"symbol": symbol},
+                         "replication_key_value": "2024-01-01"})
+            print(json.dumps({"type": "STATE", "value": {
+                "bookmarks": {"prices": {"partitions": done}}}}))
+    """)
+
+
+def test_run_workers_merges_child_output(tmp_path, monkeypatch):
+    monkeypatch.setenv("MELTANO_SHARED_CACHE_DIR", str(tmp_path))
+    out = io.StringIO()
+    code = run_workers([], 3, out=out, command=[sys.executable, "-c", _CHILD])
+    assert code == 0
+    messages = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [m["type"] for m in messages].count("SCHEMA") == 1
+    symbols = [m["record"]["symbol"] for m in messages if m["type"] == "RECORD"]
+    assert sorted(symbols) == sorted(f"S{i}" for i in range(40))
+    assert messages[-1]["type"] == "STATE"
+    final = messages[-1]["value"]["bookmarks"]["prices"]["partitions"]
+    assert len(final) == 40
+    # The run directory is cleaned up.
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "flags", [{"about": True}, {"discover": True}, {"test": "all"}, {"test": "schema"}]
+)
+def test_non_sync_commands_do_not_start_workers(monkeypatch, flags):
+    invoked = []
+    monkeypatch.delenv(tap_module.WORK_QUEUE_ENV, raising=False)
+    monkeypatch.setattr(
+        tap_module, "run_workers", lambda *a: pytest.fail("workers started")
+    )
+    monkeypatch.setattr(
+        Tap, "invoke", classmethod(lambda cls, **kw: invoked.append(kw))
+    )
+    TapFMP.invoke(workers=3, config=(), **flags)
+    assert invoked == [{"config": (), **flags}]
@@ -0,0 +1,117 @@
+"""Per-cell completion state for statement bulk streams.
+
+A (year, period) cell is marked complete only after its records have been
+emitted, so a crashed backfill resumes at cell granularity and FULL_TABLE
+reruns skip historical cells that were already downloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+
+from tap_fmp.streams.bulk_streams import IncomeStatementBulkStream
+
+
+class _StubCellStream(IncomeStatementBulkStream):
+    replication_method = "FULL_TABLE"
+
+    def __init__(self, other_params, state=None):
+        self.query_params = {"apikey": "k"}
+        self.other_params = other_params
+        self.logger = logging.getLogger("tap-fmp.test_cells")
+        self._state = state if state is not None else {}
+        self.fetched: list[str] = []
+        self.fail: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.checkpoints: list[list[str]] = []
+
+    @property
+    def config(self):
+        return {}
+
+    @property
+    def stream_config(self):
+        return {"other_params": self.other_params}
+
+    def get_context_state(self, context):
+        return self._state
+
+    def _checkpoint_state(self):
+        self.checkpoints.append(list(self._state.get("completed_cells", [])))
+
+    def _fetch_with_retry(self, url, query_params, page=None):
+        key = f"{query_params['year']}-{query_params['period']}"
+        with self._lock:
+            self.fetched.append(key)
+            remaining = self.fail.get(key, 0)
+            if remaining:
+                self.fail[key] = remaining - 1
+        if remaining:
+            raise RuntimeError(f"boom {key}")
+        return [{"symbol": "AAPL", "date": f"{query_params['year']}-03-31"}]
+
+
+THIS_YEAR = datetime.today().year
+
+
+def test_cells_emit_in_order_and_checkpoint_after_each():
+    stream = _StubCellStream({"year_range": [2019, 2020], "periods": ["Q1", "FY"]})
+    records = list(stream.get_records(None))
+    assert len(records) == 4
+    assert stream._state["completed_cells"] == [
+        "2019-FY",
+        "2019-Q1",
+        "2020-FY",
+        "2020-Q1",
+    ]
+    assert [len(c) for c in stream.checkpoints] == [1, 2, 3, 4]
+
+
+def test_rerun_skips_completed_historical_cells_but_refetches_recent_years():
+    params = {"year_range": [2019, "current_year"], "periods": ["FY"]}
+    first = _StubCellStream(params)
+    list(first.get_records(None))
+
+    rerun = _StubCellStream(params, state=first._state)
+    list(rerun.get_records(None))
+    assert sorted(rerun.fetched) == [f"{THIS_YEAR - 1}-FY", f"{THIS_YEAR}-FY"]
+
+    forced = _StubCellStream({**params, "force_refetch": True}, state=first._state)
+    list(forced.get_records(None))
+    assert len(forced.fetched) == THIS_YEAR - 2019 + 1
+
+
+def test_crash_resumes_at_cell_granularity():
+    params = {
+        "year_range": [2015, 2016, 2017, 2018],
+        "periods": ["FY"],
+        "max_workers": 1,
+    }
+    stream = _StubCellStream(params)
+    records = stream.get_records(None)
+    next(records)
+    next(records)  # 2016-FY emitted; cell 2015 was checkpointed
+    next(records)
+    records.close()  # crash mid-run
+    assert stream._state["completed_cells"] == ["2015-FY", "2016-FY"]
+
+    resumed = _StubCellStream(params, state=stream._state)
+    list(resumed.get_records(None))
+    assert resumed.fetched == ["2017-FY", "2018-FY"]
+
+
+def test_failed_cell_retried_then_quarantined():
+    params = {"year_range": [2015, 2016, 2017], "periods": ["FY"]}
+    stream = _StubCellStream(params)
+    stream.fail = {"2016-FY": 2}
+    records = list(stream.get_records(None))
+    assert [r["date"][:4] for r in records] == ["2015", "2017"]
+    assert stream._state["quarantined_cells"] == ["2016-FY"]
+    assert "2016-FY" not in stream._state["completed_cells"]
+
+    rerun = _StubCellStream(params, state=stream._state)
+    list(rerun.get_records(None))
+    assert rerun.fetched == ["2016-FY"]
+    assert "quarantined_cells" not in rerun._state